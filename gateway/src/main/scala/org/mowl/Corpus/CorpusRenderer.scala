@@ -0,0 +1,115 @@
+package org.mowl.Corpus
+
+import collection.JavaConverters._
+import java.util.concurrent.{Callable, Executors, Future, ThreadFactory}
+
+import org.mowl.MOWLShortFormProvider
+import org.semanticweb.owlapi.manchestersyntax.renderer.ManchesterOWLSyntaxOWLObjectRendererImpl
+import org.semanticweb.owlapi.model._
+import org.semanticweb.owlapi.search.EntitySearcher
+
+// Renders the sentences of a corpus in batches on a pool of threads. Each batch is returned as a
+// single string with one sentence per line, so that Python reads it with one call.
+class CorpusRenderer(var workers: Int) {
+
+  private val renderers = new ThreadLocal[ManchesterOWLSyntaxOWLObjectRendererImpl] {
+    override def initialValue() = {
+      val renderer = new ManchesterOWLSyntaxOWLObjectRendererImpl()
+      renderer.setShortFormProvider(new MOWLShortFormProvider())
+      renderer
+    }
+  }
+
+  def renderAxioms(ontology: OWLOntology, batchSize: Int): RenderedBatches = {
+    val axioms = ontology.getAxioms().asScala.iterator
+    submit(axioms.grouped(batchSize).map(_.toVector), renderAxiomBatch)
+  }
+
+  // Classes are written with toString (<iri>) if bracketClasses is true and with toStringID
+  // otherwise. Individuals are always written with toStringID.
+  def renderAnnotations(ontology: OWLOntology, batchSize: Int, bracketClasses: Boolean): RenderedBatches = {
+    val classes = ontology.getClassesInSignature().asScala.toVector.map { owlClass =>
+      val name = if (bracketClasses) owlClass.toString else owlClass.toStringID
+      (owlClass.asInstanceOf[OWLEntity], name)
+    }
+    val individuals = ontology.getIndividualsInSignature().asScala.toVector.map { individual =>
+      (individual.asInstanceOf[OWLEntity], individual.toStringID)
+    }
+    val entities = classes ++ individuals
+    submit(entities.grouped(batchSize), renderAnnotationBatch(ontology))
+  }
+
+  private def renderAxiomBatch(axioms: Vector[OWLAxiom]): Vector[String] = {
+    val renderer = renderers.get()
+    axioms.map(axiom => renderer.render(axiom).replaceAll("[\\r\\n|\\r|\\n()|<|>]", ""))
+  }
+
+  private def renderAnnotationBatch(ontology: OWLOntology)(entities: Vector[(OWLEntity, String)]): Vector[String] = {
+    for {
+      (entity, name) <- entities
+      annotation <- EntitySearcher.getAnnotations(entity, ontology).asScala.toVector
+      if annotation.getValue.isInstanceOf[OWLLiteral]
+    } yield {
+      val property = annotation.getProperty.toString.replace("\n", " ")
+      val value = annotation.getValue.asInstanceOf[OWLLiteral].getLiteral.replace("\n", " ")
+      s"$name $property $value"
+    }
+  }
+
+  private def submit[T](batches: Iterator[Vector[T]], render: Vector[T] => Vector[String]): RenderedBatches = {
+    val tasks = batches.map { batch =>
+      new Callable[Vector[String]] {
+        def call() = render(batch)
+      }
+    }
+    new RenderedBatches(tasks, math.max(workers, 1))
+  }
+}
+
+// Batches are rendered concurrently and returned in order, one string per batch. Batches without
+// sentences are skipped. At most 2 * workers batches are rendered or waiting to be read at a time,
+// so that memory does not grow with the corpus when the batches are read slowly. The pool is shut
+// down once every batch has been read or when close is called.
+class RenderedBatches(tasks: Iterator[Callable[Vector[String]]], workers: Int)
+    extends java.util.Iterator[String] with AutoCloseable {
+
+  private val pool = Executors.newFixedThreadPool(workers, new ThreadFactory {
+    def newThread(runnable: Runnable) = {
+      val thread = new Thread(runnable)
+      thread.setDaemon(true)
+      thread
+    }
+  })
+
+  private val pending = new java.util.ArrayDeque[Future[Vector[String]]]()
+
+  private var nextBatch: Vector[String] = null
+
+  fill()
+
+  private def fill(): Unit = {
+    while (pending.size < 2 * workers && tasks.hasNext) pending.add(pool.submit(tasks.next()))
+  }
+
+  def hasNext: Boolean = {
+    while (nextBatch == null && !pending.isEmpty) {
+      val batch = pending.poll().get()
+      fill()
+      if (batch.nonEmpty) nextBatch = batch
+    }
+    if (nextBatch == null) close()
+    nextBatch != null
+  }
+
+  def next(): String = {
+    if (!hasNext) throw new NoSuchElementException()
+    val batch = nextBatch
+    nextBatch = null
+    batch.mkString("\n")
+  }
+
+  def close(): Unit = {
+    pending.clear()
+    pool.shutdownNow()
+  }
+}
@@ -0,0 +1,65 @@
+package org.mowl
+
+import org.semanticweb.owlapi.model._
+
+import java.nio.charset.StandardCharsets
+import java.security.MessageDigest
+import scala.collection.mutable.ArrayBuffer
+import collection.JavaConverters._
+
+// SHA-256 digest of the axioms of an ontology and its imports closure. Axioms are sorted and fed
+// to the digest one at a time as their UTF-8 string followed by a newline. The digests of the
+// last maxSize ontologies are kept and reused while the number of axioms and the sum of their
+// hash codes do not change. Ontologies can be modified through any manager, so changes are not
+// tracked with listeners.
+object OntologyDigest {
+
+  private val maxSize = 16
+
+  private val entries = ArrayBuffer[Entry]()
+
+  def digest(ontology: OWLOntology): String = synchronized {
+    val index = entries.indexWhere(_.ontology eq ontology)
+    val entry = if (index >= 0) entries.remove(index) else new Entry(ontology)
+    entries += entry
+    while (entries.length > maxSize) entries.remove(0)
+    entry.digest
+  }
+
+  def compute(ontology: OWLOntology): String = {
+    val axioms = new java.util.ArrayList[OWLAxiom]()
+    for (imported <- ontology.getImportsClosure.asScala) axioms.addAll(imported.getAxioms())
+    java.util.Collections.sort(axioms)
+
+    val digest = MessageDigest.getInstance("SHA-256")
+    for (axiom <- axioms.asScala) {
+      digest.update(axiom.toString.getBytes(StandardCharsets.UTF_8))
+      digest.update('\n'.toByte)
+    }
+    digest.digest.map("%02x".format(_)).mkString
+  }
+
+  private def stamp(ontology: OWLOntology): (Long, Long) = {
+    var count = 0L
+    var hashes = 0L
+    for (imported <- ontology.getImportsClosure.asScala; axiom <- imported.getAxioms().asScala) {
+      count += 1
+      hashes += axiom.hashCode
+    }
+    (count, hashes)
+  }
+
+  private class Entry(val ontology: OWLOntology) {
+    private var lastStamp: (Long, Long) = null
+    private var value: String = null
+
+    def digest: String = {
+      val current = stamp(ontology)
+      if (current != lastStamp) {
+        value = compute(ontology)
+        lastStamp = current
+      }
+      value
+    }
+  }
+}
@@ -57,6 +57,14 @@ object Types {
         def this(src: OWLClass, rel: Relation, dst: String) = this(goClassToStr(src), removeBrackets(rel), dst)
     }
 
+    // Triples encoded as ids into a table of UTF-8 names, so that they can be read from Python
+    // without one call per edge. The name with id i is names[nameOffsets(i) until nameOffsets(i + 1)].
+    class PackedTriples(val ids: Array[Int], val names: Array[Byte], val nameOffsets: Array[Int])
+
+    // Entities of normalized axioms encoded as ids into a table of UTF-8 names, with one row of
+    // ids per axiom and one column per attribute. Names are read as in PackedTriples.
+    class PackedAxioms(val ids: Array[Int], val names: Array[Byte], val nameOffsets: Array[Int])
+
   def goClassToStr(goClass: OWLClass) = removeBrackets(goClass.toStringID)
 
   def annotationSubject2Str(subject: OWLAnnotationSubject): String = subject.toString
@@ -3,6 +3,11 @@ package org.mowl
 import org.semanticweb.owlapi.model._
 import org.mowl.Types._
 
+import java.io.ByteArrayOutputStream
+import java.nio.charset.StandardCharsets
+import scala.collection.mutable.{ArrayBuffer, HashMap}
+import collection.JavaConverters._
+
 object Utils {
 
   def defineQuantifiedExpression(classExpression: OWLClassExpression): Option[QuantifiedExpression] = {
@@ -28,4 +33,81 @@ object Utils {
       case "ObjectMaxCardinality" => MaxCardinality(classExpression.asInstanceOf[OWLObjectMaxCardinality])
     }
   }
+
+  // Packs the triples into flat arrays. Each distinct name is encoded once.
+  def packTriples(triples: java.util.List[Triple]): PackedTriples = {
+    val table = new NameTable()
+    val ids = new Array[Int](3 * triples.size)
+    var i = 0
+    for (triple <- triples.asScala) {
+      ids(i) = table.idOf(triple.src)
+      ids(i + 1) = table.idOf(triple.rel)
+      ids(i + 2) = table.idOf(triple.dst)
+      i += 3
+    }
+
+    new PackedTriples(ids, table.names, table.offsets)
+  }
+
+  // Packs the entities of normalized axioms into a flat array with one row per axiom. Each
+  // attribute is read as the property of the same name of the GCI classes in
+  // mowl.ontology.normalize.
+  def packAxioms(axioms: java.util.List[OWLAxiom], attributes: Array[String]): PackedAxioms = {
+    val table = new NameTable()
+    val ids = new Array[Int](attributes.length * axioms.size)
+    var i = 0
+    for (axiom <- axioms.asScala; attribute <- attributes) {
+      ids(i) = table.idOf(axiomAttribute(axiom, attribute))
+      i += 1
+    }
+
+    new PackedAxioms(ids, table.names, table.offsets)
+  }
+
+  private def axiomAttribute(axiom: OWLAxiom, attribute: String): String = (axiom, attribute) match {
+    case (gci: OWLSubClassOfAxiom, "subclass") => gci.getSubClass.asOWLClass.toStringID
+    case (gci: OWLSubClassOfAxiom, "superclass") => gci.getSuperClass.asOWLClass.toStringID
+    case (gci: OWLSubClassOfAxiom, "left_subclass") => intersectionOperand(gci, 0)
+    case (gci: OWLSubClassOfAxiom, "right_subclass") => intersectionOperand(gci, 1)
+    case (gci: OWLSubClassOfAxiom, "object_property") =>
+      val property = restriction(gci).getProperty.toString
+      if (property.startsWith("<")) property.substring(1, property.length - 1) else property
+    case (gci: OWLSubClassOfAxiom, "filler") => restriction(gci).getFiller.asOWLClass.toStringID
+    case (assertion: OWLClassAssertionAxiom, "class_") =>
+      assertion.getClassExpression.asOWLClass.toStringID
+    case (assertion: OWLClassAssertionAxiom, "individual") => assertion.getIndividual.toStringID
+    case (assertion: OWLObjectPropertyAssertionAxiom, "subject") =>
+      assertion.getSubject.toStringID
+    case (assertion: OWLObjectPropertyAssertionAxiom, "object_property") =>
+      assertion.getProperty.asOWLObjectProperty.toStringID
+    case (assertion: OWLObjectPropertyAssertionAxiom, "object_") => assertion.getObject.toStringID
+    case _ => throw new IllegalArgumentException(s"Attribute $attribute not found in axiom $axiom")
+  }
+
+  private def intersectionOperand(gci: OWLSubClassOfAxiom, index: Int): String =
+    gci.getSubClass.asInstanceOf[OWLObjectIntersectionOf].getOperandsAsList.get(index).asOWLClass.toStringID
+
+  // Existential restriction of GCIs of the form C subClassOf R some D or R some C subClassOf D
+  private def restriction(gci: OWLSubClassOfAxiom): OWLObjectSomeValuesFrom = gci.getSuperClass match {
+    case superClass: OWLObjectSomeValuesFrom => superClass
+    case _ => gci.getSubClass.asInstanceOf[OWLObjectSomeValuesFrom]
+  }
+
+  // Table of UTF-8 names where each distinct name is written once
+  private class NameTable {
+    private val nameIds = HashMap[String, Int]()
+    private val data = new ByteArrayOutputStream()
+    private val nameOffsets = ArrayBuffer[Int](0)
+
+    def idOf(name: String): Int = nameIds.getOrElseUpdate(name, {
+      val bytes = name.getBytes(StandardCharsets.UTF_8)
+      data.write(bytes, 0, bytes.length)
+      nameOffsets += data.size
+      nameOffsets.length - 2
+    })
+
+    def names: Array[Byte] = data.toByteArray
+
+    def offsets: Array[Int] = nameOffsets.toArray
+  }
 }
@@ -1,7 +1,8 @@
 from mowl.ontology.normalize import ELNormalizer
 from mowl.base_models.model import Model
 from mowl.datasets.el import ELDataset
-from mowl.projection import projector_factory
+from mowl.projection import projector_factory, get_projection_cache
+from mowl.utils.data import FastTensorDataLoader
 import torch as th
 from torch.utils.data import DataLoader, default_collate
 
@@ -33,9 +34,12 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
     :type load_normalized: bool, optional
     :param device: The device to use for training. Defaults to "cpu".
     :type device: str, optional
+    :param cache_dir: Directory where the normalized GCIs of the training, validation and \
+testing ontologies are cached. See :class:`mowl.datasets.el.ELDataset`. Defaults to ``None``.
+    :type cache_dir: str, optional
     """
 
-    def __init__(self, dataset, embed_dim, batch_size, extended=True, model_filepath=None, load_normalized=False, device="cpu"):
+    def __init__(self, dataset, embed_dim, batch_size, extended=True, model_filepath=None, load_normalized=False, device="cpu", cache_dir=None):
         super().__init__(dataset, model_filepath=model_filepath)
 
         if not isinstance(embed_dim, int):
@@ -53,6 +57,9 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         if not isinstance(device, str):
             raise TypeError("Optional parameter device must be of type str.")
 
+        if not isinstance(cache_dir, str) and cache_dir is not None:
+            raise TypeError("Optional parameter cache_dir must be of type str.")
+
         self._datasets_loaded = False
         self._dataloaders_loaded = False
         self._extended = extended
@@ -60,6 +67,7 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         self.batch_size = batch_size
         self.device = device
         self.load_normalized = load_normalized
+        self.cache_dir = cache_dir
         
         self._training_datasets = None
         self._validation_datasets = None
@@ -82,7 +90,8 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
                                         self.object_property_index_dict,
                                         extended=self._extended,
                                         load_normalized = self.load_normalized,
-                                        device=self.device)
+                                        device=self.device,
+                                        cache_dir=self.cache_dir)
 
         self._training_datasets = training_el_dataset.get_gci_datasets()
 
@@ -90,7 +99,8 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         if self.dataset.validation:
             validation_el_dataset = ELDataset(self.dataset.validation, self.class_index_dict,
                                               self.object_property_index_dict,
-                                              extended=self._extended, device=self.device)
+                                              extended=self._extended, device=self.device,
+                                              cache_dir=self.cache_dir)
 
             self._validation_datasets = validation_el_dataset.get_gci_datasets()
 
@@ -98,7 +108,8 @@ merging the 3 extra to their corresponding origin normal forms. Defaults to True
         if self.dataset.testing:
             testing_el_dataset = ELDataset(self.dataset.testing, self.class_index_dict,
                                            self.object_property_index_dict,
-                                           extended=self._extended, device=self.device)
+                                           extended=self._extended, device=self.device,
+                                           cache_dir=self.cache_dir)
 
             self._testing_datasets = testing_el_dataset.get_gci_datasets()
 
@@ -198,6 +209,166 @@ of :class:`torch.utils.data.DataLoader`
         self._load_dataloaders()
         return self._testing_dataloaders
 
+    def training_batches(self, temperature=1.0):
+        """Yields mini-batches of the training GCI datasets for one epoch as pairs \
+``(gci_name, batch)``. Batches of size ``batch_size`` from all non-empty datasets are \
+interleaved. At each step, the dataset is drawn with probability proportional to \
+``len(dataset) ** (1 / temperature)``, so ``temperature=1`` samples proportionally to the \
+dataset sizes and larger temperatures move towards uniform sampling. A dataset that runs out \
+of batches is reshuffled and started again. An epoch has as many steps as there are batches in \
+all the datasets.
+
+        :param temperature: Sampling temperature. Defaults to ``1.0``.
+        :type temperature: float, optional
+        :rtype: generator
+        """
+
+        if temperature <= 0:
+            raise ValueError("Optional parameter temperature must be greater than 0.")
+
+        datasets = {name: ds.data for name, ds in self.training_datasets.items() if len(ds) > 0}
+        if len(datasets) == 0:
+            return
+
+        gci_names = list(datasets.keys())
+        loaders = {name: FastTensorDataLoader(data, batch_size=self.batch_size, shuffle=True)
+                   for name, data in datasets.items()}
+        iterators = {name: iter(loader) for name, loader in loaders.items()}
+
+        sizes = th.tensor([len(datasets[name]) for name in gci_names], dtype=th.double)
+        weights = sizes.pow(1 / temperature)
+        num_steps = sum(len(loader) for loader in loaders.values())
+
+        for choice in th.multinomial(weights, num_steps, replacement=True).tolist():
+            gci_name = gci_names[choice]
+            try:
+                batch, = next(iterators[gci_name])
+            except StopIteration:
+                iterators[gci_name] = iter(loaders[gci_name])
+                batch, = next(iterators[gci_name])
+            yield gci_name, batch.to(self.device)
+
+    def train_minibatch(self, epochs=None, negative_samplers=None, optimizer=None,
+                        temperature=1.0, accumulation_steps=1, validate_every=1):
+        """Trains ``self.module`` with mini-batches interleaved from all the GCI datasets (see \
+:meth:`training_batches`), so memory usage is bounded by ``batch_size`` instead of by the size \
+of the ontology. The loss of each batch is computed by :meth:`minibatch_loss`. If a validation \
+ontology exists, the module with the lowest validation loss is saved at ``model_filepath``.
+
+        :param epochs: Number of epochs. Defaults to ``self.epochs``. Required if the model \
+does not define it.
+        :type epochs: int, optional
+        :param negative_samplers: Dictionary mapping GCI names to \
+:class:`mowl.nn.NegativeSampler` objects used to corrupt their batches. Defaults to ``None``.
+        :type negative_samplers: dict, optional
+        :param optimizer: Optimizer of the module parameters. Defaults to \
+:class:`torch.optim.Adam` with learning rate ``self.learning_rate``. Required if the model does \
+not define ``learning_rate``.
+        :type optimizer: :class:`torch.optim.Optimizer`, optional
+        :param temperature: Sampling temperature of the GCI datasets. Defaults to ``1.0``.
+        :type temperature: float, optional
+        :param accumulation_steps: Number of batches whose gradients are accumulated before each \
+optimization step. Defaults to ``1``.
+        :type accumulation_steps: int, optional
+        :param validate_every: Number of epochs between validations. Defaults to ``1``.
+        :type validate_every: int, optional
+        :return: Training loss of each epoch.
+        :rtype: list
+        """
+
+        if not isinstance(accumulation_steps, int) or accumulation_steps < 1:
+            raise ValueError("Optional parameter accumulation_steps must be a positive integer.")
+
+        if getattr(self, "module", None) is None:
+            raise AttributeError("Attribute module is not set. Models must store their torch "
+                                 "module in self.module to be trained with train_minibatch.")
+        if epochs is None:
+            epochs = getattr(self, "epochs", None)
+            if epochs is None:
+                raise ValueError("Optional parameter epochs is required if the model does not "
+                                 "define the attribute epochs.")
+        if negative_samplers is None:
+            negative_samplers = dict()
+        if optimizer is None:
+            learning_rate = getattr(self, "learning_rate", None)
+            if learning_rate is None:
+                raise ValueError("Optional parameter optimizer is required if the model does not "
+                                 "define the attribute learning_rate.")
+            optimizer = th.optim.Adam(self.module.parameters(), lr=learning_rate)
+
+        best_loss = float("inf")
+        epoch_losses = []
+
+        for epoch in range(epochs):
+            self.module.train()
+            train_loss = 0
+            step = 0
+
+            optimizer.zero_grad()
+            for step, (gci_name, batch) in enumerate(self.training_batches(temperature), 1):
+                neg_batch = None
+                if gci_name in negative_samplers:
+                    neg_batch = negative_samplers[gci_name].sample(batch)
+                loss = self.minibatch_loss(gci_name, batch, neg_batch)
+
+                (loss / accumulation_steps).backward()
+                if step % accumulation_steps == 0:
+                    optimizer.step()
+                    optimizer.zero_grad()
+                train_loss += loss.detach().item()
+
+            if step % accumulation_steps != 0:
+                optimizer.step()
+                optimizer.zero_grad()
+
+            epoch_losses.append(train_loss)
+
+            if (epoch + 1) % validate_every == 0:
+                if self.dataset.validation is not None:
+                    valid_loss = self._validation_loss()
+                    if valid_loss < best_loss:
+                        best_loss = valid_loss
+                        th.save(self.module.state_dict(), self.model_filepath)
+                    print(f'Epoch {epoch+1}: Train loss: {train_loss} Valid loss: {valid_loss}')
+                else:
+                    print(f'Epoch {epoch+1}: Train loss: {train_loss}')
+
+        return epoch_losses
+
+    def minibatch_loss(self, gci_name, batch, neg_batch=None):
+        """Returns the loss of a mini-batch in :meth:`train_minibatch`: the mean of the module \
+loss, plus the mean of the negative loss if ``neg_batch`` is given, plus the regularization \
+loss of the module if it defines one. Subclasses can override this method to train with a \
+different loss.
+
+        :param gci_name: Name of the GCI of the batch.
+        :type gci_name: str
+        :param batch: Batch of GCIs.
+        :type batch: :class:`torch.Tensor`
+        :param neg_batch: Negative samples of the batch. Defaults to ``None``.
+        :type neg_batch: :class:`torch.Tensor`, optional
+        :rtype: :class:`torch.Tensor`
+        """
+        loss = th.mean(self.module(batch, gci_name))
+        if neg_batch is not None:
+            loss += th.mean(self.module(neg_batch, gci_name, neg=True))
+        if hasattr(self.module, "regularization_loss"):
+            loss += self.module.regularization_loss()
+        return loss
+
+    def _validation_loss(self):
+        self.module.eval()
+        valid_loss = 0
+        with th.no_grad():
+            for gci_name, gci_dataset in self.validation_datasets.items():
+                if len(gci_dataset) == 0:
+                    continue
+                loader = FastTensorDataLoader(gci_dataset.data, batch_size=self.batch_size)
+                gci_loss = sum(self.module(batch.to(self.device), gci_name).sum().item()
+                               for batch, in loader)
+                valid_loss += gci_loss / len(gci_dataset)
+        return valid_loss
+
     @versionadded(version="0.2.0")
     def score(self, axiom):
         """
@@ -415,8 +586,9 @@ of :class:`torch.utils.data.DataLoader`
         eval_projector = projector_factory('taxonomy_rels', taxonomy=False,
                                            relations=[eval_property])
 
-        self._training_set = eval_projector.project(self.dataset.ontology)
-        self._testing_set = eval_projector.project(self.dataset.testing)
+        projection_cache = get_projection_cache()
+        self._training_set = projection_cache.project(eval_projector, self.dataset.ontology)
+        self._testing_set = projection_cache.project(eval_projector, self.dataset.testing)
 
         self._loaded_eval = True
 
@@ -1,6 +1,6 @@
 from mowl.base_models.model import Model
 from mowl.projection.base import ProjectionModel
-from mowl.projection import Edge
+from mowl.projection import Edge, get_projection_cache
 from mowl.walking import WalkingModel
 import mowl.error.messages as msg
 import logging
@@ -32,7 +32,7 @@ class GraphModel(Model):
 
         all_classes = set(self.dataset.classes.as_str)
 
-        self._edges = self.projector.project(self.dataset.ontology)
+        self._edges = get_projection_cache().project(self.projector, self.dataset.ontology)
         nodes, relations = Edge.get_entities_and_relations(self._edges)
         nodes = set(nodes)
 
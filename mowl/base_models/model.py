@@ -80,8 +80,7 @@ class Model():
 
         :rtype: dict
         """
-        class_to_id = {v: k for k, v in enumerate(self.dataset.classes.as_str)}
-        return class_to_id
+        return self.dataset.classes.as_str_index_dict
 
     @property
     def individual_index_dict(self):
@@ -89,8 +88,7 @@ class Model():
 
         :rtype: dict
         """
-        individual_to_id = {v: k for k, v in enumerate(self.dataset.individuals.as_str)}
-        return individual_to_id
+        return self.dataset.individuals.as_str_index_dict
                             
     @property
     def object_property_index_dict(self):
@@ -98,8 +96,7 @@ class Model():
 
         :rtype: dict
         """
-        object_property_to_id = {v: k for k, v in enumerate(self.dataset.object_properties.as_str)}
-        return object_property_to_id
+        return self.dataset.object_properties.as_str_index_dict
 
     @versionadded(version="0.2.0")
     @property
@@ -28,6 +28,7 @@ class SyntacticModel(Model):
         self._corpus_filepath = corpus_filepath
         self._corpus = None
         self._save_corpus = True
+        self._corpus_workers = 1
         self._with_annotations = False
 
     @property
@@ -54,26 +55,29 @@ class SyntacticModel(Model):
     
         return self._corpus
 
-    def generate_corpus(self, save = True, with_annotations=False):
+    def generate_corpus(self, save = True, with_annotations=False, workers=1):
         """Generates the corpus of the training ontology. It uses the Manchester OWL Syntax.
         
         :param save: if True, the corpus is saved into the model filepath, otherwise, the corpus is returned as a list of sentences. Default is True.
         :type save: bool, optional
         :param with_annotations: if True, the corpus is generated with the annotations, otherwise, the corpus is generated only with the axioms. Default is False.
         :type with_annotations: bool, optional
+        :param workers: Number of JVM threads rendering the corpus. Default is 1.
+        :type workers: int, optional
         """
+        self._corpus_workers = workers
         if save:
             extract_and_save_axiom_corpus(self.dataset.ontology,
                                                self.corpus_filepath,
-                                               mode="w")
+                                               mode="w", workers=workers)
             if with_annotations:
                 extract_and_save_annotation_corpus(self.dataset.ontology,
                                                    self.corpus_filepath,
-                                                   mode="a")
+                                                   mode="a", workers=workers)
         else:
-            corpus = extract_axiom_corpus(self.dataset.ontology)
+            corpus = extract_axiom_corpus(self.dataset.ontology, workers=workers)
             if with_annotations:
-                corpus += extract_annotation_corpus(self.dataset.ontology)
+                corpus += extract_annotation_corpus(self.dataset.ontology, workers=workers)
 
         if not save:
             return corpus
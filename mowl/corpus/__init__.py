@@ -1,2 +1,3 @@
 from .base import extract_and_save_annotation_corpus, extract_and_save_axiom_corpus, \
-    extract_annotation_corpus, extract_axiom_corpus
+    extract_annotation_corpus, extract_axiom_corpus, iter_annotation_corpus, iter_axiom_corpus, \
+    tokenize_corpus
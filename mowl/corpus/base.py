@@ -5,13 +5,191 @@ from org.semanticweb.owlapi.model import OWLLiteral, OWLOntology
 from org.semanticweb.owlapi.search import EntitySearcher
 from deprecated.sphinx import deprecated
 
-from jpype.types import JString
-
 from org.mowl import MOWLShortFormProvider
+from mowl.walking import WalkCorpus
 import logging
 
+# Characters removed from rendered axioms
+_REMOVED_CHARACTERS = str.maketrans("", "", "\r\n|()<>")
+
+# Size of the buffer used to write corpus files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _check_corpus_parameters(batch_size, workers, deduplicate):
+    if not isinstance(batch_size, int):
+        raise TypeError("Optional parameter batch_size must be of type int")
+    if not isinstance(workers, int):
+        raise TypeError("Optional parameter workers must be of type int")
+    if not isinstance(deduplicate, bool):
+        raise TypeError("Optional parameter deduplicate must be of type bool")
+    if batch_size < 1:
+        raise ValueError("Optional parameter batch_size must be positive")
+    if workers < 1:
+        raise ValueError("Optional parameter workers must be positive")
+
+
+def _corpus_renderer(workers):
+    try:
+        from org.mowl.Corpus import CorpusRenderer
+    except ImportError:
+        logging.warning("org.mowl.Corpus.CorpusRenderer is not available. Sentences will be "
+                        "rendered from Python on a single thread. Rebuild the mOWL jars to "
+                        "render them on the JVM.")
+        return None
+    return CorpusRenderer(workers)
+
+
+def _split_batches(batches):
+    # Closing the batches when the generator is closed or collected stops the rendering threads
+    try:
+        while batches.hasNext():
+            yield str(batches.next()).split("\n")
+    finally:
+        batches.close()
+
+
+def _axiom_batches(ontology, batch_size, workers):
+    renderer = _corpus_renderer(workers)
+    if renderer is not None:
+        yield from _split_batches(renderer.renderAxioms(ontology, batch_size))
+        return
+
+    renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
+    renderer.setShortFormProvider(MOWLShortFormProvider())
+    batch = []
+    for axiom in ontology.getAxioms():
+        batch.append(str(renderer.render(axiom)).translate(_REMOVED_CHARACTERS))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _annotation_batches(ontology, batch_size, workers, bracket_classes):
+    renderer = _corpus_renderer(workers)
+    if renderer is not None:
+        yield from _split_batches(renderer.renderAnnotations(ontology, batch_size,
+                                                             bracket_classes))
+        return
+
+    entities = []
+    for owl_class in ontology.getClassesInSignature():
+        name = str(owl_class) if bracket_classes else str(owl_class.toStringID())
+        entities.append((owl_class, name))
+    for owl_individual in ontology.getIndividualsInSignature():
+        entities.append((owl_individual, str(owl_individual.toStringID())))
+
+    batch = []
+    for entity, name in entities:
+        annotations = EntitySearcher.getAnnotations(entity, ontology)
+        for annotation in annotations:
+            if isinstance(annotation.getValue(), OWLLiteral):
+                obj_property = str(annotation.getProperty()).replace("\n", " ")
+                # could filter on property
+                value = str(annotation.getValue().getLiteral()).replace("\n", " ")
+                batch.append(f'{name} {obj_property} {value}')
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _deduplicate_batches(batches):
+    seen = set()
+    for batch in batches:
+        unique = []
+        for sentence in batch:
+            if sentence not in seen:
+                seen.add(sentence)
+                unique.append(sentence)
+        if unique:
+            yield unique
+
+
+def _write_batches(batches, out_file, mode):
+    with open(out_file, mode, buffering=_WRITE_BUFFER_SIZE) as f:
+        for batch in batches:
+            f.write("\n".join(batch))
+            f.write("\n")
+
+
+def iter_axiom_corpus(ontology, batch_size=10000, workers=1, deduplicate=False):
+    """Generator of the axioms of an ontology rendered in Manchester Syntax, one sentence per \
+axiom. Axioms are rendered in batches of ``batch_size`` by ``workers`` threads on the JVM, and \
+each batch is transferred to Python in a single call.
+
+    :param ontology: Input ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :param batch_size: Number of axioms rendered per batch. Defaults to ``10000``.
+    :type batch_size: int, optional
+    :param workers: Number of JVM threads rendering batches. Defaults to ``1``.
+    :type workers: int, optional
+    :param deduplicate: If ``True``, repeated sentences are returned only once. Defaults to \
+``False``.
+    :type deduplicate: bool, optional
+    :rtype: generator of str
+    """
+
+    if not isinstance(ontology, OWLOntology):
+        raise TypeError(
+            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+    _check_corpus_parameters(batch_size, workers, deduplicate)
+
+    batches = _axiom_batches(ontology, batch_size, workers)
+    if deduplicate:
+        batches = _deduplicate_batches(batches)
+    return (sentence for batch in batches for sentence in batch)
+
+
+def iter_annotation_corpus(ontology, batch_size=10000, workers=1, deduplicate=False):
+    """Generator of the literal annotations of the classes and individuals of an ontology, one \
+sentence ``entity property value`` per annotation. Annotations are collected on the JVM in \
+batches of ``batch_size`` entities by ``workers`` threads.
+
+    :param ontology: Input ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :param batch_size: Number of entities processed per batch. Defaults to ``10000``.
+    :type batch_size: int, optional
+    :param workers: Number of JVM threads processing batches. Defaults to ``1``.
+    :type workers: int, optional
+    :param deduplicate: If ``True``, repeated sentences are returned only once. Defaults to \
+``False``.
+    :type deduplicate: bool, optional
+    :rtype: generator of str
+    """
+
+    if not isinstance(ontology, OWLOntology):
+        raise TypeError(
+            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
+    _check_corpus_parameters(batch_size, workers, deduplicate)
+
+    batches = _annotation_batches(ontology, batch_size, workers, False)
+    if deduplicate:
+        batches = _deduplicate_batches(batches)
+    return (sentence for batch in batches for sentence in batch)
+
+
+def tokenize_corpus(sentences):
+    """Splits sentences on whitespace and encodes them as integer ids over a shared \
+vocabulary. The result can be passed directly to :class:`gensim.models.word2vec.Word2Vec` and \
+iterated once per epoch without reading or splitting text again.
+
+    :param sentences: Iterable of sentences, such as the ones returned by \
+:func:`iter_axiom_corpus` or :func:`iter_annotation_corpus`.
+    :type sentences: iterable of str
+    :rtype: :class:`mowl.walking.WalkCorpus`
+    """
+
+    corpus = WalkCorpus()
+    corpus.add_sentences(sentence.split() for sentence in sentences)
+    return corpus
 
-def extract_and_save_axiom_corpus(ontology, out_file, mode="w"):
+
+def extract_and_save_axiom_corpus(ontology, out_file, mode="w", batch_size=10000, workers=1,
+                                  deduplicate=False):
     """Method to extract axioms of a particular ontology and save it into a file.
 
     :param ontology: Input ontology.
@@ -20,6 +198,13 @@ def extract_and_save_axiom_corpus(ontology, out_file, mode="w"):
     :type out_file: str
     :param mode: mode for opening the `out_file`, defaults to `"w"`
     :type mode: str, optional
+    :param batch_size: Number of axioms rendered per batch. Defaults to ``10000``.
+    :type batch_size: int, optional
+    :param workers: Number of JVM threads rendering batches. Defaults to ``1``.
+    :type workers: int, optional
+    :param deduplicate: If ``True``, repeated axioms are written only once. Defaults to \
+``False``.
+    :type deduplicate: bool, optional
     """
 
     if not isinstance(ontology, OWLOntology):
@@ -33,47 +218,32 @@ def extract_and_save_axiom_corpus(ontology, out_file, mode="w"):
     if mode not in ["w", "a"]:
         raise ValueError("Parameter mode must be a file reading mode. Options are 'a' or 'w'")
 
+    _check_corpus_parameters(batch_size, workers, deduplicate)
+
     logging.info("Generating axioms corpus")
-    renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
-    shortFormProvider = MOWLShortFormProvider()
-    renderer.setShortFormProvider(shortFormProvider)
-    with open(out_file, mode) as f:
-        axioms = ontology.getAxioms()
-        for axiom in axioms:
-            rax = renderer.render(axiom)
-            rax = rax.replaceAll(JString("[\\r\\n|\\r|\\n()|<|>]"), JString(""))
-            f.write(f'{rax}\n')
+    batches = _axiom_batches(ontology, batch_size, workers)
+    if deduplicate:
+        batches = _deduplicate_batches(batches)
+    _write_batches(batches, out_file, mode)
 
 
-def extract_axiom_corpus(ontology):
+def extract_axiom_corpus(ontology, batch_size=10000, workers=1, deduplicate=False):
     """Method to extract axioms of a particular ontology. Similar to \
-:func:`extract_and_save_axiom_corpus` but this method returns a list instead saving into a file.
+:func:`extract_and_save_axiom_corpus` but this method returns a list instead saving into a file. \
+The parameters are the same as in :func:`iter_axiom_corpus`.
 
     :param ontology: Input ontology.
     :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
     :rtype: list[str]
     """
 
-    if not isinstance(ontology, OWLOntology):
-        raise TypeError(
-            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
-
     logging.info("Generating axioms corpus")
-    renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
-    shortFormProvider = MOWLShortFormProvider()
-    renderer.setShortFormProvider(shortFormProvider)
+    return list(iter_axiom_corpus(ontology, batch_size=batch_size, workers=workers,
+                                  deduplicate=deduplicate))
 
-    corpus = []
 
-    axioms = ontology.getAxioms()
-    for axiom in axioms:
-        rax = renderer.render(axiom)
-        rax = rax.replaceAll(JString("[\\r\\n|\\r|\\n()|<|>]"), JString(""))
-        corpus.append(rax)
-    return corpus
-
-
-def extract_and_save_annotation_corpus(ontology, out_file, mode="w"):
+def extract_and_save_annotation_corpus(ontology, out_file, mode="w", batch_size=10000, workers=1,
+                                       deduplicate=False):
     """This method generates a textual representation of the annotation axioms in an ontology \
 following the Manchester Syntax.
 
@@ -83,6 +253,13 @@ following the Manchester Syntax.
     :type out_file: str
     :param mode: mode for opening the `out_file`, defaults to `"w"`
     :type mode: str ,optional
+    :param batch_size: Number of entities processed per batch. Defaults to ``10000``.
+    :type batch_size: int, optional
+    :param workers: Number of JVM threads processing batches. Defaults to ``1``.
+    :type workers: int, optional
+    :param deduplicate: If ``True``, repeated sentences are written only once. Defaults to \
+``False``.
+    :type deduplicate: bool, optional
     """
 
     if not isinstance(ontology, OWLOntology):
@@ -96,74 +273,28 @@ following the Manchester Syntax.
     if mode not in ["w", "a"]:
         raise ValueError("Parameter mode must be a file reading mode. Options are 'a' or 'w'")
 
+    _check_corpus_parameters(batch_size, workers, deduplicate)
+
     logging.info("Generating annotation corpus")
-    with open(out_file, mode) as f:
-        for owl_class in ontology.getClassesInSignature():
-            cls = str(owl_class)
-
-            annotations = EntitySearcher.getAnnotations(owl_class, ontology)
-            for annotation in annotations:
-                if isinstance(annotation.getValue(), OWLLiteral):
-                    obj_property = str(annotation.getProperty()).replace("\n", " ")
-                    # could filter on property
-                    value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                    f.write(f'{cls} {obj_property} {value}\n')
-
-        for owl_individual in ontology.getIndividualsInSignature():
-            ind = str(owl_individual.toStringID())
-
-            annotations = EntitySearcher.getAnnotations(owl_individual, ontology)
-            for annotation in annotations:
-                if isinstance(annotation.getValue(), OWLLiteral):
-                    obj_property = str(annotation.getProperty()).replace("\n", " ")
-                    # could filter on property
-                    value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                    f.write(f'{ind} {obj_property} {value}\n')
-
-
-def extract_annotation_corpus(ontology):
+    # Classes are written as <iri> in the saved corpus
+    batches = _annotation_batches(ontology, batch_size, workers, True)
+    if deduplicate:
+        batches = _deduplicate_batches(batches)
+    _write_batches(batches, out_file, mode)
+
+
+def extract_annotation_corpus(ontology, batch_size=10000, workers=1, deduplicate=False):
     """This method generates a textual representation of the annotation axioms in an ontology \
 following the Manchester Syntax. Similar to :func:`extract_and_save_annotation_corpus` but \
-this method returns a list instead saving into a file.
+this method returns a list instead saving into a file. The parameters are the same as in \
+:func:`iter_annotation_corpus`.
 
     :param ontology: Input ontology
     :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
     :rtype: list[str]
     """
 
-    if not isinstance(ontology, OWLOntology):
-        raise TypeError(
-            "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
-
     logging.info("Generating annotation corpus")
-
-    corpus = []
-    for owl_class in ontology.getClassesInSignature():
-        cls = str(owl_class.toStringID())
-
-        annotations = EntitySearcher.getAnnotations(owl_class, ontology)
-        for annotation in annotations:
-            if isinstance(annotation.getValue(), OWLLiteral):
-                obj_property = str(annotation.getProperty()).replace("\n", " ")
-                # could filter on property
-                value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                corpus.append(f'{cls} {obj_property} {value}\n')
-
-
-    for owl_individual in ontology.getIndividualsInSignature():
-        ind = str(owl_individual.toStringID())
-
-        annotations = EntitySearcher.getAnnotations(owl_individual, ontology)
-        for annotation in annotations:
-            if isinstance(annotation.getValue(), OWLLiteral):
-                obj_property = str(annotation.getProperty()).replace("\n", " ")
-                # could filter on property
-                value = str(annotation.getValue().getLiteral()).replace("\n", " ")
-                corpus.append(f'{ind} {obj_property} {value}\n')
-                
-                
-    return corpus
-
-
-
-
+    sentences = iter_annotation_corpus(ontology, batch_size=batch_size, workers=workers,
+                                       deduplicate=deduplicate)
+    return [f'{sentence}\n' for sentence in sentences]
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import torch
 from torch.utils.data import TensorDataset
 from mowl.owlapi import (
@@ -44,9 +47,13 @@ class ALCDataset():
     dictionary will be created from the ontology object \
     properties. Defaults to ``None``.
     :type object_property_index_dict: dict, optional
+    :param workers: Number of threads used to encode the axioms. Defaults to 1.
+    :type workers: int, optional
+    :param chunk_size: Number of axioms encoded by each task. Defaults to 10000.
+    :type chunk_size: int, optional
     """
 
-    def __init__(self, ontology, dataset, device="cpu"):
+    def __init__(self, ontology, dataset, device="cpu", workers=1, chunk_size=10000):
 
         if not isinstance(ontology, OWLOntology):
             raise TypeError(
@@ -54,11 +61,22 @@ class ALCDataset():
 
         if not isinstance(device, str):
             raise TypeError("Optional parameter device must be of type str")
+        if not isinstance(workers, int):
+            raise TypeError("Optional parameter workers must be of type int.")
+        if not isinstance(chunk_size, int):
+            raise TypeError("Optional parameter chunk_size must be of type int.")
+        if workers < 1:
+            raise ValueError("Optional parameter workers must be greater than 0.")
+        if chunk_size < 1:
+            raise ValueError("Optional parameter chunk_size must be greater than 0.")
 
         self._ontology = ontology
         self._dataset = dataset
         self._loaded = False
         self.device = device
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._patterns = dict()
 
         self.adapter = OWLAPIAdapter()
         self.thing = self.adapter.create_class(THING)
@@ -80,20 +98,110 @@ class ALCDataset():
         return self._dataset.object_property_to_id
 
     def get_grouped_axioms(self):
-        res = dict()
+        grouped_axioms, _ = self._encode_ontology()
+        return grouped_axioms
+
+    def get_axiom_signature(self, axiom):
+        """Returns the structural signature of an axiom and its vector, computed in a single \
+        traversal. The signature is a nested tuple of expression types that determines the \
+        axiom pattern, and the vector is the same as the one returned by \
+        :meth:`get_axiom_vector`. Axioms without pattern return ``(None, None)``.
+
+        :param axiom: Input axiom
+        :type axiom: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :rtype: tuple(tuple, list)
+        """
+        class_to_id = self.class_to_id
+        object_property_to_id = self.object_property_to_id
+
+        def encode_cexpr(cexpr, vector, index=0):
+            expr_type = cexpr.getClassExpressionType()
+            if expr_type == ClassExpressionType.OWL_CLASS:
+                vector.append(class_to_id[cexpr.asOWLClass()])
+                return ("class", index)
+            elif expr_type == ClassExpressionType.OBJECT_SOME_VALUES_FROM:
+                vector.append(object_property_to_id[cexpr.getProperty()])
+                return ("some", encode_cexpr(cexpr.getFiller(), vector, index=index))
+            elif expr_type == ClassExpressionType.OBJECT_ALL_VALUES_FROM:
+                vector.append(object_property_to_id[cexpr.getProperty()])
+                return ("all", encode_cexpr(cexpr.getFiller(), vector, index=index))
+            elif expr_type == ClassExpressionType.OBJECT_INTERSECTION_OF:
+                return ("and",) + tuple(encode_cexpr(expr, vector, index=i)
+                                        for i, expr in enumerate(cexpr.getOperandsAsList()))
+            elif expr_type == ClassExpressionType.OBJECT_UNION_OF:
+                return ("or",) + tuple(encode_cexpr(expr, vector, index=i)
+                                       for i, expr in enumerate(cexpr.getOperandsAsList()))
+            elif expr_type == ClassExpressionType.OBJECT_COMPLEMENT_OF:
+                return ("not", encode_cexpr(cexpr.getOperand(), vector, index=index))
+            raise NotImplementedError()
+
+        vector = []
+        if isinstance(axiom, OWLSubClassOfAxiom):
+            signature = ("subclass", encode_cexpr(axiom.getSubClass(), vector),
+                         encode_cexpr(axiom.getSuperClass(), vector))
+        elif isinstance(axiom, (OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom)):
+            name = "equivalent" if isinstance(axiom, OWLEquivalentClassesAxiom) else "disjoint"
+            signature = (name,) + tuple(encode_cexpr(cexpr, vector)
+                                        for cexpr in axiom.getClassExpressionsAsList())
+        elif isinstance(axiom, OWLClassAssertionAxiom):
+            vector.append(self.individual_to_id[axiom.getIndividual()])
+            signature = ("class_assertion", encode_cexpr(axiom.getClassExpression(), vector))
+        elif isinstance(axiom, OWLObjectPropertyAssertionAxiom):
+            vector = [self.individual_to_id[axiom.getObject()],
+                      object_property_to_id[axiom.getProperty()],
+                      self.individual_to_id[axiom.getSubject()]]
+            signature = ("property_assertion",)
+        else:
+            return None, None
+        return signature, vector
+
+    def _encode_chunk(self, axioms):
+        return [(axiom,) + self.get_axiom_signature(axiom) for axiom in axioms]
+
+    def _map_chunks(self, function, axioms):
+        """Applies ``function`` to consecutive chunks of ``axioms``, using ``workers`` threads. \
+Results are returned in the order of the chunks."""
+
+        chunks = [axioms[i:i + self.chunk_size] for i in range(0, len(axioms), self.chunk_size)]
+
+        if self.workers == 1 or len(chunks) <= 1:
+            return [function(chunk) for chunk in chunks]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(function, chunks))
+
+    def _encode_ontology(self):
+        """Groups the axioms of the ontology by pattern and encodes them. Patterns are built \
+once per structural signature.
+
+        :rtype: tuple(dict, dict)
+        """
+        axioms = []
         for axiom in self._ontology.getAxioms(Imports.INCLUDED):
-            axioms = [axiom, ]
             if isinstance(axiom, OWLNaryAxiom):
-                axioms = axiom.asPairwiseAxioms()
-            for ax in axioms:
-                axiom_pattern = self.get_axiom_pattern(axiom)
-                if axiom_pattern is None:
+                axioms.extend(axiom.asPairwiseAxioms())
+            else:
+                axioms.append(axiom)
+
+        grouped_axioms = dict()
+        grouped_vectors = dict()
+        for chunk in self._map_chunks(self._encode_chunk, axioms):
+            for axiom, signature, vector in chunk:
+                if signature is None:
                     continue
-                if axiom_pattern not in res:
-                    res[axiom_pattern] = [ax, ]
+                if signature not in self._patterns:
+                    self._patterns[signature] = self.get_axiom_pattern(axiom)
+                axiom_pattern = self._patterns[signature]
+                if axiom_pattern not in grouped_axioms:
+                    grouped_axioms[axiom_pattern] = [axiom, ]
+                    grouped_vectors[axiom_pattern] = [vector, ]
                 else:
-                    res[axiom_pattern].append(ax)
-        return res
+                    grouped_axioms[axiom_pattern].append(axiom)
+                    grouped_vectors[axiom_pattern].append(vector)
+
+        grouped_vectors = {pattern: np.array(vectors, dtype=np.int64)
+                           for pattern, vectors in grouped_vectors.items()}
+        return grouped_axioms, grouped_vectors
 
     def get_axiom_pattern(self, axiom):
 
@@ -200,7 +308,7 @@ class ALCDataset():
         if self._loaded:
             return
 
-        self._grouped_axioms = self.get_grouped_axioms()
+        self._grouped_axioms, self._grouped_vectors = self._encode_ontology()
 
         self._loaded = True
 
@@ -220,11 +328,7 @@ class ALCDataset():
                 logger.debug(f"Skipping {ax_pattern} with {len(axioms)} axioms")
             else:
                 logger.debug(f"Creating dataset for {ax_pattern} with {len(axioms)} axioms")
-                axiom_vectors = []
-                for axiom in axioms:
-                    vector = self.get_axiom_vector(axiom)
-                    axiom_vectors.append(vector)
-                axiom_tensor = torch.tensor(axiom_vectors, dtype=torch.int64)
+                axiom_tensor = torch.from_numpy(self._grouped_vectors[ax_pattern])
                 datasets[ax_pattern] = TensorDataset(axiom_tensor)
 
         return datasets, rest_of_axioms
@@ -6,6 +6,8 @@ import tarfile
 import pathlib
 import os
 
+import numpy as np
+
 from jpype import java
 import requests
 
@@ -54,6 +56,17 @@ class Dataset():
         self._object_properties = None
         self._individuals = None
         self._evaluation_classes = None
+        self._version = 0
+
+    @property
+    def version(self):
+        """Number of times the dataset has been modified with :meth:`add_axioms`. Entity \
+collections such as :attr:`classes` and the vocabularies derived from them are cached and only \
+rebuilt after the version changes.
+
+        :rtype: int
+        """
+        return self._version
 
     @property
     def ontology(self):
@@ -202,10 +215,9 @@ validation and testing ontologies using the OWLAPI method ``ontology.getIndividu
         self._object_properties = None
         self._individuals = None
         self._evaluation_classes = None
+        self._version += 1
 
-        
 
-    
 class PathDataset(Dataset):
     """Loads the dataset from ontology documents.
 
@@ -391,6 +403,9 @@ class Entities():
         self._collection = sorted(self._collection, key=lambda x: x.toStringID())
         self._name_owlobject = self.to_dict()
         self._index_dict = self.to_index_dict()
+        self._names = list(self._name_owlobject.keys())
+        self._name_index_dict = None
+        self._name_array = None
 
     def __getitem__(self, idx):
         return self._collection[idx]
@@ -434,8 +449,9 @@ class Entities():
 
     @property
     def as_str(self):
-        """Returns the list of entities as string names."""
-        return list(self._name_owlobject.keys())
+        """Returns the list of entities as string names. The list is cached and must not be \
+modified."""
+        return self._names
 
     @property
     def as_owl(self):
@@ -452,6 +468,28 @@ class Entities():
         """Returns the dictionary of entities indexed by their names."""
         return self._index_dict
 
+    @property
+    def as_str_index_dict(self):
+        """Returns the dictionary mapping entity names to their indices. The dictionary is \
+cached and must not be modified."""
+        if self._name_index_dict is None:
+            self._name_index_dict = {v: k for k, v in enumerate(self._names)}
+        return self._name_index_dict
+
+    @property
+    def as_str_array(self):
+        """Returns the entity names as a NumPy array of objects, ordered by index. The array is \
+cached and read-only."""
+        if self._name_array is None:
+            self._name_array = np.array(self._names, dtype=object)
+            self._name_array.flags.writeable = False
+        return self._name_array
+
+    @property
+    def as_id_array(self):
+        """Returns the entity indices as a NumPy array of type ``int64``."""
+        return np.arange(len(self._names), dtype=np.int64)
+
 
 class OWLClasses(Entities):
     """
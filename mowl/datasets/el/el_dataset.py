@@ -1,10 +1,21 @@
 import torch as th
 from torch.utils.data import DataLoader
-from mowl.ontology.normalize import ELNormalizer, GCI
-from mowl.datasets.gci import GCIDataset, ClassAssertionDataset, ObjectPropertyAssertionDataset
+from mowl.ontology.normalize import ELNormalizer
+from mowl.ontology.digest import axioms_digest
+from mowl.datasets.gci import GCIDataset, ClassAssertionDataset, ObjectPropertyAssertionDataset, \
+    encode_gcis, pack_gcis, encode_packed_gcis
+import hashlib
+import logging
+import os
 import random
+import numpy as np
 from org.semanticweb.owlapi.model import OWLOntology
 
+logger = logging.getLogger(__name__)
+
+NORMAL_FORMS = ["gci0", "gci1", "gci2", "gci3", "gci0_bot", "gci1_bot", "gci3_bot",
+                "class_assertion", "object_property_assertion"]
+
 
 class ELDataset():
     """This class provides data-related methods to work with :math:`\mathcal{EL}` description \
@@ -28,6 +39,14 @@ class ELDataset():
     :type object_property_index_dict: dict, optional
     :param load_normalized: If true, the ontology is assumed to be already normalized and the normalization process will be skipped. Defaults to ``False``.
     :type load_normalized: bool, optional
+    :param cache_dir: Directory where the normalized GCIs are cached. The cache is keyed by a \
+    hash of the ontology axioms and the ``extended`` and ``load_normalized`` flags, so loading an \
+    unchanged ontology again skips the normalization. Defaults to ``None``, which disables the \
+    cache.
+    :type cache_dir: str, optional
+    :param normalization_workers: Number of threads used by :class:`mowl.ontology.normalize.\
+ELNormalizer`. Defaults to 1.
+    :type normalization_workers: int, optional
     """
 
     def __init__(self,
@@ -37,7 +56,9 @@ class ELDataset():
                  individual_index_dict=None,
                  extended=True,
                  load_normalized = False,
-                 device="cpu"
+                 device="cpu",
+                 cache_dir=None,
+                 normalization_workers=1
                  ):
 
         if not isinstance(ontology, OWLOntology):
@@ -61,6 +82,15 @@ org.semanticweb.owlapi.model.OWLOntology.")
         if not isinstance(device, str):
             raise TypeError("Optional parameter device must be of type str")
 
+        if not isinstance(cache_dir, str) and cache_dir is not None:
+            raise TypeError("Optional parameter cache_dir must be of type str")
+
+        if not isinstance(normalization_workers, int):
+            raise TypeError("Optional parameter normalization_workers must be of type int.")
+
+        if normalization_workers < 1:
+            raise ValueError("Optional parameter normalization_workers must be greater than 0.")
+
         self._ontology = ontology
         self._loaded = False
         self._extended = extended
@@ -69,7 +99,9 @@ org.semanticweb.owlapi.model.OWLOntology.")
         self._individual_index_dict = individual_index_dict
         self.device = device
         self.load_normalized = load_normalized
-        
+        self.cache_dir = cache_dir
+        self.normalization_workers = normalization_workers
+
         self._gci0_dataset = None
         self._gci1_dataset = None
         self._gci2_dataset = None
@@ -84,40 +116,33 @@ org.semanticweb.owlapi.model.OWLOntology.")
         if self._loaded:
             return
 
-        normalizer = ELNormalizer()
+        classes, relations, individuals, gcis = self._load_normalized_gcis()
 
-        gcis = normalizer.normalize(self._ontology, load=self.load_normalized)
-
-        classes = set()
-        relations = set()
-        individuals = set()
-        for k, v in gcis.items():
-            new_classes, new_relations, new_individuals = GCI.get_entities(v)
-            classes |= set(new_classes)
-            relations |= set(new_relations)
-            individuals |= set(new_individuals)
-
-        classes = sorted(list(classes))
-        relations = sorted(list(relations))
-        individuals = sorted(list(individuals))
-
-        
         if self._class_index_dict is None:
             self._class_index_dict = {v: k for k, v in enumerate(classes)}
         if self._object_property_index_dict is None:
             self._object_property_index_dict = {v: k for k, v in enumerate(relations)}
         if self._individual_index_dict is None:
             self._individual_index_dict = {v: k for k, v in enumerate(individuals)}
-        if not self._extended:
-            gci0 = gcis["gci0"] + gcis["gci0_bot"]
-            gci1 = gcis["gci1"] + gcis["gci1_bot"]
-            gci2 = gcis["gci2"]
-            gci3 = gcis["gci3"] + gcis["gci3_bot"]
 
-            random.shuffle(gci0)
-            random.shuffle(gci1)
-            random.shuffle(gci2)
-            random.shuffle(gci3)
+        # Map the indices of the normalized GCIs to the indices of the dataset dictionaries
+        vocabularies = {
+            "class": th.tensor([self._class_index_dict[c] for c in classes], dtype=th.long),
+            "object_property": th.tensor(
+                [self._object_property_index_dict[r] for r in relations], dtype=th.long),
+            "individual": th.tensor(
+                [self._individual_index_dict[i] for i in individuals], dtype=th.long)
+        }
+        for name, tensor in gcis.items():
+            columns = [vocabularies[kind][tensor[:, i]] for i, kind in
+                       enumerate(_COLUMN_VOCABULARIES[name])]
+            gcis[name] = th.stack(columns, dim=1)
+
+        if not self._extended:
+            gci0 = _shuffle(th.cat([gcis["gci0"], gcis["gci0_bot"]]))
+            gci1 = _shuffle(th.cat([gcis["gci1"], gcis["gci1_bot"]]))
+            gci2 = _shuffle(gcis["gci2"])
+            gci3 = _shuffle(th.cat([gcis["gci3"], gcis["gci3_bot"]]))
 
             self._gci0_dataset = GCI0Dataset(gci0, self._class_index_dict, device=self.device)
             self._gci1_dataset = GCI1Dataset(gci1, self._class_index_dict, device=self.device)
@@ -128,21 +153,13 @@ org.semanticweb.owlapi.model.OWLOntology.")
                 gci3, self._class_index_dict,
                 object_property_index_dict=self._object_property_index_dict, device=self.device)
         else:
-            gci0 = gcis["gci0"]
-            gci0_bot = gcis["gci0_bot"]
-            gci1 = gcis["gci1"]
-            gci1_bot = gcis["gci1_bot"]
-            gci2 = gcis["gci2"]
-            gci3 = gcis["gci3"]
-            gci3_bot = gcis["gci3_bot"]
-
-            random.shuffle(gci0)
-            random.shuffle(gci0_bot)
-            random.shuffle(gci1)
-            random.shuffle(gci1_bot)
-            random.shuffle(gci2)
-            random.shuffle(gci3)
-            random.shuffle(gci3_bot)
+            gci0 = _shuffle(gcis["gci0"])
+            gci0_bot = _shuffle(gcis["gci0_bot"])
+            gci1 = _shuffle(gcis["gci1"])
+            gci1_bot = _shuffle(gcis["gci1_bot"])
+            gci2 = _shuffle(gcis["gci2"])
+            gci3 = _shuffle(gcis["gci3"])
+            gci3_bot = _shuffle(gcis["gci3_bot"])
 
             self._gci0_dataset = GCI0Dataset(gci0, self._class_index_dict, device=self.device)
             self._gci0_bot_dataset = GCI0Dataset(
@@ -166,19 +183,88 @@ org.semanticweb.owlapi.model.OWLOntology.")
                 device=self.device)
 
         if len(gcis["class_assertion"]) > 0:
-            gci_class_assertion = gcis["class_assertion"]
-            random.shuffle(gci_class_assertion)
+            gci_class_assertion = _shuffle(gcis["class_assertion"])
             self._class_assertion_dataset = ClassAssertionDataset(
                 gci_class_assertion, self._class_index_dict, self._individual_index_dict, device=self.device)
 
         if len(gcis["object_property_assertion"]) > 0:
-            gci_object_property_assertion = gcis["object_property_assertion"]
-            random.shuffle(gci_object_property_assertion)
+            gci_object_property_assertion = _shuffle(gcis["object_property_assertion"])
             self._object_property_assertion_dataset = ObjectPropertyAssertionDataset(
                 gci_object_property_assertion, self._object_property_index_dict, self._individual_index_dict, device=self.device)
             
         self._loaded = True
 
+    def _load_normalized_gcis(self):
+        """Normalizes the ontology and encodes the GCIs of each normal form into tensors \
+        indexed by the sorted lists of classes, object properties and individuals appearing in \
+        the GCIs. If ``cache_dir`` is set, the result is read from or written to the cache.
+
+        :rtype: tuple(list, list, list, dict)
+        """
+
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = os.path.join(self.cache_dir, f"{self.fingerprint()}.npz")
+            if os.path.exists(cache_file):
+                logger.info(f"Loading normalized GCIs from {cache_file}")
+                with np.load(cache_file) as cached:
+                    classes = cached["classes"].tolist()
+                    relations = cached["object_properties"].tolist()
+                    individuals = cached["individuals"].tolist()
+                    gcis = {name: th.from_numpy(cached[name]) for name in NORMAL_FORMS}
+                return classes, relations, individuals, gcis
+
+        normalizer = ELNormalizer(workers=self.normalization_workers)
+
+        gcis = normalizer.normalize(self._ontology, load=self.load_normalized)
+
+        # Entities are read in bulk once per normal form and encoded from the packed ids
+        packed = {name: pack_gcis(gcis[name], _COLUMN_ATTRIBUTES[name]) for name in NORMAL_FORMS}
+
+        entities = {"class": set(), "object_property": set(), "individual": set()}
+        for name, (ids, names) in packed.items():
+            for column, kind in enumerate(_COLUMN_VOCABULARIES[name]):
+                entities[kind].update(names[i] for i in np.unique(ids[:, column]))
+
+        classes = sorted(entities["class"])
+        relations = sorted(entities["object_property"])
+        individuals = sorted(entities["individual"])
+
+        index_dicts = {
+            "class": {v: k for k, v in enumerate(classes)},
+            "object_property": {v: k for k, v in enumerate(relations)},
+            "individual": {v: k for k, v in enumerate(individuals)}
+        }
+
+        gcis = dict()
+        for name, (ids, names) in packed.items():
+            columns = [index_dicts[kind] for kind in _COLUMN_VOCABULARIES[name]]
+            gcis[name] = encode_packed_gcis(ids, names, columns)
+
+        if cache_file is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_file, classes=np.array(classes, dtype=str),
+                     object_properties=np.array(relations, dtype=str),
+                     individuals=np.array(individuals, dtype=str),
+                     **{name: tensor.numpy() for name, tensor in gcis.items()})
+            os.replace(tmp_file, cache_file)
+            logger.info(f"Normalized GCIs cached in {cache_file}")
+
+        return classes, relations, individuals, gcis
+
+    def fingerprint(self):
+        """Returns a hash of the ontology axioms (including the imports closure) and of the \
+        ``extended`` and ``load_normalized`` flags. This is the key used to cache the normalized \
+        GCIs. The axioms are hashed with :func:`mowl.ontology.digest.axioms_digest`.
+
+        :rtype: str
+        """
+
+        digest = hashlib.sha256(axioms_digest(self._ontology).encode("utf-8"))
+        digest.update(f"extended={self._extended};load_normalized={self.load_normalized}".encode())
+        return digest.hexdigest()
+
     def get_gci_datasets(self):
         """Returns a dictionary containing the name of the normal forms as keys and the \
         corresponding datasets as values. This method will return 7 datasets if the class \
@@ -287,13 +373,8 @@ class GCI0Dataset(GCIDataset):
         super().__init__(*args, **kwargs)
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            subclass = self.class_index_dict[gci.subclass]
-            superclass = self.class_index_dict[gci.superclass]
-            pretensor.append([subclass, superclass])
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("subclass", self.class_index_dict), ("superclass", self.class_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
 
     def get_data_(self):
         for gci in self.data:
@@ -307,15 +388,10 @@ class GCI1Dataset(GCIDataset):
         super().__init__(*args, **kwargs)
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            left_subclass = self.class_index_dict[gci.left_subclass]
-            right_subclass = self.class_index_dict[gci.right_subclass]
-            superclass = self.class_index_dict[gci.superclass]
-            pretensor.append([left_subclass, right_subclass, superclass])
-
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("left_subclass", self.class_index_dict),
+                   ("right_subclass", self.class_index_dict),
+                   ("superclass", self.class_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
 
     def get_data_(self):
         for gci in self.data:
@@ -330,14 +406,10 @@ class GCI2Dataset(GCIDataset):
         super().__init__(*args, **kwargs)
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            subclass = self.class_index_dict[gci.subclass]
-            object_property = self.object_property_index_dict[gci.object_property]
-            filler = self.class_index_dict[gci.filler]
-            pretensor.append([subclass, object_property, filler])
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("subclass", self.class_index_dict),
+                   ("object_property", self.object_property_index_dict),
+                   ("filler", self.class_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
 
     def get_data_(self):
         for gci in self.data:
@@ -352,14 +424,10 @@ class GCI3Dataset(GCIDataset):
         super().__init__(*args, **kwargs)
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            object_property = self.object_property_index_dict[gci.object_property]
-            filler = self.class_index_dict[gci.filler]
-            superclass = self.class_index_dict[gci.superclass]
-            pretensor.append([object_property, filler, superclass])
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("object_property", self.object_property_index_dict),
+                   ("filler", self.class_index_dict),
+                   ("superclass", self.class_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
 
     def get_data_(self):
         for gci in self.data:
@@ -369,4 +437,32 @@ class GCI3Dataset(GCIDataset):
             yield object_property, filler, superclass
 
 
-
+_COLUMN_ATTRIBUTES = {
+    "gci0": ("subclass", "superclass"),
+    "gci1": ("left_subclass", "right_subclass", "superclass"),
+    "gci2": ("subclass", "object_property", "filler"),
+    "gci3": ("object_property", "filler", "superclass"),
+    "gci0_bot": ("subclass", "superclass"),
+    "gci1_bot": ("left_subclass", "right_subclass", "superclass"),
+    "gci3_bot": ("object_property", "filler", "superclass"),
+    "class_assertion": ("individual", "class_"),
+    "object_property_assertion": ("subject", "object_property", "object_")
+}
+
+_COLUMN_VOCABULARIES = {
+    "gci0": ("class", "class"),
+    "gci1": ("class", "class", "class"),
+    "gci2": ("class", "object_property", "class"),
+    "gci3": ("object_property", "class", "class"),
+    "gci0_bot": ("class", "class"),
+    "gci1_bot": ("class", "class", "class"),
+    "gci3_bot": ("object_property", "class", "class"),
+    "class_assertion": ("individual", "class"),
+    "object_property_assertion": ("individual", "object_property", "individual")
+}
+
+
+def _shuffle(tensor):
+    permutation = list(range(len(tensor)))
+    random.shuffle(permutation)
+    return tensor[th.tensor(permutation, dtype=th.long)]
@@ -1,14 +1,116 @@
 from torch.utils.data import IterableDataset, Dataset
+from operator import attrgetter
+from mowl.utils.data import unpack_names
+import logging
+import numpy as np
+import pandas as pd
 import torch as th
 
 
+def pack_gcis(gcis, attributes):
+    """
+    Reads the entities of a list of axioms as a table of ids into a list of names. Axioms \
+returned by :class:`mowl.ontology.normalize.ELNormalizer` are read in bulk on the JVM by \
+``org.mowl.Utils.packAxioms``, so that the cost of crossing the JVM boundary grows with the \
+number of distinct names instead of with the number of axioms. Other axioms are read through \
+their attributes.
+
+    :param gcis: Axioms to read.
+    :type gcis: list
+    :param attributes: Name of the axiom property holding the entity name of each column.
+    :type attributes: list(str)
+    :return: Array of shape ``(len(gcis), len(attributes))`` with the id of each entity and the \
+list of names indexed by those ids.
+    :rtype: tuple(:class:`numpy.ndarray`, list(str))
+    """
+
+    if len(gcis) > 0 and hasattr(gcis[0], "owl_axiom"):
+        try:
+            from java.util import ArrayList
+            from org.mowl import Utils
+            packed = Utils.packAxioms(ArrayList([gci.owl_axiom for gci in gcis]), attributes)
+        except (ImportError, AttributeError):
+            logging.warning("org.mowl.Utils.packAxioms is not available. Axioms will be read one "
+                            "by one from the JVM. Rebuild the mOWL jars to read them in bulk.")
+        else:
+            ids = np.asarray(packed.ids(), dtype=np.int64).reshape(len(gcis), len(attributes))
+            return ids, unpack_names(packed.names(), packed.nameOffsets())
+
+    entities = [entity for attribute in attributes for entity in map(attrgetter(attribute), gcis)]
+    ids, names = pd.factorize(np.array(entities, dtype=object))
+    return ids.reshape(len(attributes), len(gcis)).T, names.tolist()
+
+
+def encode_packed_gcis(ids, names, index_dicts, device="cpu"):
+    """
+    Encodes axioms read with :func:`pack_gcis` into an integer tensor. Each name is looked up \
+once per index dictionary and the ids are mapped in one vectorized pass.
+
+    :param ids: Array of shape ``(number of axioms, number of columns)`` with ids into ``names``.
+    :type ids: :class:`numpy.ndarray`
+    :param names: Entity names indexed by ``ids``.
+    :type names: list(str)
+    :param index_dicts: For each column, a dictionary mapping entity names to indices.
+    :type index_dicts: list(dict)
+    :param device: The device where the tensor is stored. Defaults to ``"cpu"``.
+    :type device: str, optional
+    :return: Tensor with the shape of ``ids`` and type ``torch.long``.
+    :rtype: :class:`torch.Tensor`
+    """
+
+    encoded = np.empty(ids.shape, dtype=np.int64)
+    names = pd.Index(names)
+    mappings = dict()
+
+    for column, index_dict in enumerate(index_dicts):
+        if id(index_dict) not in mappings:
+            vocabulary = pd.Index(list(index_dict.keys()))
+            indices = np.fromiter(index_dict.values(), dtype=np.int64, count=len(index_dict))
+            positions = vocabulary.get_indexer(names)
+            mapping = np.full(len(names), -1, dtype=np.int64)
+            mapping[positions >= 0] = indices[positions[positions >= 0]]
+            mappings[id(index_dict)] = mapping
+
+        encoded[:, column] = mappings[id(index_dict)][ids[:, column]]
+        missing = encoded[:, column] < 0
+        if missing.any():
+            raise KeyError(names[ids[int(np.argmax(missing)), column]])
+
+    return th.from_numpy(encoded).to(device)
+
+
+def encode_gcis(gcis, columns, device="cpu"):
+    """
+    Encodes a list of axioms into an integer tensor. The entities are read with \
+:func:`pack_gcis` and encoded with :func:`encode_packed_gcis`.
+
+    :param gcis: Axioms to encode.
+    :type gcis: list
+    :param columns: For each column of the output tensor, a pair ``(attribute, index_dict)`` \
+where ``attribute`` is the name of the axiom property holding the entity name and \
+``index_dict`` maps entity names to indices.
+    :type columns: list(tuple(str, dict))
+    :param device: The device where the tensor is stored. Defaults to ``"cpu"``.
+    :type device: str, optional
+    :return: Tensor of shape ``(len(gcis), len(columns))`` and type ``torch.long``.
+    :rtype: :class:`torch.Tensor`
+    """
+
+    ids, names = pack_gcis(gcis, [attribute for attribute, _ in columns])
+    return encode_packed_gcis(ids, names, [index_dict for _, index_dict in columns],
+                              device=device)
+
+
 class GCIDataset(Dataset):
     def __init__(self, data, class_index_dict, object_property_index_dict=None, device="cpu"):
         super().__init__()
         self.class_index_dict = class_index_dict
         self.object_property_index_dict = object_property_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(self.device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
@@ -32,9 +134,10 @@ class GCIDataset(Dataset):
         in the first dimension."
 
         tensor_elems = th.unique(tensor, return_counts=False, sorted=True)
-        in_indices = sum(tensor_elems == i for i in list(self.class_index_dict.values())).bool()
+        known_indices = th.tensor(list(self.class_index_dict.values()), device=tensor_elems.device)
+        in_indices = th.isin(tensor_elems, known_indices)
 
-        if not all(in_indices):
+        if not in_indices.all():
             raise ValueError("Extending element contains not recognized index.")
 
         new_tensor = th.cat([self._data, tensor.to(self.device)], dim=0)
@@ -53,20 +156,18 @@ class ClassAssertionDataset(Dataset):
         self.class_index_dict = class_index_dict
         self.individual_index_dict = individual_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(self.device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
         return self._data
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            class_ = self.class_index_dict[gci.class_]
-            individual = self.individual_index_dict[gci.individual]
-            pretensor.append([individual, class_])
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("individual", self.individual_index_dict), ("class_", self.class_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
 
     def get_data(self):
         raise NotImplementedError()
@@ -85,21 +186,20 @@ class ObjectPropertyAssertionDataset(Dataset):
         self.object_property_index_dict = object_property_index_dict
         self.individual_index_dict = individual_index_dict
         self.device = device
-        self._data = self.push_to_device(data)
+        if th.is_tensor(data):
+            self._data = data.to(self.device)
+        else:
+            self._data = self.push_to_device(data)
 
     @property
     def data(self):
         return self._data
 
     def push_to_device(self, data):
-        pretensor = []
-        for gci in data:
-            object_property = self.object_property_index_dict[gci.object_property]
-            subject = self.individual_index_dict[gci.subject]
-            object_ = self.individual_index_dict[gci.object_]
-            pretensor.append([subject, object_property, object_])
-        tensor = th.tensor(pretensor).to(self.device)
-        return tensor
+        columns = [("subject", self.individual_index_dict),
+                   ("object_property", self.object_property_index_dict),
+                   ("object_", self.individual_index_dict)]
+        return encode_gcis(data, columns, device=self.device)
         
     def get_data(self):
         raise NotImplementedError()
@@ -1,3 +1,4 @@
+from mowl.evaluation.filtering import FilterIndex, TupleSet
 from mowl.evaluation.base import BaseRankingEvaluator, RankingEvaluator, Evaluator
 from mowl.evaluation.subsumption import SubsumptionEvaluator
 from mowl.evaluation.ppi import PPIEvaluator
@@ -2,6 +2,7 @@ import numpy as np
 import torch as th
 
 from mowl.utils.data import FastTensorDataLoader
+from mowl.evaluation.filtering import FilterIndex, TupleSet
 from mowl.error import messages as msg
 
 import logging
@@ -11,6 +12,98 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.StreamHandler())
 logger.setLevel(logging.INFO)
 
+HITS_AT_K = [1, 3, 10, 50, 100]
+
+
+def compute_ranks(scores, targets):
+    """
+    Computes the rank of the target entity in each row of a block of scores. Lower scores are \
+considered better. The rank is computed by counting the number of candidates scored better than \
+the target, which avoids sorting the whole row. Candidates tied with the target are counted as \
+better, so that ties give the worst possible rank. Otherwise, a model giving the same score to \
+every candidate, or an infinite score to the target, would rank every target first.
+
+    :param scores: Scores of shape ``(batch_size, num_candidates)``.
+    :type scores: :class:`torch.Tensor`
+    :param targets: Column index of the target entity in each row of ``scores``.
+    :type targets: :class:`torch.Tensor`
+    :return: One-based ranks of shape ``(batch_size,)``.
+    :rtype: :class:`torch.Tensor`
+    """
+    targets = targets.view(-1, 1)
+    better = scores <= scores.gather(1, targets)
+    better.scatter_(1, targets, False)
+    return better.sum(dim=1) + 1
+
+
+def scores_gci(gci_name):
+    """
+    Decorator for :meth:`RankingEvaluator.get_scores` implementations that return \
+``model(batch, gci_name)``. It lets :class:`RankingEvaluator` score candidates with the \
+``score_all_tails`` and ``score_all_heads`` methods of the model instead. Subclasses overriding a \
+decorated method score every tuple with their own implementation unless they decorate it again.
+
+    :param gci_name: ``"gci0"`` if the evaluator scores pairs or ``"gci2"`` if it scores triples.
+    :type gci_name: str
+    """
+    if gci_name not in ["gci0", "gci2"]:
+        raise ValueError("Parameter gci_name must be either 'gci0' or 'gci2'.")
+
+    def decorator(get_scores):
+        get_scores.scored_gci = gci_name
+        return get_scores
+    return decorator
+
+
+class RankHistogram():
+    """
+    Accumulates ranks as a histogram so that ranking metrics can be computed with tensor \
+operations without keeping every individual rank.
+
+    :param max_rank: The largest possible rank.
+    :type max_rank: int
+    :param device: The device where the histogram is stored.
+    :type device: str
+    """
+
+    def __init__(self, max_rank, device="cpu"):
+        self.max_rank = max_rank
+        self.counts = th.zeros(max_rank + 1, dtype=th.long, device=device)
+        self.reciprocal_sum = th.zeros(1, dtype=th.double, device=device)
+
+    def update(self, ranks):
+        """
+        Adds a batch of ranks to the histogram.
+
+        :param ranks: One-based ranks.
+        :type ranks: :class:`torch.Tensor`
+        """
+        ranks = ranks.to(self.counts.device)
+        self.counts += th.bincount(ranks, minlength=self.max_rank + 1)
+        # cumsum adds the reciprocal ranks sequentially, so the result does not depend on
+        # the batch size and matches a query-by-query accumulation.
+        reciprocal_ranks = 1 / ranks.double()
+        self.reciprocal_sum = th.cat([self.reciprocal_sum, reciprocal_ranks]).cumsum(0)[-1:]
+
+    def mean_rank(self, num_queries):
+        rank_values = th.arange(self.max_rank + 1, dtype=th.long, device=self.counts.device)
+        return (self.counts * rank_values).sum().item() / num_queries
+
+    def mean_reciprocal_rank(self, num_queries):
+        return self.reciprocal_sum.item() / num_queries
+
+    def hits_at(self, k, num_queries):
+        return self.counts[:k + 1].sum().item() / num_queries
+
+    def as_dict(self):
+        """
+        :return: Dictionary mapping each observed rank to its number of occurrences, as \
+expected by :func:`compute_rank_roc`.
+        :rtype: dict
+        """
+        observed = th.nonzero(self.counts).flatten()
+        return dict(zip(observed.tolist(), self.counts[observed].tolist()))
+
 
 
 class BaseRankingEvaluator():
@@ -66,7 +159,8 @@ class BaseRankingEvaluator():
             self.mapped_tails = tails
 
         
-        self.filtering_labels = th.ones((len(self.heads), len(self.tails))).to(self.device)
+        self.filter_index = FilterIndex(len(self.heads), len(self.tails), device=self.device)
+        self.top_k_predictions = None
         
     def update_filtering_labels(self, data):
         if data is None:
@@ -89,7 +183,7 @@ class BaseRankingEvaluator():
         
         mapped_heads = mapped_heads[~whole_mask]
         mapped_tails = mapped_tails[~whole_mask]
-        self.filtering_labels[mapped_heads, mapped_tails] = 10000
+        self.filter_index.add(mapped_heads, mapped_tails)
 
     def get_scores(self, evaluation_model, batch):
         logger.warning("Your are using a generic `get_scores` method. Please implement a specific one for your model.")
@@ -97,41 +191,15 @@ class BaseRankingEvaluator():
 
 
     def get_expanded_scores(self, evaluation_model, batch, mode):
-        batch_rels = None
-
-        if batch.shape[1] == 2:
-            batch_heads, batch_tails = batch[:, 0], batch[:, 1]
-        elif batch.shape[1] == 3:
-            batch_heads, batch_rels, batch_tails = batch[:, 0], batch[:, 1], batch[:, 2]
-        else:
-            raise ValueError("Batch must have 2 or 3 columns.")
-            
-        num_batch_heads, num_batch_tails = len(batch_heads), len(batch_tails)
+        head_scores, tail_scores = None, None
 
         if mode in ["head_centric", "both"]:
-            batch_heads = batch_heads.repeat_interleave(len(self.tails)).unsqueeze(1)
-            eval_tails = th.arange(len(self.tails), device=self.device).repeat(num_batch_heads).unsqueeze(1)
-            if batch_rels is None:
-                data = th.cat([batch_heads, eval_tails], dim=1)
-            else:
-                aux_batch_rels = batch_rels.repeat_interleave(len(self.tails)).unsqueeze(1)
-                data = th.cat([batch_heads, aux_batch_rels, eval_tails], dim=1)
-                
-            head_scores = self.get_scores(evaluation_model, data)
-            head_scores = head_scores.view(-1, len(self.tails))
+            eval_tails = th.arange(len(self.tails), device=self.device)
+            head_scores = self.get_candidate_scores(evaluation_model, batch, "head_centric", eval_tails)
 
         if mode in ["tail_centric", "both"]:
-            batch_tails = batch_tails.repeat_interleave(len(self.heads)).unsqueeze(1)
-            eval_heads = th.arange(len(self.heads), device=self.device).repeat(num_batch_tails).unsqueeze(1)
-
-            if batch_rels is None:
-                data = th.cat([eval_heads, batch_tails], dim=1)
-            else:
-                aux_batch_rels = batch_rels.repeat_interleave(len(self.heads)).unsqueeze(1)
-                data = th.cat([eval_heads, aux_batch_rels, batch_tails], dim=1)
-            
-            tail_scores = self.get_scores(evaluation_model, data)
-            tail_scores = tail_scores.view(-1, len(self.heads))
+            eval_heads = th.arange(len(self.heads), device=self.device)
+            tail_scores = self.get_candidate_scores(evaluation_model, batch, "tail_centric", eval_heads)
 
         if mode == "head_centric":
             return head_scores, None
@@ -142,9 +210,184 @@ class BaseRankingEvaluator():
         else:
             raise ValueError(f"Invalid mode: {mode}")
         
- 
+    def score_all_candidates(self, evaluation_model, heads, rels, tails, side, candidates):
+        """
+        Hook for evaluation models that can score a batch against a shared set of candidates \
+without building every tuple explicitly. The default implementation returns ``None``, which \
+falls back to :meth:`get_scores` over the expanded tuples.
+
+        :param heads: Head entities of the batch.
+        :type heads: :class:`torch.Tensor`
+        :param rels: Relations of the batch or ``None`` if the tuples are pairs.
+        :type rels: :class:`torch.Tensor`
+        :param tails: Tail entities of the batch.
+        :type tails: :class:`torch.Tensor`
+        :param side: Either ``"head_centric"`` or ``"tail_centric"``.
+        :type side: str
+        :param candidates: Entity ids of the candidates.
+        :type candidates: :class:`torch.Tensor`
+        :return: Scores of shape ``(n, num_candidates)`` or ``None``.
+        :rtype: :class:`torch.Tensor`
+        """
+        return None
+
+    def get_candidate_scores(self, evaluation_model, batch, side, candidates):
+        """
+        Scores every query in the batch against the same set of candidates.
+
+        :param evaluation_model: The evaluation model.
+        :type evaluation_model: :class:`torch.nn.Module`
+        :param batch: Test tuples of shape ``(n, 2)`` or ``(n, 3)``.
+        :type batch: :class:`torch.Tensor`
+        :param side: Either ``"head_centric"`` (candidates replace the tails) or \
+``"tail_centric"`` (candidates replace the heads).
+        :type side: str
+        :param candidates: Candidate positions in ``self.tails`` or ``self.heads``. If it is a \
+2D tensor, each row contains the candidates of the corresponding query.
+        :type candidates: :class:`torch.Tensor`
+        :return: Scores of shape ``(n, num_candidates)``.
+        :rtype: :class:`torch.Tensor`
+        """
+        batch_rels = None
+
+        if batch.shape[1] == 2:
+            batch_heads, batch_tails = batch[:, 0], batch[:, 1]
+        elif batch.shape[1] == 3:
+            batch_heads, batch_rels, batch_tails = batch[:, 0], batch[:, 1], batch[:, 2]
+        else:
+            raise ValueError("Batch must have 2 or 3 columns.")
+
+        if side == "head_centric":
+            candidates = self.tails[candidates]
+        elif side == "tail_centric":
+            candidates = self.heads[candidates]
+        else:
+            raise ValueError(f"Invalid side: {side}")
+
+        if candidates.dim() == 1:
+            scores = self.score_all_candidates(evaluation_model, batch_heads, batch_rels, batch_tails,
+                                               side, candidates)
+            if scores is not None:
+                return scores
+            candidates = candidates.repeat(len(batch), 1)
+        num_candidates = candidates.shape[1]
+        candidates = candidates.reshape(-1, 1)
+
+        if side == "head_centric":
+            heads = batch_heads.repeat_interleave(num_candidates).unsqueeze(1)
+            tails = candidates
+        else:
+            heads = candidates
+            tails = batch_tails.repeat_interleave(num_candidates).unsqueeze(1)
+
+        if batch_rels is None:
+            data = th.cat([heads, tails], dim=1)
+        else:
+            rels = batch_rels.repeat_interleave(num_candidates).unsqueeze(1)
+            data = th.cat([heads, rels, tails], dim=1)
+
+        return self.get_scores(evaluation_model, data).view(-1, num_candidates)
+
+    def rank_side(self, evaluation_model, batch, side, filter_index, max_elements=None, top_k=None):
+        """
+        Computes raw and filtered ranks of a batch of test tuples for one side of the \
+evaluation.
+
+        If ``max_elements`` is ``None``, the batch is scored against all the candidates at \
+once. Otherwise, candidates are scored in chunks so that at most ``max_elements`` scores are \
+materialized at a time. For each chunk, only the number of candidates scored better than \
+the target, or tied with it, is kept, as in :func:`compute_ranks`. The chunks containing the \
+targets are scored once more beforehand to read the scores of the targets.
+
+        :param side: Either ``"head_centric"`` or ``"tail_centric"``.
+        :type side: str
+        :param filter_index: Index of known pairs keyed by the query entity of ``side``.
+        :type filter_index: :class:`mowl.evaluation.filtering.FilterIndex`
+        :param max_elements: Maximum number of scores computed at a time. Defaults to ``None``.
+        :type max_elements: int, optional
+        :param top_k: If set, also returns the ``top_k`` best filtered candidates per query. \
+Defaults to ``None``.
+        :type top_k: int, optional
+        :return: Raw ranks, filtered ranks and, if ``top_k`` is set, a pair of tensors \
+``(scores, candidate_positions)``. Otherwise ``None``.
+        :rtype: tuple
+        """
+        if batch.shape[1] == 2:
+            heads, tails = batch[:, 0], batch[:, 1]
+        elif batch.shape[1] == 3:
+            heads, tails = batch[:, 0], batch[:, 2]
+        else:
+            raise ValueError("Batch shape must be either (n, 2) or (n, 3)")
+
+        mapped_heads = self.mapped_heads[heads]
+        mapped_tails = self.mapped_tails[tails]
+
+        if side == "head_centric":
+            rows, targets, num_candidates = mapped_heads, mapped_tails, len(self.tails)
+        elif side == "tail_centric":
+            rows, targets, num_candidates = mapped_tails, mapped_heads, len(self.heads)
+        else:
+            raise ValueError(f"Invalid side: {side}")
+
+        if top_k is not None:
+            top_k = min(top_k, num_candidates)
+            
+        if max_elements is None:
+            head_scores, tail_scores = self.get_expanded_scores(evaluation_model, batch, side)
+            scores = head_scores if side == "head_centric" else tail_scores
+            f_scores = scores + filter_index.additive_mask(rows, exclude=targets)
+            top = None
+            if top_k is not None:
+                top = th.topk(f_scores, top_k, dim=1, largest=False)
+            return compute_ranks(scores, targets), compute_ranks(f_scores, targets), top
+
+        chunk_size = max(1, max_elements // len(batch))
+
+        # The scores of the targets are taken from the chunks that contain them, so that they
+        # are computed in the same way as the scores they are compared with
+        true_scores = None
+        target_chunks = targets // chunk_size
+        for chunk in th.unique(target_chunks).tolist():
+            start = chunk * chunk_size
+            end = min(start + chunk_size, num_candidates)
+            candidates = th.arange(start, end, device=self.device)
+            scores = self.get_candidate_scores(evaluation_model, batch, side, candidates)
+            if true_scores is None:
+                true_scores = th.empty((len(batch), 1), dtype=scores.dtype, device=scores.device)
+            in_chunk = target_chunks == chunk
+            columns = (targets[in_chunk] - start).view(-1, 1)
+            true_scores[in_chunk] = scores[in_chunk].gather(1, columns)
+
+        better = th.zeros(len(batch), dtype=th.long, device=self.device)
+        f_better = th.zeros(len(batch), dtype=th.long, device=self.device)
+        top_scores = th.zeros((len(batch), 0), device=self.device)
+        top_indices = th.zeros((len(batch), 0), dtype=th.long, device=self.device)
+        
+        for start in range(0, num_candidates, chunk_size):
+            end = min(start + chunk_size, num_candidates)
+            candidates = th.arange(start, end, device=self.device)
+            scores = self.get_candidate_scores(evaluation_model, batch, side, candidates)
+            f_scores = scores + filter_index.additive_mask(rows, exclude=targets,
+                                                           column_range=(start, end))
+            is_target = candidates.unsqueeze(0) == targets.unsqueeze(1)
+            better += ((scores <= true_scores) & ~is_target).sum(dim=1)
+            f_better += ((f_scores <= true_scores) & ~is_target).sum(dim=1)
+
+            if top_k is not None:
+                top_scores = th.cat([top_scores, f_scores], dim=1)
+                top_indices = th.cat([top_indices, candidates.repeat(len(batch), 1)], dim=1)
+                k = min(top_k, top_scores.shape[1])
+                top_scores, order = th.topk(top_scores, k, dim=1, largest=False)
+                top_indices = top_indices.gather(1, order)
+
+        top = None
+        if top_k is not None:
+            top = (top_scores, top_indices)
+        return better + 1, f_better + 1, top
+
     @th.no_grad()
-    def compute_ranking_metrics(self, evaluation_model, test_data, filter_data=None, mode="head_centric"):
+    def compute_ranking_metrics(self, evaluation_model, test_data, filter_data=None, mode="head_centric",
+                                max_elements=None, top_k=None):
         """
         Compute the ranking metrics for the evaluation model on the test data.
         :param evaluation_model: The evaluation model.
@@ -155,6 +398,14 @@ class BaseRankingEvaluator():
         :type filter_data: :class:`torch.Tensor`
         :param mode: The mode of the evaluation.
         :type mode: str
+        :param max_elements: If set, candidates are scored in chunks so that at most \
+``max_elements`` scores are in memory at a time (e.g., ``2**26``). Defaults to ``None``, \
+which scores all candidates of a batch at once.
+        :type max_elements: int, optional
+        :param top_k: If set, the ``top_k`` best filtered candidates of each test tuple are \
+stored in ``self.top_k_predictions``, a dictionary mapping each evaluated side to a pair \
+``(scores, entity_ids)``. Defaults to ``None``.
+        :type top_k: int, optional
         :return: The computed ranking metrics.
         :rtype: dict
         """
@@ -172,117 +423,51 @@ class BaseRankingEvaluator():
         num_tails = len(self.tails)
         
         self.update_filtering_labels(filter_data)
+        tail_filter_index = self.filter_index.transpose()
                                                                                                  
         dataloader = FastTensorDataLoader(test_data, batch_size=self.batch_size, shuffle=False)
 
-        metrics = dict()
-        mrr, fmrr = 0, 0
-        mr, fmr = 0, 0
-        ranks, franks = dict(), dict()
-
-        hits_k = dict({"1": 0, "3": 0, "10": 0, "50": 0, "100": 0})
-        f_hits_k = dict({"1": 0, "3": 0, "10": 0, "50": 0, "100": 0})
+        max_rank = max(num_heads, num_tails)
+        ranks = RankHistogram(max_rank, device=self.device)
+        franks = RankHistogram(max_rank, device=self.device)
         
+        if mode == "both":
+            sides = {"head_centric": self.filter_index, "tail_centric": tail_filter_index}
+        elif mode == "head_centric":
+            sides = {"head_centric": self.filter_index}
+        else:
+            sides = {"tail_centric": tail_filter_index}
+
+        top_k_predictions = {side: ([], []) for side in sides}
         
         for batch, in dataloader:
-            if batch.shape[1] == 2:
-                heads, tails = batch[:, 0], batch[:, 1]
-            elif batch.shape[1] == 3:
-                heads, tails = batch[:, 0], batch[:, 2]
-            else:
-                raise ValueError("Batch shape must be either (n, 2) or (n, 3)")
-
-            aux_heads = heads.clone()
-            aux_tails = tails.clone()
-
             batch = batch.to(self.device)
-            head_scores, tail_scores = self.get_expanded_scores(evaluation_model, batch, mode)
-                        
-            if head_scores is not None:
-                for i, head in enumerate(aux_heads):
-                    tail = tails[i]
-                    head = th.where(self.heads == head)[0].item()
-                    tail = th.where(self.tails == tail)[0].item()
-                    preds = head_scores[i]
-                    f_preds = preds * self.filtering_labels[head]
-                                                                        
-                    order = th.argsort(preds, descending=False)
-                    rank = th.where(order == tail)[0].item() + 1
-                    mr += rank
-                    mrr += 1 / rank
-
-                    f_order = th.argsort(f_preds, descending=False)
-                    f_rank = th.where(f_order == tail)[0].item() + 1
-                    fmr += f_rank
-                    fmrr += 1 / f_rank
-
-                    for k in hits_k:
-                        if rank <= int(k):
-                            hits_k[k] += 1
-
-                    for k in f_hits_k:
-                        if f_rank <= int(k):
-                            f_hits_k[k] += 1
-
-                    if rank not in ranks:
-                        ranks[rank] = 0
-                    ranks[rank] += 1
-
-                    if f_rank not in franks:
-                        franks[f_rank] = 0
-                    franks[f_rank] += 1
-
-            if tail_scores is not None:
-
-                for i, tail in enumerate(aux_tails):
-                    head = aux_heads[i]
-                    head = th.where(self.heads == head)[0].item()
-                    tail = th.where(self.tails == tail)[0].item()
-                    preds = tail_scores[i]
-                    f_preds = preds * self.filtering_labels[:, tail]
-
-                    order = th.argsort(preds, descending=False)
-                    rank = th.where(order == head)[0].item() + 1
-                    mr += rank
-                    mrr += 1 / rank
-
-                    f_order = th.argsort(f_preds, descending=False)
-                    f_rank = th.where(f_order == head)[0].item() + 1
-                    fmr += f_rank
-                    fmrr += 1 / f_rank
-
-                    for k in hits_k:
-                        if rank <= int(k):
-                            hits_k[k] += 1
-
-                    for k in f_hits_k:
-                        if f_rank <= int(k):
-                            f_hits_k[k] += 1
-
-                    if rank not in ranks:
-                        ranks[rank] = 0
-                    ranks[rank] += 1
-
-                    if f_rank not in franks:
-                        franks[f_rank] = 0
-                    franks[f_rank] += 1
-
-            if mode in ["head_centric", "tail_centric"]:
-                divisor = 1
-            elif mode == "both":
-                divisor = 2
-            else:
-                raise ValueError(f"Invalid mode: {mode}")
 
-        mr = mr / (divisor * len(test_data))
-        mrr = mrr / (divisor * len(test_data))
+            for side, filter_index in sides.items():
+                side_ranks, side_franks, top = self.rank_side(evaluation_model, batch, side, filter_index,
+                                                              max_elements=max_elements, top_k=top_k)
+                ranks.update(side_ranks)
+                franks.update(side_franks)
 
-        metrics["mr"] = mr
-        metrics["mrr"] = mrr
+                if top is not None:
+                    top_k_predictions[side][0].append(top[0])
+                    top_k_predictions[side][1].append(top[1])
 
-        fmr = fmr / (divisor * len(test_data))
-        fmrr = fmrr / (divisor * len(test_data))
+        if top_k is not None:
+            self.top_k_predictions = dict()
+            for side, (top_scores, top_indices) in top_k_predictions.items():
+                candidates = self.tails if side == "head_centric" else self.heads
+                self.top_k_predictions[side] = (th.cat(top_scores), candidates[th.cat(top_indices)])
+
+        if mode in ["head_centric", "tail_centric"]:
+            divisor = 1
+        elif mode == "both":
+            divisor = 2
+        else:
+            raise ValueError(f"Invalid mode: {mode}")
 
+        num_queries = divisor * len(test_data)
+        
         if mode == "both":
             num_entities_for_auc = 0.5 * (num_heads + num_tails)
         elif mode == "head_centric":
@@ -290,21 +475,19 @@ class BaseRankingEvaluator():
         elif mode == "tail_centric":
             num_entities_for_auc = num_heads
 
-        auc = compute_rank_roc(ranks, num_entities_for_auc)
-        f_auc = compute_rank_roc(franks, num_entities_for_auc)
-
-        metrics["f_mr"] = fmr
-        metrics["f_mrr"] = fmrr
-        metrics["auc"] = auc
-        metrics["f_auc"] = f_auc
+        metrics = dict()
+        metrics["mr"] = ranks.mean_rank(num_queries)
+        metrics["mrr"] = ranks.mean_reciprocal_rank(num_queries)
+        metrics["f_mr"] = franks.mean_rank(num_queries)
+        metrics["f_mrr"] = franks.mean_reciprocal_rank(num_queries)
+        metrics["auc"] = compute_rank_roc(ranks.as_dict(), num_entities_for_auc)
+        metrics["f_auc"] = compute_rank_roc(franks.as_dict(), num_entities_for_auc)
 
-        for k in hits_k:
-            hits_k[k] = hits_k[k] / (divisor * len(test_data))
-            metrics[f"hits@{k}"] = hits_k[k]
+        for k in HITS_AT_K:
+            metrics[f"hits@{k}"] = ranks.hits_at(k, num_queries)
 
-        for k in f_hits_k:
-            f_hits_k[k] = f_hits_k[k] / (divisor * len(test_data))
-            metrics[f"f_hits@{k}"] = f_hits_k[k]
+        for k in HITS_AT_K:
+            metrics[f"f_hits@{k}"] = franks.hits_at(k, num_queries)
 
         return metrics
  
@@ -343,6 +526,33 @@ class RankingEvaluator(BaseRankingEvaluator):
 
         super().__init__(evaluation_heads_tensor, evaluation_tails_tensor, batch_size, device)
 
+    def score_all_candidates(self, evaluation_model, heads, rels, tails, side, candidates):
+        """
+        Uses the ``score_all_tails`` and ``score_all_heads`` methods of the evaluation model, \
+such as the ones of :class:`mowl.nn.ELModule`, when :meth:`get_scores` is decorated with \
+:func:`scores_gci`, as in the built-in evaluators. Otherwise, returns ``None`` so that tuples \
+are scored with :meth:`get_scores`.
+        """
+        gci_name = getattr(type(self).get_scores, "scored_gci", None)
+        if gci_name != ("gci0" if rels is None else "gci2"):
+            return None
+
+        if side == "head_centric":
+            score_fn = getattr(evaluation_model, "score_all_tails", None)
+        else:
+            score_fn = getattr(evaluation_model, "score_all_heads", None)
+
+        if score_fn is None:
+            return None
+
+        try:
+            if side == "head_centric":
+                return score_fn(heads, rels, candidates=candidates)
+            else:
+                return score_fn(rels, tails, candidates=candidates)
+        except NotImplementedError:
+            return None
+        
     def create_tuples(self, ontology):
         """
         Create tuples from the ontology.
@@ -353,7 +563,8 @@ class RankingEvaluator(BaseRankingEvaluator):
         """
         raise NotImplementedError
 
-    def evaluate(self, evaluation_model, testing_ontology, filter_ontologies = None, mode="head_centric"):
+    def evaluate(self, evaluation_model, testing_ontology, filter_ontologies = None, mode="head_centric",
+                 max_elements=None, top_k=None):
         """
         Evaluate the model on the testing ontology.
         :param testing_ontology: The testing ontology.
@@ -362,6 +573,12 @@ class RankingEvaluator(BaseRankingEvaluator):
         :type filter_ontologies: list, optional
         :param mode: The mode of the evaluation.
         :type mode: str
+        :param max_elements: Memory budget in number of scores. See \
+:meth:`BaseRankingEvaluator.compute_ranking_metrics`.
+        :type max_elements: int, optional
+        :param top_k: Number of predictions to keep per test axiom. See \
+:meth:`BaseRankingEvaluator.compute_ranking_metrics`.
+        :type top_k: int, optional
         :return: The computed ranking metrics.
         :rtype: dict
         """
@@ -374,7 +591,8 @@ class RankingEvaluator(BaseRankingEvaluator):
                 filter_data.append(self.create_tuples(ontology))
             filter_data = th.cat(filter_data, dim=0)
             
-        return self.compute_ranking_metrics(evaluation_model, testing_data, filter_data=filter_data, mode=mode)
+        return self.compute_ranking_metrics(evaluation_model, testing_data, filter_data=filter_data, mode=mode,
+                                            max_elements=max_elements, top_k=top_k)
     
 @versionchanged(version="1.0.0", reason="Updated Evaluator with a new API.")
 class Evaluator:
@@ -430,6 +648,42 @@ class Evaluator:
         raise NotImplementedError
 
     
+    def get_filtering_labels(self, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id, **kwargs):
+        """
+        :return: Index of the known (head, tail) pairs to filter in test mode.
+        :rtype: :class:`mowl.evaluation.filtering.FilterIndex`
+        """
+        raise NotImplementedError
+
+    def get_deductive_labels(self, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id):
+        """
+        :return: Index of the (head, tail) pairs in the deductive closure.
+        :rtype: :class:`mowl.evaluation.filtering.FilterIndex`
+        """
+        raise NotImplementedError
+
+    def create_filter_index(self, tuples, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id):
+        """
+        Builds a :class:`mowl.evaluation.filtering.FilterIndex` from tuples of class ids. \
+Tuples whose head or tail is not an evaluation class are ignored.
+
+        :param tuples: Tuples of shape ``(n, 2)`` or ``(n, 3)``.
+        :type tuples: :class:`torch.Tensor`
+        :rtype: :class:`mowl.evaluation.filtering.FilterIndex`
+        """
+        filter_index = FilterIndex(num_heads, num_tails, device=self.device)
+        if len(tuples) == 0:
+            return filter_index
+
+        tuples = tuples.to(self.device)
+        heads, tails = tuples[:, 0], tuples[:, -1]
+        head_map = _index_map(class_id_to_head_id, int(heads.max()) + 1, device=self.device)
+        tail_map = _index_map(class_id_to_tail_id, int(tails.max()) + 1, device=self.device)
+        heads, tails = head_map[heads], tail_map[tails]
+        known = (heads != -1) & (tails != -1)
+        filter_index.add(heads[known], tails[known])
+        return filter_index
+
     def evaluate_base(self, model, eval_tuples, mode="test",
                       include_deductive_closure=False,
                       exclude_testing_set=False,
@@ -444,9 +698,8 @@ class Evaluator:
 
 
         if include_deductive_closure:
-            mask1 = (self.deductive_closure_tuples.unsqueeze(1) == self.train_tuples).all(dim=-1).any(dim=-1)
-            mask2 = (self.deductive_closure_tuples.unsqueeze(1) == self.valid_tuples).all(dim=-1).any(dim=-1)
-            mask = mask1 | mask2
+            known_tuples = TupleSet(th.cat([self.train_tuples, self.valid_tuples], dim=0))
+            mask = known_tuples.contains(self.deductive_closure_tuples)
             deductive_closure_tuples = self.deductive_closure_tuples[~mask]
 
             if exclude_testing_set:
@@ -456,178 +709,93 @@ class Evaluator:
             
         dataloader = FastTensorDataLoader(eval_tuples, batch_size=self.batch_size, shuffle=False)
 
-        metrics = dict()
-        mrr, fmrr = 0, 0
-        mr, fmr = 0, 0
-        ranks, franks = dict(), dict()
+        head_map = _index_map(self.class_id_to_head_id, len(self.class_to_id), device=self.device)
+        tail_map = _index_map(self.class_id_to_tail_id, len(self.class_to_id), device=self.device)
+
+        filter_index, tail_filter_index = None, None
+        deductive_index, tail_deductive_index = None, None
 
         if mode == "test":
-            hits_k = dict({"1": 0, "3": 0, "10": 0, "50": 0, "100": 0})
-            f_hits_k = dict({"1": 0, "3": 0, "10": 0, "50": 0, "100": 0})
-        
-            filtering_labels = self.get_filtering_labels(num_heads,
-                                                         num_tails,
-                                                         self.class_id_to_head_id,
-                                                         self.class_id_to_tail_id,
-                                                         filter_deductive_closure=filter_deductive_closure)
-            if include_deductive_closure:
-                deductive_labels = self.get_deductive_labels(num_heads, num_tails, **kwargs)
-
-        num_sides = 2
+            filter_index = self.get_filtering_labels(num_heads,
+                                                     num_tails,
+                                                     self.class_id_to_head_id,
+                                                     self.class_id_to_tail_id,
+                                                     filter_deductive_closure=filter_deductive_closure)
+            tail_filter_index = filter_index.transpose()
+
+        if include_deductive_closure:
+            # when evaluating with deductive closure axioms, for a
+            # testing axiom we need to filter the other deductive
+            # closure axioms. Otherwise, we could, in the best case,
+            # score many true axioms at the top and will never get,
+            # for example, good hits@1.
+            deductive_index = self.get_deductive_labels(num_heads, num_tails,
+                                                        self.class_id_to_head_id,
+                                                        self.class_id_to_tail_id)
+            tail_deductive_index = deductive_index.transpose()
+
+        max_rank = max(num_heads, num_tails)
+        ranks = RankHistogram(max_rank, device=self.device)
+        franks = RankHistogram(max_rank, device=self.device)
+        head_side, tail_side = False, False
                 
         with th.no_grad():
             for batch, in dataloader:
+                batch = batch.to(self.device)
                 if batch.shape[1] == 2:
                     heads, tails = batch[:, 0], batch[:, 1]
                 elif batch.shape[1] == 3:
                     heads, tails = batch[:, 0], batch[:, 2]
                 else:
                     raise ValueError("Batch shape must be either (n, 2) or (n, 3)")
-                aux_heads = heads.clone()
-                aux_tails = tails.clone()
-        
-                batch = batch.to(self.device)
+
+                heads = head_map[heads]
+                tails = tail_map[tails]
                 logits_heads, logits_tails = self.get_logits(model, batch, **kwargs)
 
-                if logits_heads is None:
-                    num_sides -= 1
-                else:
-                    for i, head in enumerate(aux_heads):
-                        tail = tails[i]
-                        head = th.where(self.evaluation_heads == head)[0].item()
-                        tail = th.where(self.evaluation_tails == tail)[0].item()
-                        preds = logits_heads[i]
-
-                        if include_deductive_closure:
-                            ded_labels = deductive_labels[head].to(preds.device)
-                            ded_labels[tail] = 1
-                            preds = preds * ded_labels
-
-
-                        order = th.argsort(preds, descending=False)
-                        rank = th.where(order == tail)[0].item() + 1
-                        mr += rank
-                        mrr += 1 / rank
-
-                        if mode == "test":
-                            f_preds = preds * filtering_labels[head].to(preds.device)
-
-                            if include_deductive_closure:
-                                # when evaluating with deductive closure
-                                # axioms, for a testing axiom we need to
-                                # filter the other deductive closure
-                                # axioms. Otherwise, we could, in the best
-                                # case, score many true axioms at the top
-                                # and will never get, for example, good
-                                # hits@1.
-                                ded_labels = deductive_labels[head].to(preds.device)
-                                ded_labels[tail] = 1
-                                f_preds = f_preds * ded_labels
-
-                            f_order = th.argsort(f_preds, descending=False)
-                            f_rank = th.where(f_order == tail)[0].item() + 1
-                            fmr += f_rank
-                            fmrr += 1 / f_rank
-
-
-                        if mode == "test":
-                            for k in hits_k:
-                                if rank <= int(k):
-                                    hits_k[k] += 1
-
-                            for k in f_hits_k:
-                                if f_rank <= int(k):
-                                    f_hits_k[k] += 1
-
-                            if rank not in ranks:
-                                ranks[rank] = 0
-                            ranks[rank] += 1
-
-                            if f_rank not in franks:
-                                franks[f_rank] = 0
-                            franks[f_rank] += 1
-
-                if logits_tails is None:
-                    num_sides -= 1
-                else:
-                            
-                    for i, tail in enumerate(aux_tails):
-                        head = aux_heads[i]
-                        head = th.where(self.evaluation_heads == head)[0].item()
-                        tail = th.where(self.evaluation_tails == tail)[0].item()
-                        preds = logits_tails[i]
-
-                        if include_deductive_closure:
-                            ded_labels = deductive_labels[:, tail].to(preds.device)
-                            ded_labels[head] = 1
-                            preds = preds * ded_labels
-
-                        order = th.argsort(preds, descending=False)
-                        rank = th.where(order == head)[0].item() + 1
-                        mr += rank
-                        mrr += 1 / rank
-
-                        if mode == "test":
-                            f_preds = preds * filtering_labels[:, tail].to(preds.device)
-
-                            if include_deductive_closure:
-                                ded_labels = deductive_labels[:, tail].to(preds.device)
-                                ded_labels[head] = 1
-                                f_preds = f_preds * ded_labels
-
-
-                            f_order = th.argsort(f_preds, descending=False)
-                            f_rank = th.where(f_order == head)[0].item() + 1
-                            fmr += f_rank
-                            fmrr += 1 / f_rank
-
-
-                        if mode == "test":
-                            for k in hits_k:
-                                if rank <= int(k):
-                                    hits_k[k] += 1
-
-                            for k in f_hits_k:
-                                if f_rank <= int(k):
-                                    f_hits_k[k] += 1
-
-                            if rank not in ranks:
-                                ranks[rank] = 0
-                            ranks[rank] += 1
-
-                            if f_rank not in franks:
-                                franks[f_rank] = 0
-                            franks[f_rank] += 1
-            
-                            
-            mr = mr / (num_sides * len(eval_tuples))
-            mrr = mrr / (num_sides * len(eval_tuples))
+                if logits_heads is not None:
+                    head_side = True
+                    self._rank_batch(logits_heads, heads, tails, ranks, franks,
+                                     filter_index, deductive_index)
+
+                if logits_tails is not None:
+                    tail_side = True
+                    self._rank_batch(logits_tails, tails, heads, ranks, franks,
+                                     tail_filter_index, tail_deductive_index)
 
-            metrics["mr"] = mr
-            metrics["mrr"] = mrr
+            num_sides = int(head_side) + int(tail_side)
+            num_queries = num_sides * len(eval_tuples)
+
+            metrics = dict()
+            metrics["mr"] = ranks.mean_rank(num_queries)
+            metrics["mrr"] = ranks.mean_reciprocal_rank(num_queries)
 
             if mode == "test":
-                fmr = fmr / (num_sides * len(eval_tuples))
-                fmrr = fmrr / (num_sides * len(eval_tuples))
-                auc = compute_rank_roc(ranks, num_tails)
-                f_auc = compute_rank_roc(franks, num_tails)
-
-                metrics["f_mr"] = fmr
-                metrics["f_mrr"] = fmrr
-                metrics["auc"] = auc
-                metrics["f_auc"] = f_auc
+                metrics["f_mr"] = franks.mean_rank(num_queries)
+                metrics["f_mrr"] = franks.mean_reciprocal_rank(num_queries)
+                metrics["auc"] = compute_rank_roc(ranks.as_dict(), num_tails)
+                metrics["f_auc"] = compute_rank_roc(franks.as_dict(), num_tails)
                 
-                for k in hits_k:
-                    hits_k[k] = hits_k[k] / (num_sides * len(eval_tuples))
-                    metrics[f"hits@{k}"] = hits_k[k]
+                for k in HITS_AT_K:
+                    metrics[f"hits@{k}"] = ranks.hits_at(k, num_queries)
                     
-                for k in f_hits_k:
-                    f_hits_k[k] = f_hits_k[k] / (num_sides * len(eval_tuples))
-                    metrics[f"f_hits@{k}"] = f_hits_k[k]
+                for k in HITS_AT_K:
+                    metrics[f"f_hits@{k}"] = franks.hits_at(k, num_queries)
 
             metrics = {f"{mode}_{k}": v for k, v in metrics.items()}
             return metrics
 
+    def _rank_batch(self, logits, rows, targets, ranks, franks, filter_index, deductive_index):
+        if deductive_index is not None:
+            logits = logits + deductive_index.additive_mask(rows, exclude=targets).to(logits.device)
+
+        targets = targets.to(logits.device)
+        ranks.update(compute_ranks(logits, targets))
+
+        if filter_index is not None:
+            f_logits = logits + filter_index.additive_mask(rows, exclude=targets).to(logits.device)
+            franks.update(compute_ranks(f_logits, targets))
+
         
     def evaluate(self, *args,
                  include_deductive_closure=False,
@@ -678,6 +846,21 @@ class Evaluator:
                                   filter_deductive_closure=filter_deductive_closure,
                                   **kwargs)
     
+def _index_map(id_dict, size, device="cpu"):
+    """
+    Converts a dictionary from class ids to evaluation positions into a lookup tensor of at \
+least ``size`` elements. Class ids not present in the dictionary are mapped to ``-1``.
+    """
+    if len(id_dict) > 0:
+        size = max(size, max(id_dict) + 1)
+    index_map = - th.ones(size, dtype=th.long, device=device)
+    if len(id_dict) > 0:
+        keys = th.tensor(list(id_dict.keys()), dtype=th.long, device=device)
+        values = th.tensor(list(id_dict.values()), dtype=th.long, device=device)
+        index_map[keys] = values
+    return index_map
+
+
 def compute_rank_roc(ranks, num_entities, method="riemann"):
     if method == "riemann":
         fn = riemann_sum
@@ -0,0 +1,251 @@
+import torch as th
+
+
+class FilterIndex():
+    """
+    Sparse store of known (head, tail) pairs used to compute filtered ranking metrics. Pairs \
+are kept in compressed sparse row (CSR) format keyed by head index, so memory grows with the \
+number of known pairs instead of with ``num_heads * num_tails``. Dense masks are only \
+materialized for the rows requested at evaluation time.
+
+    :param num_heads: Number of rows of the index (i.e., number of evaluation heads).
+    :type num_heads: int
+    :param num_tails: Number of columns of the index (i.e., number of evaluation tails).
+    :type num_tails: int
+    :param device: The device where the index is stored. Defaults to ``"cpu"``.
+    :type device: str, optional
+    """
+
+    def __init__(self, num_heads, num_tails, device="cpu"):
+        self.num_heads = num_heads
+        self.num_tails = num_tails
+        self.device = device
+
+        self.indptr = th.zeros(num_heads + 1, dtype=th.long, device=device)
+        self.indices = th.zeros(0, dtype=th.long, device=device)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def pairs(self):
+        """
+        Returns the stored pairs.
+
+        :rtype: tuple(:class:`torch.Tensor`, :class:`torch.Tensor`)
+        """
+        row_lengths = self.indptr[1:] - self.indptr[:-1]
+        heads = th.repeat_interleave(th.arange(self.num_heads, device=self.device), row_lengths)
+        return heads, self.indices
+
+    def add(self, heads, tails):
+        """
+        Adds pairs to the index. Duplicated pairs are stored only once.
+
+        :param heads: Row indices in the range ``[0, num_heads)``.
+        :type heads: :class:`torch.Tensor`
+        :param tails: Column indices in the range ``[0, num_tails)``.
+        :type tails: :class:`torch.Tensor`
+        """
+        heads = heads.to(self.device).long()
+        tails = tails.to(self.device).long()
+
+        old_heads, old_tails = self.pairs()
+        keys = th.cat([old_heads * self.num_tails + old_tails, heads * self.num_tails + tails])
+        keys = th.unique(keys, sorted=True)
+
+        rows = keys // self.num_tails
+        row_lengths = th.bincount(rows, minlength=self.num_heads)
+        self.indptr = th.zeros(self.num_heads + 1, dtype=th.long, device=self.device)
+        self.indptr[1:] = th.cumsum(row_lengths, dim=0)
+        self.indices = keys % self.num_tails
+
+    def transpose(self):
+        """
+        Returns a new index keyed by tail, which is used for tail-centric evaluation.
+
+        :rtype: :class:`FilterIndex`
+        """
+        heads, tails = self.pairs()
+        transposed = FilterIndex(self.num_tails, self.num_heads, device=self.device)
+        transposed.add(tails, heads)
+        return transposed
+
+    def mask(self, rows, exclude=None, column_range=None):
+        """
+        Materializes the dense boolean mask for the given rows.
+
+        :param rows: Row indices of the current batch.
+        :type rows: :class:`torch.Tensor`
+        :param exclude: For each row, a column that must not be masked (usually the \
+target entity). Defaults to ``None``.
+        :type exclude: :class:`torch.Tensor`, optional
+        :param column_range: Pair ``(start, end)`` restricting the mask to the columns in \
+``[start, end)``. Defaults to ``None``, which means all columns.
+        :type column_range: tuple(int, int), optional
+        :return: Boolean tensor of shape ``(len(rows), end - start)``.
+        :rtype: :class:`torch.Tensor`
+        """
+        start, end = (0, self.num_tails) if column_range is None else column_range
+
+        rows = rows.to(self.device)
+        starts = self.indptr[rows]
+        row_lengths = self.indptr[rows + 1] - starts
+
+        batch_rows = th.repeat_interleave(th.arange(len(rows), device=self.device), row_lengths)
+        offsets = th.arange(len(batch_rows), device=self.device) - \
+            th.repeat_interleave(th.cumsum(row_lengths, dim=0) - row_lengths, row_lengths)
+        columns = self.indices[starts[batch_rows] + offsets]
+
+        in_range = (columns >= start) & (columns < end)
+        batch_rows, columns = batch_rows[in_range], columns[in_range] - start
+
+        mask = th.zeros((len(rows), end - start), dtype=th.bool, device=self.device)
+        mask[batch_rows, columns] = True
+
+        if exclude is not None:
+            exclude = exclude.to(self.device) - start
+            in_range = (exclude >= 0) & (exclude < end - start)
+            batch_rows = th.arange(len(rows), device=self.device)[in_range]
+            mask[batch_rows, exclude[in_range]] = False
+        return mask
+
+    def additive_mask(self, rows, exclude=None, column_range=None, value=float("inf")):
+        """
+        Materializes a mask to be added to a block of scores. Masked entries get ``value`` and \
+the rest get ``0``. Since lower scores are better, the default value of ``inf`` moves known \
+pairs to the bottom of the ranking regardless of the sign of the scores.
+
+        :param rows: Row indices of the current batch.
+        :type rows: :class:`torch.Tensor`
+        :param exclude: For each row, a column that must not be masked. Defaults to ``None``.
+        :type exclude: :class:`torch.Tensor`, optional
+        :param column_range: Pair ``(start, end)`` restricting the mask to the columns in \
+``[start, end)``. Defaults to ``None``.
+        :type column_range: tuple(int, int), optional
+        :param value: Value added to the masked entries. Defaults to ``inf``.
+        :type value: float, optional
+        :rtype: :class:`torch.Tensor`
+        """
+        mask = self.mask(rows, exclude=exclude, column_range=column_range)
+        additive = th.zeros(mask.shape, dtype=th.float, device=self.device)
+        return additive.masked_fill_(mask, value)
+
+
+class TupleSet():
+    """
+    Set of integer tuples (e.g., pairs or triples of entity ids) encoded as single ``int64`` \
+keys. Each tuple :math:`(x_1, \\ldots, x_k)` is mapped to :math:`\\sum_i x_i \\cdot n^{k-i}`, where \
+:math:`n` is the number of entities, and the keys are kept sorted. Membership, difference and \
+intersection queries are answered with ``torch.searchsorted`` in :math:`O(m \\log n)` time and \
+memory linear in the number of tuples, instead of comparing every pair of tuples.
+
+    :param tuples: Tensor of shape ``(n, k)`` with non-negative integer entries.
+    :type tuples: :class:`torch.Tensor`
+    :param num_entities: Upper bound (exclusive) of the entries of the tuples. Defaults to \
+``None``, which takes the largest entry plus one.
+    :type num_entities: int, optional
+    """
+
+    def __init__(self, tuples, num_entities=None):
+        if not th.is_tensor(tuples):
+            raise TypeError("Parameter tuples must be of type torch.Tensor.")
+        if tuples.numel() == 0:
+            tuples = tuples.reshape(0, tuples.shape[-1] if tuples.dim() == 2 else 0)
+        elif tuples.dim() != 2:
+            raise ValueError("Parameter tuples must be a tensor of shape (n, k).")
+
+        tuples = tuples.long()
+        max_entry = int(tuples.max()) + 1 if len(tuples) > 0 else 1
+        if num_entities is None:
+            num_entities = max_entry
+        elif num_entities < max_entry:
+            raise ValueError("Parameter num_entities must be greater than the entries of tuples.")
+        if num_entities ** tuples.shape[1] >= 2 ** 63:
+            raise ValueError("Tuples are too large to be encoded as int64 keys.")
+
+        self.arity = tuples.shape[1]
+        self.num_entities = num_entities
+        self.device = tuples.device
+        self.keys = th.unique(self.encode(tuples), sorted=True)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def encode(self, tuples):
+        """
+        Encodes tuples into ``int64`` keys.
+
+        :param tuples: Tensor of shape ``(m, k)``.
+        :type tuples: :class:`torch.Tensor`
+        :rtype: :class:`torch.Tensor`
+        """
+        tuples = tuples.to(self.device).long()
+        keys = th.zeros(len(tuples), dtype=th.long, device=self.device)
+        for column in range(self.arity):
+            keys = keys * self.num_entities + tuples[:, column]
+        return keys
+
+    def decode(self, keys):
+        """
+        Decodes ``int64`` keys into tuples.
+
+        :param keys: Tensor of shape ``(m,)``.
+        :type keys: :class:`torch.Tensor`
+        :rtype: :class:`torch.Tensor`
+        """
+        columns = []
+        for _ in range(self.arity):
+            columns.append(keys % self.num_entities)
+            keys = keys // self.num_entities
+        return th.stack(columns[::-1], dim=1)
+
+    @property
+    def tuples(self):
+        """
+        Returns the unique tuples of the set in sorted order.
+
+        :rtype: :class:`torch.Tensor`
+        """
+        return self.decode(self.keys)
+
+    def contains(self, tuples):
+        """
+        Checks which of the given tuples belong to the set.
+
+        :param tuples: Tensor of shape ``(m, k)``.
+        :type tuples: :class:`torch.Tensor`
+        :return: Boolean tensor of shape ``(m,)``.
+        :rtype: :class:`torch.Tensor`
+        """
+        tuples = tuples.to(self.device).long()
+        if len(self.keys) == 0 or len(tuples) == 0:
+            return th.zeros(len(tuples), dtype=th.bool, device=self.device)
+
+        in_range = ((tuples >= 0) & (tuples < self.num_entities)).all(dim=1)
+        keys = self.encode(tuples.clamp(0, self.num_entities - 1))
+        positions = th.searchsorted(self.keys, keys).clamp(max=len(self.keys) - 1)
+        return in_range & (self.keys[positions] == keys)
+
+    def difference(self, other):
+        """
+        Returns the tuples of the set that are not in ``other``.
+
+        :param other: Another set or a tensor of tuples.
+        :type other: :class:`TupleSet` or :class:`torch.Tensor`
+        :rtype: :class:`torch.Tensor`
+        """
+        other = other if isinstance(other, TupleSet) else TupleSet(other)
+        tuples = self.tuples
+        return tuples[~other.contains(tuples)]
+
+    def intersection(self, other):
+        """
+        Returns the tuples of the set that are also in ``other``.
+
+        :param other: Another set or a tensor of tuples.
+        :type other: :class:`TupleSet` or :class:`torch.Tensor`
+        :rtype: :class:`torch.Tensor`
+        """
+        other = other if isinstance(other, TupleSet) else TupleSet(other)
+        tuples = self.tuples
+        return tuples[other.contains(tuples)]
@@ -1,5 +1,6 @@
 from mowl.evaluation import Evaluator, RankingEvaluator
-from mowl.projection import TaxonomyWithRelationsProjector, Edge
+from mowl.evaluation.base import scores_gci
+from mowl.projection import TaxonomyWithRelationsProjector, Edge, get_projection_cache
 
 import torch as th
 
@@ -9,7 +10,7 @@ class PPIEvaluatorOld(Evaluator):
 
     def create_tuples(self, ontology):
         projector = TaxonomyWithRelationsProjector(relations=["http://interacts_with"])
-        edges = projector.project(ontology)
+        edges = get_projection_cache().project(projector, ontology)
 
         classes, relations = Edge.get_entities_and_relations(edges)
 
@@ -49,14 +50,8 @@ class PPIEvaluatorOld(Evaluator):
     def get_filtering_labels(self, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id, **kwargs):
 
         filtering_tuples = th.cat([self.train_tuples, self.valid_tuples], dim=0)
-        filtering_labels = th.ones((num_heads, num_tails), dtype=th.float)
-
-        for head, rel, tail in filtering_tuples:
-            head = class_id_to_head_id[head.item()]
-            tail = class_id_to_tail_id[tail.item()]
-            filtering_labels[head, tail] = 10000
-        
-        return filtering_labels
+        return self.create_filter_index(filtering_tuples, num_heads, num_tails,
+                                        class_id_to_head_id, class_id_to_tail_id)
     
 
 
@@ -66,7 +61,7 @@ class PPIEvaluator(RankingEvaluator):
 
     def create_tuples(self, ontology):
         projector = TaxonomyWithRelationsProjector(relations=["http://interacts_with"])
-        edges = projector.project(ontology)
+        edges = get_projection_cache().project(projector, ontology)
 
         classes, relations = Edge.get_entities_and_relations(edges)
 
@@ -85,6 +80,7 @@ class PPIEvaluator(RankingEvaluator):
         
         return th.tensor(edges_indexed, dtype=th.long)
 
+    @scores_gci("gci2")
     def get_scores(self, model, batch):
         scores = model(batch, "gci2")
         return scores
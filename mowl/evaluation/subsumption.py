@@ -1,5 +1,6 @@
-from mowl.evaluation import Evaluator, RankingEvaluator
-from mowl.projection import TaxonomyProjector, Edge
+from mowl.evaluation import Evaluator, RankingEvaluator, TupleSet
+from mowl.evaluation.base import scores_gci
+from mowl.projection import TaxonomyProjector, Edge, get_projection_cache
 import torch as th
 
 
@@ -9,7 +10,7 @@ class SubsumptionEvaluatorOld(Evaluator):
 
     def create_tuples(self, ontology):
         projector = TaxonomyProjector()
-        edges = projector.project(ontology)
+        edges = get_projection_cache().project(projector, ontology)
 
         classes, relations = Edge.get_entities_and_relations(edges)
 
@@ -42,13 +43,13 @@ class SubsumptionEvaluatorOld(Evaluator):
         return logits_heads, logits_tails
 
     
-    def get_filtering_labels(self, num_heads, num_tails, **kwargs):
+    def get_filtering_labels(self, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id, **kwargs):
         filter_deductive_closure = kwargs["filter_deductive_closure"]
         
         if filter_deductive_closure:
             # take deductive closure tuples that are not in the testing tuples
 
-            mask = (self.deductive_closure_tuples.unsqueeze(1) == self.test_tuples).all(dim=-1).any(dim=-1)
+            mask = TupleSet(self.test_tuples).contains(self.deductive_closure_tuples)
             deductive_closure_tuples = self.deductive_closure_tuples[~mask]
             
             
@@ -56,24 +57,14 @@ class SubsumptionEvaluatorOld(Evaluator):
         else:
             filtering_tuples = th.cat([self.train_tuples, self.valid_tuples], dim=0)
 
-        filtering_labels = th.ones((num_heads, num_tails), dtype=th.float)
-
-        for head, tail in filtering_tuples:
-            filtering_labels[head, tail] = 10000
-        
-        return filtering_labels
+        return self.create_filter_index(filtering_tuples, num_heads, num_tails,
+                                        class_id_to_head_id, class_id_to_tail_id)
     
 
 
     def get_deductive_labels(self, num_heads, num_tails, class_id_to_head_id, class_id_to_tail_id):
-        deductive_labels = th.ones((num_heads, num_tails), dtype=th.float)
-
-        for head, tail in self.deductive_closure_tuples:
-            head = class_id_to_head_id[head.item()]
-            tail = class_id_to_tail_id[tail.item()]
-            deductive_labels[head, tail] = 10000
-        
-        return deductive_labels
+        return self.create_filter_index(self.deductive_closure_tuples, num_heads, num_tails,
+                                        class_id_to_head_id, class_id_to_tail_id)
 
 
 
@@ -83,7 +74,7 @@ class SubsumptionEvaluator(RankingEvaluator):
 
     def create_tuples(self, ontology):
         projector = TaxonomyProjector()
-        edges = projector.project(ontology)
+        edges = get_projection_cache().project(projector, ontology)
 
         classes, relations = Edge.get_entities_and_relations(edges)
 
@@ -99,6 +90,7 @@ class SubsumptionEvaluator(RankingEvaluator):
         
         return th.tensor(edges_indexed, dtype=th.long)
 
+    @scores_gci("gci0")
     def get_scores(self, model, batch):
         scores = model(batch, "gci0")
         return scores
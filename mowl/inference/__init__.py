@@ -1 +1,2 @@
 from .base import Inferrer
+from .engine import ELInferenceEngine
@@ -1,7 +1,10 @@
-from tqdm import tqdm
 import re
 import itertools as it
+import logging
 import numpy as np
+import torch as th
+
+logger = logging.getLogger(__name__)
 
 
 class AxiomScoring():
@@ -13,18 +16,28 @@ class AxiomScoring():
 
     :param patterns: Collection of patterns accepted by the scoring method
     :type patterns: list
+    :param batch_method: Scores many data points with one call. It receives a \
+    :class:`torch.Tensor` of shape ``(n, k)`` with the positions of the ``k`` pattern variables in \
+    ``class_list`` or ``property_list`` and returns ``n`` scores. Defaults to ``None``, which \
+    calls ``method`` once per data point.
+    :type batch_method: callable, optional
     """
 
-    def __init__(self, patterns, method, class_list, property_list=None, canonical_pattern=0):
+    def __init__(self, patterns, method, class_list, property_list=None, canonical_pattern=0,
+                 batch_method=None):
+        if batch_method is not None and not callable(batch_method):
+            raise TypeError("Optional parameter batch_method must be callable.")
+
         self.patterns = set(patterns)
         self.canonical_pattern = patterns[canonical_pattern]
         self.method = method
+        self.batch_method = batch_method
         self.class_list = class_list
         self.property_list = [] if property_list is None else property_list
 
     def is_pattern_correct(self, pattern):
         pattern = self.canonical_expression(pattern)
-        print(pattern)
+        logger.debug(f"Canonical pattern {pattern}")
         if pattern in self.patterns:
             return True
         else:
@@ -47,36 +60,40 @@ class AxiomScoring():
         pattern_decomp = re.split("\s+", pattern)
         return pattern_decomp
 
-    def pattern_to_data_points(self, pattern):
-        """This method will receive any accepted pattern and transform it into data points to be \
-            accepted by the method.
+    def pattern_variables(self, pattern):
+        """Returns the variables of a pattern as pairs ``(kind, regex)``, where ``kind`` is \
+            ``"c"`` for classes and ``"p"`` for properties.
         """
         pattern_decomp = self.standardize_pattern(pattern)
 
         objects = []
-        regex = re.compile("[cp]\?.*?\?")
+        regex = re.compile("[cp]\\?.*?\\?")
         for pat in pattern_decomp:
             match = regex.fullmatch(pat)
             if match:
                 objects.append(match.group(0))
 
-        # objects =re.findall("[cr]\?.*?\?", pattern)
+        # objects =re.findall("[cr]\\?.*?\\?", pattern)
         objects = [x[:-1] for x in objects]
+        return [(obj[0], obj[2:]) for obj in objects]
+
+    def variable_entities(self, kind):
+        """Returns the list of entities that can be assigned to a variable of the given kind.
+        """
+        return self.class_list if kind == "c" else self.property_list
 
+    def pattern_to_data_points(self, pattern):
+        """This method will receive any accepted pattern and transform it into data points to be \
+            accepted by the method.
+        """
         objects_sub_lists = []
 
-        for obj in objects:
-            regex = obj[2:]
-            print(f"regex {regex}")
+        for kind, regex in self.pattern_variables(pattern):
+            logger.debug(f"regex {regex}")
             regex = re.compile(regex)
 
-            if obj.startswith("c"):
-                iter_list = self.class_list
-            elif obj.startswith("p"):
-                iter_list = self.property_list
-
             curr_list = []
-            for name in iter_list:
+            for name in self.variable_entities(kind):
 
                 match = regex.fullmatch(name)
                 if match:
@@ -84,6 +101,99 @@ class AxiomScoring():
             objects_sub_lists.append(curr_list)
         return it.product(*objects_sub_lists)
 
+    def pattern_to_index_arrays(self, pattern):
+        """Resolves each variable of a pattern to the positions of the matching entities in \
+            ``class_list`` or ``property_list``.
+
+        :rtype: list of :class:`numpy.ndarray`
+        """
+        index_arrays = []
+        for kind, regex in self.pattern_variables(pattern):
+            regex = re.compile(regex)
+            entities = self.variable_entities(kind)
+            positions = [i for i, name in enumerate(entities) if regex.fullmatch(name)]
+            index_arrays.append(np.array(positions, dtype=np.int64))
+        return index_arrays
+
+    def iter_index_blocks(self, pattern, batch_size=65536):
+        """Generates the Cartesian product of the entities matching each variable of the \
+            pattern, in the order of :func:`itertools.product`, as blocks of at most \
+            ``batch_size`` rows. Each block is an array of shape ``(n, k)`` of positions in \
+            ``class_list`` or ``property_list``.
+
+        :rtype: generator of :class:`numpy.ndarray`
+        """
+        index_arrays = self.pattern_to_index_arrays(pattern)
+        sizes = [len(indices) for indices in index_arrays]
+        total = int(np.prod(sizes, dtype=np.int64))
+
+        for start in range(0, total, batch_size):
+            flat = np.arange(start, min(start + batch_size, total), dtype=np.int64)
+            columns = np.unravel_index(flat, sizes)
+            yield np.stack([indices[column] for indices, column in zip(index_arrays, columns)],
+                           axis=1)
+
+    def score_blocks(self, pattern, batch_size=65536):
+        """Scores all the axioms matching a pattern in blocks. If ``batch_method`` is defined, \
+            each block is scored with a single call.
+
+        :param pattern: The axiom pattern.
+        :type pattern: str
+        :param batch_size: Maximum number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :return: Pairs ``(indices, scores)`` where ``indices`` has shape ``(n, k)`` and \
+            ``scores`` has shape ``(n,)``.
+        :rtype: generator of tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+        if not isinstance(batch_size, int):
+            raise TypeError("Optional parameter batch_size must be of type int.")
+
+        self.is_pattern_correct(self.canonical_expression(pattern))
+        kinds = [kind for kind, _ in self.pattern_variables(pattern)]
+        return self._score_blocks(pattern, batch_size, kinds)
+
+    def _score_blocks(self, pattern, batch_size, kinds):
+        with th.no_grad():
+            for indices in self.iter_index_blocks(pattern, batch_size):
+                if self.batch_method is not None:
+                    scores = self.batch_method(th.from_numpy(indices))
+                    scores = scores.detach().cpu().numpy().reshape(-1)
+                else:
+                    entities = [self.variable_entities(kind) for kind in kinds]
+                    scores = np.array([
+                        self.method(tuple(entities[i][j] for i, j in enumerate(row))).item()
+                        for row in indices.tolist()])
+                yield indices, scores
+
+    def score_arrays(self, pattern, batch_size=65536):
+        """Scores all the axioms matching a pattern and returns the results as arrays. Use \
+            :meth:`render` to obtain the axioms as strings.
+
+        :param pattern: The axiom pattern.
+        :type pattern: str
+        :param batch_size: Maximum number of axioms scored at once. Defaults to ``65536``.
+        :type batch_size: int, optional
+        :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+        """
+        num_variables = len(self.pattern_variables(pattern))
+        all_indices = [np.zeros((0, num_variables), dtype=np.int64)]
+        all_scores = [np.zeros(0)]
+        for indices, scores in self.score_blocks(pattern, batch_size):
+            all_indices.append(indices)
+            all_scores.append(scores)
+        return np.concatenate(all_indices), np.concatenate(all_scores)
+
+    def render(self, indices, pattern):
+        """Renders the axioms given by rows of positions returned by :meth:`score_arrays`.
+
+        :rtype: list of str
+        """
+        can_pattern = self.canonical_expression(pattern)
+        kinds = [kind for kind, _ in self.pattern_variables(pattern)]
+        columns = [np.asarray(self.variable_entities(kind), dtype=object)[indices[:, i]]
+                   for i, kind in enumerate(kinds)]
+        return [self.inverse(point, can_pattern) for point in zip(*columns)]
+
     def inverse(self, point, pattern):
         output = []
         pattern_decomp = pattern.split(" ")
@@ -97,14 +207,6 @@ class AxiomScoring():
         assert len(point) == 0
         return " ".join(output)
 
-    def score(self, pattern):
-        can_pattern = self.canonical_expression(pattern)
-        self.is_pattern_correct(can_pattern)
-        data_points = self.pattern_to_data_points(pattern)
-
-        preds = dict()
-        for point in tqdm(data_points):
-
-            preds[self.inverse(point, can_pattern)] = self.method(point).cpu().detach().item()
-
-        return preds
+    def score(self, pattern, batch_size=65536):
+        indices, scores = self.score_arrays(pattern, batch_size=batch_size)
+        return dict(zip(self.render(indices, pattern), scores.tolist()))
@@ -11,7 +11,7 @@ class CosineSimilarityInfer(AxiomScoring):
         method = CosineSimilarity(embeddings)
         class_list = list(embeddings.keys())
         patterns = [f"c?? SubClassOf {relation} some c??"]
-        super().__init__(patterns, method, class_list)
+        super().__init__(patterns, method, class_list, batch_method=method.score_indices)
 
     def embeddings_to_dict(self, embeddings):
         embeddings_dict = dict()
@@ -56,3 +56,13 @@ class CosineSimilarity(nn.Module):
 
         x = th.sum(srcs * dsts, dim=1)
         return 1 - th.sigmoid(x)
+
+    def score_indices(self, data):
+        """Scores a batch of class pairs given as a tensor of shape ``(n, 2)`` of class \
+indices.
+        """
+        data = data.to(self.device)
+        srcs = self.class_embedding_layer(data[:, 0])
+        dsts = self.class_embedding_layer(data[:, 1])
+        x = th.sum(srcs * dsts, dim=1)
+        return 1 - th.sigmoid(x)
@@ -0,0 +1,304 @@
+import os
+
+import numpy as np
+import pandas as pd
+import torch as th
+
+from mowl.evaluation.filtering import FilterIndex
+
+
+class ELInferenceEngine():
+    """
+    Predicts new axioms from an :math:`\\mathcal{EL}` embedding module by scoring every query \
+against every candidate class. Scores are computed in blocks of at most ``max_elements`` values \
+and only the ``top_k`` best candidates of each query are kept, so memory does not grow with the \
+square of the number of classes. Lower scores are considered better, as in the losses of \
+:class:`mowl.nn.ELModule`.
+
+    Modules implementing ``score_all_tails`` are scored directly over their embedding tables. \
+Other modules are scored through ``forward`` over the expanded tuples of each block.
+
+    :param module: The embedding module.
+    :type module: :class:`mowl.nn.ELModule`
+    :param class_index_dict: Dictionary mapping class names to the ids used by ``module``.
+    :type class_index_dict: dict
+    :param object_property_index_dict: Dictionary mapping object property names to the ids \
+used by ``module``. Required by :meth:`infer_existentials`. Defaults to ``None``.
+    :type object_property_index_dict: dict, optional
+    :param max_elements: Maximum number of scores computed at a time. Defaults to ``2 ** 24``.
+    :type max_elements: int, optional
+    :param device: Device where scores are computed. Defaults to ``"cpu"``.
+    :type device: str, optional
+    """
+
+    def __init__(self, module, class_index_dict, object_property_index_dict=None,
+                 max_elements=2 ** 24, device="cpu"):
+
+        if not isinstance(class_index_dict, dict):
+            raise TypeError("Parameter class_index_dict must be of type dict.")
+        if object_property_index_dict is not None and \
+           not isinstance(object_property_index_dict, dict):
+            raise TypeError("Optional parameter object_property_index_dict must be of type dict.")
+        if not isinstance(max_elements, int):
+            raise TypeError("Optional parameter max_elements must be of type int.")
+        if max_elements < 1:
+            raise ValueError("Optional parameter max_elements must be positive.")
+
+        self.module = module
+        self.class_index_dict = class_index_dict
+        self.object_property_index_dict = object_property_index_dict
+        self.max_elements = max_elements
+        self.device = device
+
+        self._class_names = _names_by_id(class_index_dict)
+        self._property_names = None
+        if object_property_index_dict is not None:
+            self._property_names = _names_by_id(object_property_index_dict)
+
+    def infer_subclasses(self, subclasses=None, superclasses=None, top_k=10, known_axioms=None,
+                         out_file=None):
+        """
+        Predicts axioms :math:`C \\sqsubseteq D` by scoring them as GCI0 axioms. Axioms with \
+:math:`C = D` are never predicted.
+
+        :param subclasses: Names of the :math:`C` classes. Defaults to ``None``, which means \
+all classes.
+        :type subclasses: list of str, optional
+        :param superclasses: Names of the :math:`D` classes. Defaults to ``None``, which means \
+all classes.
+        :type superclasses: list of str, optional
+        :param top_k: Number of predictions kept per subclass. Defaults to ``10``.
+        :type top_k: int, optional
+        :param known_axioms: Pairs of class ids ``(C, D)`` that must not be predicted, for \
+example the axioms of the training ontology. Defaults to ``None``.
+        :type known_axioms: :class:`torch.Tensor`, optional
+        :param out_file: Path of a ``.tsv`` or ``.parquet`` file where predictions are written \
+as they are computed. Defaults to ``None``, which returns them instead.
+        :type out_file: str, optional
+        :return: If ``out_file`` is ``None``, a data frame with columns ``subclass``, \
+``superclass`` and ``score``, sorted by subclass and score.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        subclass_ids = self._class_ids(subclasses)
+        superclass_ids = self._class_ids(superclasses)
+
+        filter_index = None
+        if known_axioms is not None:
+            filter_index = self._filter_index(known_axioms, [subclass_ids], superclass_ids)
+
+        def score(rows, candidates):
+            return self._score(subclass_ids[rows], None, candidates)
+
+        predictions = self._top_k(score, len(subclass_ids), superclass_ids, subclass_ids, top_k,
+                                  filter_index)
+
+        def to_frame(rows, candidates, scores):
+            return pd.DataFrame({"subclass": self._class_names[subclass_ids[rows].cpu().numpy()],
+                                 "superclass": self._class_names[candidates.cpu().numpy()],
+                                 "score": scores.cpu().numpy()})
+
+        return _write(predictions, to_frame, out_file)
+
+    def infer_existentials(self, subclasses=None, properties=None, fillers=None, top_k=10,
+                           known_axioms=None, out_file=None):
+        """
+        Predicts axioms :math:`C \\sqsubseteq \\exists R.D` by scoring them as GCI2 axioms. \
+Each pair :math:`(C, R)` is a query whose candidates are the fillers :math:`D`. Axioms with \
+:math:`C = D` are never predicted.
+
+        :param subclasses: Names of the :math:`C` classes. Defaults to ``None``, which means \
+all classes.
+        :type subclasses: list of str, optional
+        :param properties: Names of the :math:`R` object properties. Defaults to ``None``, which \
+means all object properties.
+        :type properties: list of str, optional
+        :param fillers: Names of the :math:`D` classes. Defaults to ``None``, which means all \
+classes.
+        :type fillers: list of str, optional
+        :param top_k: Number of predictions kept per pair :math:`(C, R)`. Defaults to ``10``.
+        :type top_k: int, optional
+        :param known_axioms: Triples of ids ``(C, R, D)`` that must not be predicted. Defaults \
+to ``None``.
+        :type known_axioms: :class:`torch.Tensor`, optional
+        :param out_file: Path of a ``.tsv`` or ``.parquet`` file where predictions are written \
+as they are computed. Defaults to ``None``, which returns them instead.
+        :type out_file: str, optional
+        :return: If ``out_file`` is ``None``, a data frame with columns ``subclass``, \
+``property``, ``filler`` and ``score``.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if self.object_property_index_dict is None:
+            raise ValueError("Parameter object_property_index_dict is required to infer \
+existential axioms.")
+
+        subclass_ids = self._class_ids(subclasses)
+        property_ids = self._ids(properties, self.object_property_index_dict)
+        filler_ids = self._class_ids(fillers)
+
+        # Queries are all the (subclass, property) pairs, subclass-major
+        num_properties = len(property_ids)
+        query_subclasses = subclass_ids.repeat_interleave(num_properties)
+        query_properties = property_ids.repeat(len(subclass_ids))
+
+        filter_index = None
+        if known_axioms is not None:
+            filter_index = self._filter_index(known_axioms, [subclass_ids, property_ids],
+                                              filler_ids)
+
+        def score(rows, candidates):
+            return self._score(query_subclasses[rows], query_properties[rows], candidates)
+
+        predictions = self._top_k(score, len(query_subclasses), filler_ids, query_subclasses,
+                                  top_k, filter_index)
+
+        def to_frame(rows, candidates, scores):
+            return pd.DataFrame({
+                "subclass": self._class_names[query_subclasses[rows].cpu().numpy()],
+                "property": self._property_names[query_properties[rows].cpu().numpy()],
+                "filler": self._class_names[candidates.cpu().numpy()],
+                "score": scores.cpu().numpy()})
+
+        return _write(predictions, to_frame, out_file)
+
+    def _ids(self, names, index_dict):
+        if names is None:
+            ids = sorted(index_dict.values())
+        else:
+            ids = [index_dict[name] for name in names]
+        return th.tensor(ids, dtype=th.long, device=self.device)
+
+    def _class_ids(self, names):
+        return self._ids(names, self.class_index_dict)
+
+    def _filter_index(self, known_axioms, query_ids, candidate_ids):
+        # Maps the known axioms to (query position, candidate position) pairs. Axioms with
+        # entities outside of the queries or the candidates are ignored.
+        known_axioms = known_axioms.to(self.device).long()
+        rows = th.zeros(len(known_axioms), dtype=th.long, device=self.device)
+        valid = th.ones(len(known_axioms), dtype=th.bool, device=self.device)
+        for column, ids in enumerate(query_ids):
+            positions, found = _positions(ids, known_axioms[:, column])
+            rows = rows * len(ids) + positions
+            valid &= found
+        columns, found = _positions(candidate_ids, known_axioms[:, -1])
+        valid &= found
+
+        num_rows = int(np.prod([len(ids) for ids in query_ids]))
+        filter_index = FilterIndex(num_rows, len(candidate_ids), device=self.device)
+        filter_index.add(rows[valid], columns[valid])
+        return filter_index
+
+    def _score(self, heads, rels, candidates):
+        score_fn = getattr(self.module, "score_all_tails", None)
+        if score_fn is not None:
+            try:
+                return score_fn(heads, rels, candidates=candidates)
+            except NotImplementedError:
+                pass
+
+        num_candidates = len(candidates)
+        columns = [heads.repeat_interleave(num_candidates)]
+        if rels is not None:
+            columns.append(rels.repeat_interleave(num_candidates))
+        columns.append(candidates.repeat(len(heads)))
+        gci_name = "gci0" if rels is None else "gci2"
+        scores = self.module(th.stack(columns, dim=1), gci_name)
+        return scores.view(len(heads), num_candidates)
+
+    @th.no_grad()
+    def _top_k(self, score, num_rows, candidate_ids, query_classes, top_k, filter_index):
+        # Yields (rows, candidates, scores) for each block of queries. Filtered candidates and
+        # the query class itself get an infinite score and are never returned.
+        num_candidates = len(candidate_ids)
+        if num_rows == 0 or num_candidates == 0:
+            return
+        top_k = min(top_k, num_candidates)
+        chunk_size = min(num_candidates, self.max_elements)
+        block_size = max(1, self.max_elements // chunk_size)
+
+        for block_start in range(0, num_rows, block_size):
+            rows = th.arange(block_start, min(block_start + block_size, num_rows),
+                             device=self.device)
+            top_scores = th.zeros((len(rows), 0), device=self.device)
+            top_indices = th.zeros((len(rows), 0), dtype=th.long, device=self.device)
+
+            for start in range(0, num_candidates, chunk_size):
+                end = min(start + chunk_size, num_candidates)
+                candidates = candidate_ids[start:end]
+                scores = score(rows, candidates).float()
+                if filter_index is not None:
+                    scores = scores + filter_index.additive_mask(rows, column_range=(start, end))
+                is_query = candidates.unsqueeze(0) == query_classes[rows].unsqueeze(1)
+                scores = scores.masked_fill(is_query, float("inf"))
+
+                positions = th.arange(start, end, device=self.device).repeat(len(rows), 1)
+                top_scores = th.cat([top_scores, scores], dim=1)
+                top_indices = th.cat([top_indices, positions], dim=1)
+                k = min(top_k, top_scores.shape[1])
+                top_scores, order = th.topk(top_scores, k, dim=1, largest=False)
+                top_indices = top_indices.gather(1, order)
+
+            keep = th.isfinite(top_scores)
+            block_rows = rows.unsqueeze(1).expand_as(top_scores)[keep]
+            yield block_rows, candidate_ids[top_indices[keep]], top_scores[keep]
+
+
+def _names_by_id(index_dict):
+    names = np.empty(max(index_dict.values(), default=-1) + 1, dtype=object)
+    for name, idx in index_dict.items():
+        names[idx] = name
+    return names
+
+
+def _positions(ids, values):
+    # Position of each value in ids, and whether it was found
+    sorted_ids, order = th.sort(ids)
+    positions = th.searchsorted(sorted_ids, values.contiguous()).clamp(max=max(len(ids) - 1, 0))
+    if len(ids) == 0:
+        return positions, th.zeros(len(values), dtype=th.bool, device=values.device)
+    found = sorted_ids[positions] == values
+    return order[positions], found
+
+
+def _write(predictions, to_frame, out_file):
+    if out_file is None:
+        frames = [to_frame(*block) for block in predictions]
+        if len(frames) == 0:
+            return to_frame(th.zeros(0, dtype=th.long), th.zeros(0, dtype=th.long),
+                            th.zeros(0))
+        return pd.concat(frames, ignore_index=True)
+
+    extension = os.path.splitext(out_file)[1].lower()
+    if extension == ".parquet":
+        _write_parquet(predictions, to_frame, out_file)
+    elif extension in [".tsv", ".txt"]:
+        header = True
+        for block in predictions:
+            to_frame(*block).to_csv(out_file, sep="\t", index=False, header=header,
+                                    mode="w" if header else "a")
+            header = False
+        if header:
+            to_frame(th.zeros(0, dtype=th.long), th.zeros(0, dtype=th.long),
+                     th.zeros(0)).to_csv(out_file, sep="\t", index=False)
+    else:
+        raise ValueError("Parameter out_file must be a .tsv or .parquet file.")
+
+
+def _write_parquet(predictions, to_frame, out_file):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Writing predictions to Parquet requires pyarrow. Install it or use a \
+.tsv file.")
+
+    writer = None
+    try:
+        for block in predictions:
+            table = pa.Table.from_pandas(to_frame(*block), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out_file, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,5 +1,5 @@
 from mowl.base_models.elmodel import EmbeddingELModel
-from mowl.nn import BoxSquaredELModule
+from mowl.nn import BoxSquaredELModule, UniformNegativeSampler
 from tqdm import trange, tqdm
 import torch as th
 import numpy as np
@@ -56,7 +56,20 @@ class BoxSquaredEL(EmbeddingELModel):
 
         ).to(self.device)
 
-    def train(self, epochs=None, validate_every=1):
+    def train(self, epochs=None, validate_every=1, minibatch=False):
+        """Trains the model. By default, every epoch is one optimization step over the whole \
+GCI datasets. With ``minibatch=True``, the model is trained with \
+:meth:`~mowl.base_models.EmbeddingELModel.train_minibatch` instead, so that memory does not \
+grow with the size of the ontology.
+
+        :param epochs: Number of epochs. Defaults to ``self.epochs``.
+        :type epochs: int, optional
+        :param validate_every: Number of epochs between validations. Defaults to ``1``.
+        :type validate_every: int, optional
+        :param minibatch: Whether to train on mini-batches of size ``batch_size``. Defaults to \
+``False``.
+        :type minibatch: bool, optional
+        """
         logger.warning('You are using the default training method. If you want to use a cutomized training method (e.g., different negative sampling, etc.), please reimplement the train method in a subclass.')
 
         points_per_dataset = {k: len(v) for k, v in self.training_datasets.items()}
@@ -69,8 +82,16 @@ class BoxSquaredEL(EmbeddingELModel):
         optimizer = th.optim.Adam(self.module.parameters(), lr=self.learning_rate)
         best_loss = float('inf')
 
-        all_classes_ids = list(self.class_index_dict.values())
-        all_inds_ids = list(self.individual_index_dict.values())
+        class_sampler = UniformNegativeSampler(self.class_index_dict.values(), device=self.device)
+        individual_sampler = UniformNegativeSampler(self.individual_index_dict.values(),
+                                                    device=self.device)
+
+        if minibatch:
+            negative_samplers = {"gci2": class_sampler,
+                                 "object_property_assertion": individual_sampler}
+            self.train_minibatch(epochs=epochs, negative_samplers=negative_samplers,
+                                 optimizer=optimizer, validate_every=validate_every)
+            return
         
         if epochs is None:
             epochs = self.epochs
@@ -87,17 +108,11 @@ class BoxSquaredEL(EmbeddingELModel):
 
                 loss += th.mean(self.module(gci_dataset[:], gci_name))
                 if gci_name == "gci2":
-                    idxs_for_negs = np.random.choice(all_classes_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                    neg_data = class_sampler.sample(gci_dataset[:])
                     loss += th.mean(self.module(neg_data, gci_name, neg=True))
 
                 if gci_name == "object_property_assertion":
-                    idxs_for_negs = np.random.choice(all_inds_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                    neg_data = individual_sampler.sample(gci_dataset[:])
                     loss += th.mean(self.module(neg_data, gci_name, neg=True))
                     
             loss += self.module.regularization_loss()
@@ -1,5 +1,5 @@
 from mowl.base_models.elmodel import EmbeddingELModel
-from mowl.nn import ELBEModule
+from mowl.nn import ELBEModule, UniformNegativeSampler
 from tqdm import trange, tqdm
 import torch as th
 import numpy as np
@@ -47,7 +47,20 @@ class ELBE(EmbeddingELModel):
             margin=self.margin
         ).to(self.device)
 
-    def train(self, epochs=None, validate_every=1):
+    def train(self, epochs=None, validate_every=1, minibatch=False):
+        """Trains the model. By default, every epoch is one optimization step over the whole \
+GCI datasets. With ``minibatch=True``, the model is trained with \
+:meth:`~mowl.base_models.EmbeddingELModel.train_minibatch` instead, so that memory does not \
+grow with the size of the ontology.
+
+        :param epochs: Number of epochs. Defaults to ``self.epochs``.
+        :type epochs: int, optional
+        :param validate_every: Number of epochs between validations. Defaults to ``1``.
+        :type validate_every: int, optional
+        :param minibatch: Whether to train on mini-batches of size ``batch_size``. Defaults to \
+``False``.
+        :type minibatch: bool, optional
+        """
         logger.warning('You are using the default training method. If you want to use a cutomized training method (e.g., different negative sampling, etc.), please reimplement the train method in a subclass.')
 
         points_per_dataset = {k: len(v) for k, v in self.training_datasets.items()}
@@ -61,8 +74,16 @@ class ELBE(EmbeddingELModel):
         criterion = th.nn.MSELoss()
         best_loss = float('inf')
 
-        all_classes_ids = list(self.class_index_dict.values())
-        all_inds_ids = list(self.individual_index_dict.values())
+        class_sampler = UniformNegativeSampler(self.class_index_dict.values(), device=self.device)
+        individual_sampler = UniformNegativeSampler(self.individual_index_dict.values(),
+                                                    device=self.device)
+
+        if minibatch:
+            negative_samplers = {"gci2": class_sampler,
+                                 "object_property_assertion": individual_sampler}
+            self.train_minibatch(epochs=epochs, negative_samplers=negative_samplers,
+                                 optimizer=optimizer, validate_every=validate_every)
+            return
         
         if epochs is None:
             epochs = self.epochs
@@ -81,18 +102,12 @@ class ELBE(EmbeddingELModel):
                 loss += criterion(scores, th.zeros_like(scores, requires_grad=False))
                 
                 if gci_name == "gci2":
-                    idxs_for_negs = np.random.choice(all_classes_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                    neg_data = class_sampler.sample(gci_dataset[:])
                     scores = th.mean(self.module(neg_data, gci_name, neg=True)) 
                     loss += criterion(scores, th.ones_like(scores, requires_grad=False))
 
                 if gci_name == "object_property_assertion":
-                    idxs_for_negs = np.random.choice(all_inds_ids, size=len(gci_dataset), replace=True)
-                    rand_index = th.tensor(idxs_for_negs).to(self.device)
-                    data = gci_dataset[:]
-                    neg_data = th.cat([data[:, :2], rand_index.unsqueeze(1)], dim=1)
+                    neg_data = individual_sampler.sample(gci_dataset[:])
                     scores = th.mean(self.module(neg_data, gci_name, neg=True))
                     loss += criterion(scores, th.ones_like(scores, requires_grad=False))
                     
@@ -120,6 +135,15 @@ class ELBE(EmbeddingELModel):
                 else:
                     print(f'Epoch {epoch+1}: Train loss: {train_loss}')
  
+    def minibatch_loss(self, gci_name, batch, neg_batch=None):
+        criterion = th.nn.MSELoss()
+        scores = th.mean(self.module(batch, gci_name))
+        loss = criterion(scores, th.zeros_like(scores, requires_grad=False))
+        if neg_batch is not None:
+            scores = th.mean(self.module(neg_batch, gci_name, neg=True))
+            loss += criterion(scores, th.ones_like(scores, requires_grad=False))
+        return loss
+
     def eval_method(self, data):
         return self.module.gci2_loss(data)
 
@@ -0,0 +1,125 @@
+from mowl.owlapi import ClassExpressionType, OWLSubClassOfAxiom, OWLEquivalentClassesAxiom, \
+    OWLDisjointClassesAxiom, OWLClassAssertionAxiom, OWLObjectPropertyAssertionAxiom
+
+
+class FALCONExpression():
+    """Node of a compiled class expression. Class nodes and quantifier nodes read the index of \
+their class or object property from column ``slot`` of the input tensor. The remaining nodes \
+combine the fuzzy sets of their ``operands``.
+
+    :param op: One of ``"class"``, ``"exists"``, ``"forall"``, ``"and"``, ``"or"`` or \
+``"not"``.
+    :type op: str
+    :param slot: Column of the input tensor read by the node. Defaults to ``None``.
+    :type slot: int, optional
+    :param operands: Child nodes. Defaults to ``()``.
+    :type operands: tuple, optional
+    """
+
+    __slots__ = ("op", "slot", "operands")
+
+    def __init__(self, op, slot=None, operands=()):
+        self.op = op
+        self.slot = slot
+        self.operands = tuple(operands)
+
+    def __repr__(self):
+        if self.op == "class":
+            return f"class({self.slot})"
+        args = [] if self.slot is None else [str(self.slot)]
+        args += [repr(operand) for operand in self.operands]
+        return f"{self.op}({', '.join(args)})"
+
+
+class FALCONProgram():
+    """Axiom pattern compiled into class expression trees that are evaluated with tensor \
+operations only.
+
+    :param axiom_type: One of ``"subclass"``, ``"equivalent"``, ``"disjoint"``, \
+``"class_assertion"`` or ``"property_assertion"``.
+    :type axiom_type: str
+    :param expressions: Compiled class expressions of the axiom.
+    :type expressions: tuple of :class:`FALCONExpression`
+    :param has_property: For class assertions, whether the class expression is an existential \
+restriction whose property is read from column ``1`` of the input tensor. Defaults to \
+``False``.
+    :type has_property: bool, optional
+    """
+
+    __slots__ = ("axiom_type", "expressions", "has_property")
+
+    def __init__(self, axiom_type, expressions=(), has_property=False):
+        self.axiom_type = axiom_type
+        self.expressions = tuple(expressions)
+        self.has_property = has_property
+
+    def __repr__(self):
+        expressions = ", ".join(repr(expr) for expr in self.expressions)
+        return f"FALCONProgram({self.axiom_type}, [{expressions}])"
+
+
+def compile_class_expression(cexpr, cur_index=0):
+    """Compiles an OWL class expression. Slots are assigned in the order used by \
+:meth:`ALCDataset.get_axiom_vector <mowl.datasets.alc.ALCDataset.get_axiom_vector>`.
+
+    :param cexpr: The class expression.
+    :type cexpr: :class:`org.semanticweb.owlapi.model.OWLClassExpression`
+    :param cur_index: Slot of the first class or object property of the expression. Defaults \
+to ``0``.
+    :type cur_index: int, optional
+    :return: The compiled expression and the slot following its last class or object property.
+    :rtype: tuple(:class:`FALCONExpression`, int)
+    """
+    expr_type = cexpr.getClassExpressionType()
+    if expr_type == ClassExpressionType.OWL_CLASS:
+        return FALCONExpression("class", slot=cur_index), cur_index + 1
+    elif expr_type in (ClassExpressionType.OBJECT_SOME_VALUES_FROM,
+                       ClassExpressionType.OBJECT_ALL_VALUES_FROM):
+        op = "exists" if expr_type == ClassExpressionType.OBJECT_SOME_VALUES_FROM else "forall"
+        filler, next_index = compile_class_expression(cexpr.getFiller(), cur_index + 1)
+        return FALCONExpression(op, slot=cur_index, operands=(filler,)), next_index
+    elif expr_type in (ClassExpressionType.OBJECT_INTERSECTION_OF,
+                       ClassExpressionType.OBJECT_UNION_OF):
+        op = "and" if expr_type == ClassExpressionType.OBJECT_INTERSECTION_OF else "or"
+        operands = []
+        next_index = cur_index
+        for operand in cexpr.getOperandsAsList():
+            operand, next_index = compile_class_expression(operand, next_index)
+            operands.append(operand)
+        return FALCONExpression(op, operands=operands), next_index
+    elif expr_type == ClassExpressionType.OBJECT_COMPLEMENT_OF:
+        operand, next_index = compile_class_expression(cexpr.getOperand(), cur_index)
+        return FALCONExpression("not", operands=(operand,)), next_index
+    raise NotImplementedError()
+
+
+def compile_axiom(axiom):
+    """Compiles an axiom or axiom pattern, such as the keys of the dictionary returned by \
+:meth:`ALCDataset.get_datasets <mowl.datasets.alc.ALCDataset.get_datasets>`.
+
+    :param axiom: The axiom.
+    :type axiom: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+    :rtype: :class:`FALCONProgram`
+    """
+    if isinstance(axiom, OWLSubClassOfAxiom):
+        sub_class, next_index = compile_class_expression(axiom.getSubClass())
+        super_class, _ = compile_class_expression(axiom.getSuperClass(), next_index)
+        return FALCONProgram("subclass", (sub_class, super_class))
+    elif isinstance(axiom, (OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom)):
+        cexprs = list(axiom.getClassExpressionsAsList())
+        # Patterns such as DisjointClasses(Thing, Thing) keep a single class expression
+        left, next_index = compile_class_expression(cexprs[0])
+        right, _ = compile_class_expression(cexprs[-1], next_index)
+        axiom_type = "equivalent" if isinstance(axiom, OWLEquivalentClassesAxiom) else "disjoint"
+        return FALCONProgram(axiom_type, (left, right))
+    elif isinstance(axiom, OWLClassAssertionAxiom):
+        cexpr = axiom.getClassExpression()
+        has_property = cexpr.getClassExpressionType() == \
+            ClassExpressionType.OBJECT_SOME_VALUES_FROM
+        if has_property:
+            cexpr = cexpr.getFiller()
+        expression, _ = compile_class_expression(cexpr)
+        return FALCONProgram("class_assertion", (expression,), has_property=has_property)
+    elif isinstance(axiom, OWLObjectPropertyAssertionAxiom):
+        return FALCONProgram("property_assertion")
+    raise NotImplementedError()
@@ -45,6 +45,12 @@ class FALCON(EmbeddingALCModel):
         optimizer = th.optim.Adam(self.model.parameters(), lr=self.learning_rate)
         best_loss = float('inf')
 
+        # Axiom patterns are compiled once so that no JVM call happens during training
+        training_programs = [(self.model.compile(axiom), dataloader) for axiom, dataloader
+                             in self.training_dataloaders.items()]
+        validation_programs = [(self.model.compile(axiom), dataloader) for axiom, dataloader
+                               in self.validation_dataloaders.items()]
+
         for epoch in trange(self.epochs):
             self.model.train()
 
@@ -57,9 +63,9 @@ class FALCON(EmbeddingALCModel):
             train_loss = 0
             loss = 0
 
-            for axiom, dataloader in self.training_dataloaders.items():
+            for program, dataloader in training_programs:
                 for batch_data in dataloader:
-                    loss += th.mean(self.model(axiom, batch_data[0], anon_e_emb))
+                    loss += th.mean(self.model(program, batch_data[0], anon_e_emb))
 
             optimizer.zero_grad()
             loss.backward()
@@ -70,9 +76,9 @@ class FALCON(EmbeddingALCModel):
             with th.no_grad():
                 self.model.eval()
                 valid_loss = 0
-                for axiom, dataloader in self.validation_dataloaders.items():
+                for program, dataloader in validation_programs:
                     for batch_data in dataloader:
-                        loss = th.mean(self.model(axiom, batch_data[0], anon_e_emb))
+                        loss = th.mean(self.model(program, batch_data[0], anon_e_emb))
                         valid_loss += loss.detach().item()
 
             checkpoint = 10
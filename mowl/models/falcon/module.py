@@ -1,13 +1,17 @@
 import torch as th
 from torch.utils import checkpoint
-from mowl.owlapi import OWLAPIAdapter, ClassExpressionType, OWLSubClassOfAxiom, \
-    OWLEquivalentClassesAxiom, OWLDisjointClassesAxiom, OWLClassAssertionAxiom, \
-    OWLObjectPropertyAssertionAxiom
+from mowl.owlapi import OWLAPIAdapter
+from mowl.nn.sampling import FilteredNegativeSampler
+from mowl.models.falcon.compiler import FALCONProgram, compile_axiom, compile_class_expression
 
 
 class FALCONModule(th.nn.Module):
     """Based on the original implementation at \
 https://github.com/bio-ontology-research-group/FALCON
+
+    Axioms are compiled into :class:`FALCONProgram <mowl.models.falcon.compiler.FALCONProgram>` \
+objects the first time they are seen. Passing compiled programs obtained with :meth:`compile` to \
+:meth:`forward` avoids any call to the JVM during training.
     """
 
     def __init__(
@@ -38,6 +42,9 @@ https://github.com/bio-ontology-research-group/FALCON
         self.residuum = residuum
         self.device = device
         self.adapter = OWLAPIAdapter()
+        self._programs = dict()
+        self._head_sampler = self._build_sampler(heads_dict)
+        self._tail_sampler = self._build_sampler(tails_dict)
 
     def _mem(self, c_emb, e_emb):
         emb = th.cat([c_emb, e_emb], dim=-1)
@@ -102,56 +109,73 @@ https://github.com/bio-ontology-research-group/FALCON
         r_emb = r_emb.unsqueeze(dim=1).expand_as(e_emb)
         return self._mem(e_emb + r_emb, e_emb).squeeze(dim=-1)
 
+    def _build_sampler(self, used_dict):
+        triples = [(entity, relation, used) for (entity, relation), used_list
+                   in used_dict.items() for used in used_list]
+        triples = th.tensor(triples, dtype=th.int64).view(-1, 3)
+        return FilteredNegativeSampler(self.nentities, triples, corrupt="tail",
+                                       device=self.device)
+
+    def _draw_negatives(self, e, r, sampler):
+        pairs = th.stack([e.flatten(), r.flatten()], dim=1).to(self.device).long()
+        pairs = pairs.repeat_interleave(self.num_negs, dim=0)
+        data = th.cat([pairs, th.zeros((len(pairs), 1), dtype=th.int64, device=self.device)],
+                      dim=1)
+        return sampler.sample(data)[:, 2].view(-1, self.num_negs)
+
     def sample_negatives(self, e, r, used_dict):
-        ret = th.zeros((e.shape[0], self.num_negs), dtype=th.int64)
-        for i in range(e.shape[0]):
-            used = th.tensor(used_dict[(e[i].item(), r[i].item())])
-            neg_pool = th.ones(self.nentities)
-            neg_pool[used] = 0
-            neg_pool = neg_pool.nonzero()
-            neg = neg_pool[th.randint(len(neg_pool), (self.num_negs,))]
-            ret[i, :] = neg.flatten()
-        return ret
+        """Draws ``num_negs`` entities for each pair ``(e, r)`` among the entities not in \
+``used_dict[(e, r)]``. The whole batch is drawn at once with a \
+:class:`FilteredNegativeSampler <mowl.nn.FilteredNegativeSampler>` built from ``used_dict``. \
+:meth:`forward` uses the samplers built from ``heads_dict`` and ``tails_dict`` when the module \
+is created instead.
+        """
+        return self._draw_negatives(e, r, self._build_sampler(used_dict))
 
-    def forward_fs(self, cexpr, x, e_emb, cur_index=0):
-        expr_type = cexpr.getClassExpressionType()
-        if expr_type == ClassExpressionType.OWL_CLASS:
-            c_emb = self.c_embedding(x[:, cur_index])
-            return self._get_c_fs_batch(c_emb, e_emb), cur_index + 1
-        elif expr_type == ClassExpressionType.OBJECT_SOME_VALUES_FROM:
-            r_emb = self.r_embedding(x[:, cur_index])
-            # r_fs = self._get_r_fs(r_emb, e_emb)
-            r_fs = checkpoint.checkpoint(self._get_r_fs_batch, r_emb, e_emb)
-            c_fs, next_index = self.forward_fs(
-                cexpr.getFiller(), x, e_emb, cur_index=cur_index + 1)
-            return self._logical_exist(r_fs, c_fs), next_index
-        elif expr_type == ClassExpressionType.OBJECT_ALL_VALUES_FROM:
-            r_emb = self.r_embedding(x[:, cur_index])
+    def compile(self, axiom):
+        """Compiles an axiom pattern into a program evaluated with tensor operations only. \
+Programs are cached by axiom.
+
+        :param axiom: The axiom pattern.
+        :type axiom: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :rtype: :class:`mowl.models.falcon.compiler.FALCONProgram`
+        """
+        if axiom not in self._programs:
+            self._programs[axiom] = compile_axiom(axiom)
+        return self._programs[axiom]
+
+    def execute_fs(self, expression, x, e_emb):
+        """Computes the fuzzy set of a compiled class expression over the entities in ``e_emb``.
+
+        :param expression: The compiled class expression.
+        :type expression: :class:`mowl.models.falcon.compiler.FALCONExpression`
+        """
+        op = expression.op
+        if op == "class":
+            c_emb = self.c_embedding(x[:, expression.slot])
+            return self._get_c_fs_batch(c_emb, e_emb)
+        elif op == "exists" or op == "forall":
+            r_emb = self.r_embedding(x[:, expression.slot])
             # r_fs = self._get_r_fs(r_emb, e_emb)
             r_fs = checkpoint.checkpoint(self._get_r_fs_batch, r_emb, e_emb)
-            c_fs, next_index = self.forward_fs(
-                cexpr.getFiller(), x, e_emb, cur_index=cur_index + 1)
-            return self._logical_forall(r_fs, c_fs), next_index
-        elif expr_type == ClassExpressionType.OBJECT_INTERSECTION_OF:
-            cexprs = cexpr.getOperandsAsList()
-            ret, next_index = self.forward_fs(cexprs[0], x, e_emb, cur_index=cur_index)
-            for i in range(1, len(cexprs)):
-                next_ret, next_index = self.forward_fs(cexprs[i], x, e_emb, cur_index=next_index)
-                ret = self._logical_and(ret, next_ret)
-            return ret, next_index
-        elif expr_type == ClassExpressionType.OBJECT_UNION_OF:
-            cexprs = cexpr.getOperandsAsList()
-            ret, next_index = self.forward_fs(cexprs[0], x, e_emb, cur_index=cur_index)
-            for i in range(1, len(cexprs)):
-                next_ret, next_index = self.forward_fs(cexprs[i], x, e_emb, cur_index=next_index)
-                ret = self._logical_or(ret, next_ret)
-            return ret, next_index
-        elif expr_type == ClassExpressionType.OBJECT_COMPLEMENT_OF:
-            ret, next_index = self.forward_fs(
-                cexpr.getOperand(), x, e_emb, cur_index=cur_index)
-            return self._logical_not(ret), next_index
+            c_fs = self.execute_fs(expression.operands[0], x, e_emb)
+            if op == "exists":
+                return self._logical_exist(r_fs, c_fs)
+            return self._logical_forall(r_fs, c_fs)
+        elif op == "and" or op == "or":
+            combine = self._logical_and if op == "and" else self._logical_or
+            ret = self.execute_fs(expression.operands[0], x, e_emb)
+            for operand in expression.operands[1:]:
+                ret = combine(ret, self.execute_fs(operand, x, e_emb))
+            return ret
+        elif op == "not":
+            return self._logical_not(self.execute_fs(expression.operands[0], x, e_emb))
         raise NotImplementedError()
 
+    def forward_fs(self, cexpr, x, e_emb, cur_index=0):
+        expression, next_index = compile_class_expression(cexpr, cur_index)
+        return self.execute_fs(expression, x, e_emb), next_index
+
     def get_cc_loss(self, fs):
         if self.max_measure == 'max':
             return - th.log(1 - fs.max(dim=-1)[0] + 1e-10)
@@ -162,28 +186,32 @@ https://github.com/bio-ontology-research-group/FALCON
             raise ValueError
 
     def forward(self, axiom, x, e_emb, stage='train'):
-        if isinstance(axiom, OWLSubClassOfAxiom):
-            C = axiom.getSubClass(),
-            D = axiom.getSuperClass()
-            cexpr = self.adapter.create_object_intersection_of(
-                C[0], self.adapter.create_complement_of(D))
-            fs, _ = self.forward_fs(cexpr, x, e_emb)
+        """
+        :param axiom: An axiom pattern or the program returned by :meth:`compile` for it.
+        :type axiom: :class:`org.semanticweb.owlapi.model.OWLAxiom` or \
+:class:`mowl.models.falcon.compiler.FALCONProgram`
+        """
+        program = axiom if isinstance(axiom, FALCONProgram) else self.compile(axiom)
+        axiom_type = program.axiom_type
+
+        if axiom_type == "subclass":
+            C, D = program.expressions
+            c_fs = self.execute_fs(C, x, e_emb)
+            d_fs = self.execute_fs(D, x, e_emb)
+            fs = self._logical_and(c_fs, self._logical_not(d_fs))
             return self.get_cc_loss(fs).mean()
-        elif isinstance(axiom, OWLEquivalentClassesAxiom):
-            cexprs = axiom.getClassExpressionsAsList()
-            C, D = cexprs[0], cexprs[1]
-            c_fs, next_index = self.forward_fs(C, x, e_emb)
-            d_fs, next_index = self.forward_fs(D, x, e_emb, cur_index=next_index)
+        elif axiom_type == "equivalent":
+            C, D = program.expressions
+            c_fs = self.execute_fs(C, x, e_emb)
+            d_fs = self.execute_fs(D, x, e_emb)
             fs1 = self._logical_and(c_fs, self._logical_not(d_fs))
             fs2 = self._logical_and(self._logical_not(c_fs), d_fs)
             return self.get_cc_loss(fs1).mean() + self.get_cc_loss(fs2).mean()
-        elif isinstance(axiom, OWLDisjointClassesAxiom):
-            cexprs = axiom.getClassExpressionsAsList()
-            C, D = cexprs[0], cexprs[1]
-            cexpr = self.adapter.create_object_intersection_of(C, D)
-            fs, _ = self.forward_fs(cexpr, x, e_emb)
+        elif axiom_type == "disjoint":
+            C, D = program.expressions
+            fs = self._logical_and(self.execute_fs(C, x, e_emb), self.execute_fs(D, x, e_emb))
             return self.get_cc_loss(fs).mean()
-        elif isinstance(axiom, OWLClassAssertionAxiom):
+        elif axiom_type == "class_assertion":
             x = x.unsqueeze(dim=1)
             size = [1] * len(x.size())
             size[1] = self.num_negs
@@ -191,17 +219,13 @@ https://github.com/bio-ontology-research-group/FALCON
             neg_ents = th.randint(self.nentities, (x.shape[0], self.num_negs))
             neg_x[:, :, 0] = neg_ents
             x = th.cat([x, neg_x], dim=1)
-            cexpr = axiom.getClassExpression()
-            r = None
-            if cexpr.getClassExpressionType() == ClassExpressionType.OBJECT_SOME_VALUES_FROM:
-                r = cexpr.getProperty()
+            if program.has_property:
                 rx = x[:, :, 1]
-                cexpr = cexpr.getFiller()
                 cx = x[:, 0, 2:]
             else:
                 cx = x[:, 0, 1:]
-            c_fs, _ = self.forward_fs(cexpr, cx, e_emb)
-            if r is not None:
+            c_fs = self.execute_fs(program.expressions[0], cx, e_emb)
+            if program.has_property:
                 r_emb = self.r_embedding(rx)
             else:
                 r_emb = 0
@@ -214,15 +238,15 @@ https://github.com/bio-ontology-research-group/FALCON
             dofm = self._logical_exist(r_fs, c_fs)
             res = (- th.log(dofm[:, 0] + 1e-10).mean() - th.log(1 - dofm[:, 1:] + 1e-10).mean())
             return res / 2
-        elif isinstance(axiom, OWLObjectPropertyAssertionAxiom):
+        elif axiom_type == "property_assertion":
             x = x.unsqueeze(dim=1)
             size = [1] * len(x.size())
             size[1] = self.num_negs
             neg_h = x.repeat(size)
-            neg_ents = self.sample_negatives(x[:, :, 2], x[:, :, 1], self.heads_dict)
+            neg_ents = self._draw_negatives(x[:, :, 2], x[:, :, 1], self._head_sampler)
             neg_h[:, :, 0] = neg_ents
             neg_t = x.repeat(size)
-            neg_ents = self.sample_negatives(x[:, :, 0], x[:, :, 1], self.tails_dict)
+            neg_ents = self._draw_negatives(x[:, :, 0], x[:, :, 1], self._tail_sampler)
             neg_t[:, :, 2] = neg_ents
             x = th.cat([x, neg_h, neg_t], dim=1)
             e_1_emb = self.e_embedding(x[:, :, 0])
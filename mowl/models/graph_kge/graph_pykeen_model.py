@@ -110,7 +110,14 @@ class GraphPlusPyKEENModel(KGEModel):
     @property
     def evaluation_model(self):
         if self._evaluation_model is None:
-            self._evaluation_model = EvaluationModel(self._kge_method, self.device)
+            entity_to_id = self.triples_factory.entity_to_id
+            relation_to_id = self.triples_factory.relation_to_id
+            entity_index = [entity_to_id.get(cls, -1) for cls in self.dataset.classes.as_str]
+            relation_index = [relation_to_id.get(rel, -1)
+                              for rel in self.dataset.object_properties.as_str]
+            self._evaluation_model = EvaluationModel(self._kge_method, self.device,
+                                                     entity_index=entity_index,
+                                                     relation_index=relation_index)
 
         return self._evaluation_model
 
@@ -235,14 +242,119 @@ class GraphPlusPyKEENModel(KGEModel):
 
 
 class EvaluationModel(th.nn.Module):
-    def __init__(self, kge_model, device):
+    """
+    Adapter between the ranking evaluators, which use the ids of the classes and object \
+properties of the dataset, and a PyKEEN model, which uses the ids of the graph nodes and \
+relations. Ids are remapped once per batch through index tensors. Triples are scored against \
+every candidate with :meth:`score_t` and :meth:`score_h` of PyKEEN, so that \
+:class:`mowl.evaluation.RankingEvaluator` does not build one triple per candidate. Scores are \
+negated, since lower scores are better in mOWL.
+
+    :param kge_model: The PyKEEN model.
+    :type kge_model: :class:`pykeen.models.ERModel`
+    :param device: The device of the model.
+    :type device: str
+    :param entity_index: Graph node id of each class of the dataset, or ``-1`` if the class is \
+not in the graph. Defaults to ``None``, which means that ids are the same.
+    :type entity_index: list of int, optional
+    :param relation_index: Graph relation id of each object property of the dataset, or ``-1`` \
+if the object property is not in the graph. Defaults to ``None``, which means that ids are the \
+same.
+    :type relation_index: list of int, optional
+    :param slice_size: Number of candidates scored at a time by PyKEEN. Defaults to ``None``, \
+which scores all of them at once.
+    :type slice_size: int, optional
+    """
+
+    def __init__(self, kge_model, device, entity_index=None, relation_index=None,
+                 slice_size=None):
         logger.warning("A custom EvaluationModel should be created depending on the task. This is a generic one.")
         super().__init__()
 
         self.kge_model = kge_model
         self.device = device
-        
+        self.slice_size = slice_size
+
+        self.entity_index = None
+        self.relation_index = None
+        if entity_index is not None:
+            self.entity_index = th.as_tensor(entity_index, dtype=th.long, device=device)
+        if relation_index is not None:
+            self.relation_index = th.as_tensor(relation_index, dtype=th.long, device=device)
+
+    def _map_entities(self, entities):
+        entities = entities.to(self.device)
+        return entities if self.entity_index is None else self.entity_index[entities]
+
+    def _map_relations(self, relations):
+        relations = relations.to(self.device)
+        if self.relation_index is not None:
+            relations = self.relation_index[relations]
+        if (relations < 0).any():
+            raise ValueError("Object properties that are not relations of the graph cannot be scored.")
+        return relations
+
     def forward(self, data, *args, **kwargs):
-        logits = self.kge_model.score_hrt(data)
-        return - logits
-    
+        heads = self._map_entities(data[:, 0])
+        rels = self._map_relations(data[:, 1])
+        tails = self._map_entities(data[:, 2])
+
+        # Triples with a class missing from the graph are scored as the worst triples
+        in_graph = (heads >= 0) & (tails >= 0)
+        triples = th.stack([heads.clamp(min=0), rels, tails.clamp(min=0)], dim=1)
+        logits = self.kge_model.score_hrt(triples).view(-1)
+        return (- logits).masked_fill(~in_graph, float("inf"))
+
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        """Scores ``(head, relation, candidate)`` triples against every candidate tail with \
+:meth:`score_t` of PyKEEN.
+
+        :param heads: Dataset class ids of the heads. Tensor of shape \(n,\).
+        :type heads: :class:`torch.Tensor`
+        :param rels: Dataset object property ids. Tensor of shape \(n,\).
+        :type rels: :class:`torch.Tensor`
+        :param candidates: Dataset class ids of the candidate tails. Defaults to ``None``, \
+which means all classes of the dataset.
+        :type candidates: :class:`torch.Tensor`, optional
+        :rtype: :class:`torch.Tensor`
+        """
+        if rels is None:
+            raise NotImplementedError()
+        heads = self._map_entities(heads)
+        hr_batch = th.stack([heads.clamp(min=0), self._map_relations(rels)], dim=1)
+        scores = - self.kge_model.score_t(hr_batch, slice_size=self.slice_size)
+        return self._select_candidates(scores, heads >= 0, candidates)
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        """Scores ``(candidate, relation, tail)`` triples against every candidate head with \
+:meth:`score_h` of PyKEEN.
+
+        :param rels: Dataset object property ids. Tensor of shape \(n,\).
+        :type rels: :class:`torch.Tensor`
+        :param tails: Dataset class ids of the tails. Tensor of shape \(n,\).
+        :type tails: :class:`torch.Tensor`
+        :param candidates: Dataset class ids of the candidate heads. Defaults to ``None``, \
+which means all classes of the dataset.
+        :type candidates: :class:`torch.Tensor`, optional
+        :rtype: :class:`torch.Tensor`
+        """
+        if rels is None:
+            raise NotImplementedError()
+        tails = self._map_entities(tails)
+        rt_batch = th.stack([self._map_relations(rels), tails.clamp(min=0)], dim=1)
+        scores = - self.kge_model.score_h(rt_batch, slice_size=self.slice_size)
+        return self._select_candidates(scores, tails >= 0, candidates)
+
+    def _select_candidates(self, scores, in_graph, candidates):
+        # Queries whose class is missing from the graph give every candidate the same infinite
+        # score, as in forward, so that they are ranked last by compute_ranks
+        if candidates is None:
+            if self.entity_index is None:
+                return scores.masked_fill(~in_graph.unsqueeze(1), float("inf"))
+            candidates = th.arange(len(self.entity_index), device=self.device)
+
+        # Classes missing from the graph are scored as the worst candidates
+        candidates = self._map_entities(candidates)
+        scores = scores[:, candidates.clamp(min=0)]
+        scores = scores.masked_fill((candidates < 0).unsqueeze(0), float("inf"))
+        return scores.masked_fill(~in_graph.unsqueeze(1), float("inf"))
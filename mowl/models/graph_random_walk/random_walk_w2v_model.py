@@ -1,6 +1,7 @@
 from mowl.base_models.graph_model import RandomWalkModel
+from mowl.walking import WalkCorpus
+from mowl.projection import get_projection_cache
 from gensim.models import Word2Vec
-from gensim.models.word2vec import LineSentence
 import mowl.error.messages as msg
 import os
 import time
@@ -28,6 +29,7 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         self.w2v_model = None
         self.update_w2v_model = False
         self.axioms_added = False
+        self._new_walks = None
 
         self.device = th.device("cuda" if th.cuda.is_available() else "cpu")
         
@@ -106,18 +108,41 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         if epochs is None:
             epochs = self.w2v_model.epochs
 
+        if self._new_walks is not None:
+            # Only the walks generated by add_axioms, whose vocabulary is already built
+            sentences, self._new_walks = self._new_walks, None
+            if epochs > 0 and len(sentences) > 0:
+                self.w2v_model.train(sentences, total_examples=len(sentences), epochs=epochs)
+            return
+
         if self._edges is None or self.axioms_added:
             self.axioms_added = False
-            self._edges = self.projector.project(self.dataset.ontology)
+            self._edges = get_projection_cache().project(self.projector, self.dataset.ontology)
             
             self.walker.walk(self._edges)
             
-        sentences = LineSentence(self.walker.outfile)
+        sentences = self.walker.corpus
         self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
         if epochs > 0:
             self.w2v_model.train(sentences, total_examples=self.w2v_model.corpus_count, epochs=epochs)
         
-    def add_axioms(self, *axioms):
+    def add_axioms(self, *axioms, hops=1):
+        """
+        Adds axioms to the dataset and updates the walks. With the ``"python"`` backend of the \
+walker, only the edges that were not in the previous projection are considered changed, and new \
+walks are generated only from the nodes of the changed edges and the nodes that reach them in at \
+most ``hops`` steps. The next call to :meth:`train` trains Word2Vec only on these new walks. \
+With the ``"jvm"`` backend, the next call to :meth:`train` walks over the whole graph again.
+
+        :param axioms: Axioms to be added.
+        :type axioms: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+        :param hops: Number of steps used to find the nodes to walk from. Defaults to ``1``.
+        :type hops: int, optional
+        """
+        if self._edges is not None and self.walker.backend == "python":
+            self._add_axioms_incremental(axioms, hops)
+            return
+
         classes = set()
         object_properties = set()
         individuals = set()
@@ -130,13 +155,34 @@ class RandomWalkPlusW2VModel(RandomWalkModel):
         new_entities = list(classes.union(object_properties).union(individuals))
             
         self.dataset.add_axioms(*axioms)
-        self._edges = self.projector.project(self.dataset.ontology)
+        self._edges = get_projection_cache().project(self.projector, self.dataset.ontology)
         self.walker.walk(self._edges, nodes_of_interest=new_entities)
         self.update_w2v_model = True
         #Rebuild vocab
-        sentences = LineSentence(self.walker.outfile)
+        sentences = self.walker.corpus
         self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
         self.axioms_added = True
+
+    def _add_axioms_incremental(self, axioms, hops):
+        previous_edges = set(edge.astuple() for edge in self._edges)
+
+        self.dataset.add_axioms(*axioms)
+        self._edges = get_projection_cache().project(self.projector, self.dataset.ontology)
+
+        changed_nodes = set()
+        for edge in self._edges:
+            if edge.astuple() not in previous_edges:
+                changed_nodes.update((edge.src, edge.dst))
+
+        self.update_w2v_model = True
+        if len(changed_nodes) == 0:
+            self._new_walks = WalkCorpus()
+            return
+
+        self.walker.walk(self._edges, start_nodes=list(changed_nodes), hops=hops)
+        self._new_walks = self.walker.corpus.segment(-1)
+        if len(self._new_walks) > 0:
+            self.w2v_model.build_vocab(self._new_walks, update=True)
         
     def from_pretrained(self, model):
         
@@ -164,7 +210,6 @@ class EvaluationModel(th.nn.Module):
 
     def init_module(self, w2v_model, dataset):
         classes = dataset.classes.as_str
-        class_to_id = {class_: i for i, class_ in enumerate(classes)}
 
         w2v_vectors = w2v_model.wv
         embeddings_list = []
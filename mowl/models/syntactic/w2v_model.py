@@ -1,7 +1,7 @@
 from mowl.base_models import SyntacticModel
 import os
 from gensim.models import Word2Vec
-from gensim.models.word2vec import LineSentence
+from mowl.corpus import tokenize_corpus
 import mowl.error.messages as msg
 import numpy as np
 import torch as th
@@ -107,7 +107,8 @@ class SyntacticPlusW2VModel(SyntacticModel):
         if epochs is None:
             epochs = self.w2v_model.epochs
 
-        sentences = LineSentence(self.corpus_filepath)
+        with open(self.corpus_filepath, "r") as f:
+            sentences = tokenize_corpus(f)
         self.w2v_model.build_vocab(sentences, update=self.update_w2v_model)
 
         if epochs > 0:
@@ -128,7 +129,8 @@ class SyntacticPlusW2VModel(SyntacticModel):
         new_entities = list(classes.union(object_properties).union(individuals))
             
         self.dataset.add_axioms(*axioms)
-        self.generate_corpus(save=self._save_corpus, with_annotations=self._with_annotations)
+        self.generate_corpus(save=self._save_corpus, with_annotations=self._with_annotations,
+                             workers=self._corpus_workers)
         self.update_w2v_model = True
         
 
@@ -158,7 +160,6 @@ class EvaluationModel(th.nn.Module):
 
     def init_module(self, w2v_model, dataset):
         classes = dataset.classes.as_str
-        class_to_id = {class_: i for i, class_ in enumerate(classes)}
 
         w2v_vectors = w2v_model.wv
         embeddings_list = []
@@ -32,7 +32,7 @@ class Box:
 
 
 def volumes(boxes, temperature):
-    return F.softplus(boxes.delta_embed, beta=temperature).prod(1)
+    return F.softplus(boxes.delta_embed, beta=temperature).prod(-1)
 
 def intersection(boxes1, boxes2):
     intersections_min = th.max(boxes1.min_embed, boxes2.min_embed)
@@ -148,6 +148,34 @@ def gci3_loss(data, min_embed, delta_embed, relation_embed, scaling_embed, tempe
 def gci3_bot_loss(*args, **kwargs):
     return gci3_loss(*args, **kwargs)
 
+def score_all_tails(heads, rels, candidates, min_embed, delta_embed, relation_embed, scaling_embed, temperature):
+    # C subClassOf D or C subClassOf R some D, for every candidate D
+    boxes_c = Box(min_embed(heads).unsqueeze(1), delta_embed=delta_embed(heads).unsqueeze(1))
+    boxes_d = Box(min_embed(candidates).unsqueeze(0), delta_embed=delta_embed(candidates).unsqueeze(0))
+
+    if rels is not None:
+        relation = relation_embed(rels).unsqueeze(1)
+        scaling = scaling_embed(rels).unsqueeze(1)
+        trans_c_min = boxes_c.min_embed*(scaling + eps) + relation
+        trans_c_max = boxes_c.max_embed*(scaling + eps) + relation
+        boxes_c = Box(trans_c_min, max_embed=trans_c_max)
+
+    return inclusion_loss(boxes_c, boxes_d, temperature)
+
+def score_all_heads(rels, tails, candidates, min_embed, delta_embed, relation_embed, scaling_embed, temperature):
+    # C subClassOf D or C subClassOf R some D, for every candidate C
+    boxes_c = Box(min_embed(candidates).unsqueeze(0), delta_embed=delta_embed(candidates).unsqueeze(0))
+    boxes_d = Box(min_embed(tails).unsqueeze(1), delta_embed=delta_embed(tails).unsqueeze(1))
+
+    if rels is not None:
+        relation = relation_embed(rels).unsqueeze(1)
+        scaling = scaling_embed(rels).unsqueeze(1)
+        trans_c_min = boxes_c.min_embed*(scaling + eps) + relation
+        trans_c_max = boxes_c.max_embed*(scaling + eps) + relation
+        boxes_c = Box(trans_c_min, max_embed=trans_c_max)
+
+    return inclusion_loss(boxes_c, boxes_d, temperature)
+
 def role_inclusion_loss(data, relation_embed, scaling_embed):
     r_translation = relation_embed(data[:, 0])
     s_translation = relation_embed(data[:, 1])
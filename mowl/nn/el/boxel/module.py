@@ -62,5 +62,17 @@ class BoxELModule(ELModule):
     def gci3_bot_loss(self, data, neg=False):
         return L.gci3_bot_loss(data, self.min_embedding, self.delta_embedding, self.relation_embedding, self.scaling_embedding, self.temperature, neg=neg)
 
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.min_embedding.weight.device)
+        return L.score_all_tails(heads, rels, candidates, self.min_embedding, self.delta_embedding,
+                                 self.relation_embedding, self.scaling_embedding, self.temperature)
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.min_embedding.weight.device)
+        return L.score_all_heads(rels, tails, candidates, self.min_embedding, self.delta_embedding,
+                                 self.relation_embedding, self.scaling_embedding, self.temperature)
+
     def regularization_loss(self):
         return L.regularization_loss(self.min_embedding, self.delta_embedding)
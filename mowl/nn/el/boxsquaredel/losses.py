@@ -21,7 +21,7 @@ def box_intersection(box_a, box_b):
 def inclusion_score(box_a, box_b, gamma):
     dist_a_b = box_distance(box_a, box_b)
     _, offset_a = box_a
-    score = th.linalg.norm(th.relu(dist_a_b + 2*offset_a - gamma), dim=1)
+    score = th.linalg.norm(th.relu(dist_a_b + 2*offset_a - gamma), dim=-1)
     return score
 
 def class_assertion_loss(data, ind_center, ind_offset, class_center, class_offset, gamma, neg = False):
@@ -221,6 +221,47 @@ def gci3_bot_loss(data, head_offset):
     return loss
 
 
+def score_all_tails(heads, rels, candidates, class_center, class_offset, head_center, head_offset, tail_center, tail_offset, bump, gamma, delta):
+    # C subClassOf D or C subClassOf R some D, for every candidate D
+    center_c = class_center(heads).unsqueeze(1)
+    offset_c = th.abs(class_offset(heads)).unsqueeze(1)
+    center_d = class_center(candidates).unsqueeze(0)
+    offset_d = th.abs(class_offset(candidates)).unsqueeze(0)
+
+    if rels is None:
+        score = inclusion_score((center_c, offset_c), (center_d, offset_d), gamma)
+        return score.square()
+
+    bump_c = bump(heads).unsqueeze(1)
+    bump_d = bump(candidates).unsqueeze(0)
+    center_head = head_center(rels).unsqueeze(1)
+    offset_head = th.abs(head_offset(rels)).unsqueeze(1)
+    center_tail = tail_center(rels).unsqueeze(1)
+    offset_tail = th.abs(tail_offset(rels)).unsqueeze(1)
+
+    return gci2_score(center_c, offset_c, bump_c, center_d, offset_d, bump_d, center_head, offset_head, center_tail, offset_tail, gamma, delta)
+
+def score_all_heads(rels, tails, candidates, class_center, class_offset, head_center, head_offset, tail_center, tail_offset, bump, gamma, delta):
+    # C subClassOf D or C subClassOf R some D, for every candidate C
+    center_c = class_center(candidates).unsqueeze(0)
+    offset_c = th.abs(class_offset(candidates)).unsqueeze(0)
+    center_d = class_center(tails).unsqueeze(1)
+    offset_d = th.abs(class_offset(tails)).unsqueeze(1)
+
+    if rels is None:
+        score = inclusion_score((center_c, offset_c), (center_d, offset_d), gamma)
+        return score.square()
+
+    bump_c = bump(candidates).unsqueeze(0)
+    bump_d = bump(tails).unsqueeze(1)
+    center_head = head_center(rels).unsqueeze(1)
+    offset_head = th.abs(head_offset(rels)).unsqueeze(1)
+    center_tail = tail_center(rels).unsqueeze(1)
+    offset_tail = th.abs(tail_offset(rels)).unsqueeze(1)
+
+    return gci2_score(center_c, offset_c, bump_c, center_d, offset_d, bump_d, center_head, offset_head, center_tail, offset_tail, gamma, delta)
+
+
 def reg_loss(bump, reg_factor):
     reg_loss = reg_factor * th.linalg.norm(bump.weight, dim=1).mean()
     return reg_loss
@@ -73,6 +73,20 @@ class BoxSquaredELModule(ELModule):
         return L.gci3_bot_loss(data, self.head_offset)
 
 
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_center.weight.device)
+        return L.score_all_tails(heads, rels, candidates, self.class_center, self.class_offset,
+                                 self.head_center, self.head_offset, self.tail_center,
+                                 self.tail_offset, self.bump_classes, self.gamma, self.delta)
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_center.weight.device)
+        return L.score_all_heads(rels, tails, candidates, self.class_center, self.class_offset,
+                                 self.head_center, self.head_offset, self.tail_center,
+                                 self.tail_offset, self.bump_classes, self.gamma, self.delta)
+
     def class_assertion_loss(self, data, neg=False):
         if self.ind_center is None:
             raise ValueError("The number of individuals must be specified to use this loss function.")
@@ -116,3 +116,30 @@ def gci3_bot_loss(data, class_offset, neg=False):
     off_c = th.abs(class_offset(data[:, 1]))
     loss = th.linalg.norm(off_c, axis=1)
     return loss
+
+
+def pairwise_inclusion_score(c, off_c, d, off_d, margin):
+    euc = th.abs(c - d)
+    return th.linalg.norm(th.relu(euc + off_c - off_d + margin), dim=-1)
+
+def score_all_tails(heads, rels, candidates, class_embed, class_offset, rel_embed, margin):
+    # C subClassOf D or C subClassOf R some D, for every candidate D
+    c = class_embed(heads).unsqueeze(1)
+    off_c = th.abs(class_offset(heads)).unsqueeze(1)
+    d = class_embed(candidates).unsqueeze(0)
+    off_d = th.abs(class_offset(candidates)).unsqueeze(0)
+
+    if rels is not None:
+        c = c + rel_embed(rels).unsqueeze(1)
+    return pairwise_inclusion_score(c, off_c, d, off_d, margin)
+
+def score_all_heads(rels, tails, candidates, class_embed, class_offset, rel_embed, margin):
+    # C subClassOf D or C subClassOf R some D, for every candidate C
+    c = class_embed(candidates).unsqueeze(0)
+    off_c = th.abs(class_offset(candidates)).unsqueeze(0)
+    d = class_embed(tails).unsqueeze(1)
+    off_d = th.abs(class_offset(tails)).unsqueeze(1)
+
+    if rels is not None:
+        d = d - rel_embed(rels).unsqueeze(1)
+    return pairwise_inclusion_score(c, off_c, d, off_d, margin)
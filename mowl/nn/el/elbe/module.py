@@ -75,6 +75,18 @@ class ELBEModule(ELModule):
     def gci3_bot_loss(self, data, neg=False):
         return L.gci3_bot_loss(data, self.class_offset, neg=neg)
 
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_embed.weight.device)
+        return L.score_all_tails(heads, rels, candidates, self.class_embed, self.class_offset,
+                                 self.rel_embed, self.margin)
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_embed.weight.device)
+        return L.score_all_heads(rels, tails, candidates, self.class_embed, self.class_offset,
+                                 self.rel_embed, self.margin)
+
     def class_assertion_loss(self, data, neg=False):
         if self.ind_embed is None:
             raise ValueError("The number of individuals must be specified to use this loss function.")
@@ -117,6 +117,33 @@ def gci3_bot_loss(data, class_rad, neg=False):
     return rc
 
 
+def score_all_tails(heads, rels, candidates, class_embed, class_rad, rel_embed, margin):
+    # C subClassOf D or C subClassOf R some D, for every candidate D
+    c = class_embed(heads)
+    rc = th.abs(class_rad(heads))
+    d = class_embed(candidates)
+    rd = th.abs(class_rad(candidates)).view(1, -1)
+
+    if rels is None:
+        return th.relu(th.cdist(c, d) + rc - rd - margin)
+
+    c = c + rel_embed(rels)
+    return th.relu(th.cdist(c, d) + rc - rd - margin) + 10e-6
+
+def score_all_heads(rels, tails, candidates, class_embed, class_rad, rel_embed, margin):
+    # C subClassOf D or C subClassOf R some D, for every candidate C
+    d = class_embed(tails)
+    rd = th.abs(class_rad(tails))
+    c = class_embed(candidates)
+    rc = th.abs(class_rad(candidates)).view(1, -1)
+
+    if rels is None:
+        return th.relu(th.cdist(d, c) + rc - rd - margin)
+
+    d = d - rel_embed(rels)
+    return th.relu(th.cdist(d, c) + rc - rd - margin) + 10e-6
+
+
 def regularization_loss(class_embed, ind_embed = None, reg_norm = 1):
     reg = th.abs(th.linalg.norm(class_embed.weight, axis=1) - reg_norm).mean()
     if ind_embed is not None:
@@ -88,6 +88,18 @@ class ELEmModule(ELModule):
     def gci2_score(self, data):
         return L.gci2_score(data, self.class_embed, self.class_rad, self.rel_embed, self.margin)
 
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_embed.weight.device)
+        return L.score_all_tails(heads, rels, candidates, self.class_embed, self.class_rad,
+                                 self.rel_embed, self.margin)
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        if candidates is None:
+            candidates = th.arange(self.nb_ont_classes, device=self.class_embed.weight.device)
+        return L.score_all_heads(rels, tails, candidates, self.class_embed, self.class_rad,
+                                 self.rel_embed, self.margin)
+
     def class_assertion_loss(self, data, neg=False):
         if self.ind_embed is None:
             raise ValueError("The number of individuals must be specified to use this loss function.")
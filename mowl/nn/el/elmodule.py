@@ -146,6 +146,47 @@ class ELModule(nn.Module):
 
         return NotImplementedError()
     
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        """Scores axioms against every candidate class on the right-hand side. If ``rels`` is \
+        ``None``, the axioms are :math:`C \sqsubseteq D` (GCI0). Otherwise, the axioms are \
+        :math:`C \sqsubseteq \exists R.D` (GCI2). Scores are computed directly over the \
+        embedding tables instead of building every ``(C, R, D)`` triple.
+
+        :param heads: Indices of the ``C`` classes. Tensor of shape \(n,\).
+        :type heads: :class:`torch.Tensor`
+        :param rels: Indices of the ``R`` object properties. Tensor of shape \(n,\). \
+        Defaults to ``None``.
+        :type rels: :class:`torch.Tensor`, optional
+        :param candidates: Indices of the ``D`` classes to score. Defaults to ``None``, which \
+        means all classes.
+        :type candidates: :class:`torch.Tensor`, optional
+        :return: Tensor of shape \(n, number of candidates\) containing the same values as \
+        ``forward`` with ``gci0`` or ``gci2``.
+        :rtype: :class:`torch.Tensor`
+        """
+
+        raise NotImplementedError()
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        """Scores axioms against every candidate class on the left-hand side. If ``rels`` is \
+        ``None``, the axioms are :math:`C \sqsubseteq D` (GCI0). Otherwise, the axioms are \
+        :math:`C \sqsubseteq \exists R.D` (GCI2).
+
+        :param rels: Indices of the ``R`` object properties. Tensor of shape \(n,\) or \
+        ``None``.
+        :type rels: :class:`torch.Tensor`
+        :param tails: Indices of the ``D`` classes. Tensor of shape \(n,\).
+        :type tails: :class:`torch.Tensor`
+        :param candidates: Indices of the ``C`` classes to score. Defaults to ``None``, which \
+        means all classes.
+        :type candidates: :class:`torch.Tensor`, optional
+        :return: Tensor of shape \(n, number of candidates\) containing the same values as \
+        ``forward`` with ``gci0`` or ``gci2``.
+        :rtype: :class:`torch.Tensor`
+        """
+
+        raise NotImplementedError()
+
     def get_loss_function(self, gci_name):
         """
         This chooses the corresponding loss fuction given the name of the GCI.
@@ -0,0 +1,294 @@
+import torch as th
+
+
+class NegativeSampler():
+    """Base class for negative samplers. A negative sampler corrupts a batch of tuples by \
+replacing their head (first column), their tail (last column) or one of both with entities drawn \
+directly on the device of the batch. Subclasses define the distribution of the replacing \
+entities in :meth:`draw`.
+
+    :param corrupt: Column to corrupt. One of ``"head"``, ``"tail"`` or ``"both"``. With \
+``"both"``, each tuple gets either its head or its tail corrupted with equal probability. \
+Defaults to ``"tail"``.
+    :type corrupt: str, optional
+    :param known_tuples: Positive tuples that must not be returned as negatives. They are kept \
+in a :class:`mowl.evaluation.TupleSet` and corrupted tuples found in it are drawn again. \
+Defaults to ``None``.
+    :type known_tuples: :class:`torch.Tensor`, optional
+    :param max_retries: Maximum number of times a corrupted tuple found in ``known_tuples`` is \
+drawn again. Defaults to ``10``.
+    :type max_retries: int, optional
+    :param seed: Seed of the random generator owned by the sampler. Defaults to ``None``, which \
+uses the global PyTorch generator.
+    :type seed: int, optional
+    :param device: Device where the sampler stores its tensors. Defaults to ``"cpu"``.
+    :type device: str, optional
+    """
+
+    def __init__(self, corrupt="tail", known_tuples=None, max_retries=10, seed=None,
+                 device="cpu"):
+
+        if corrupt not in ["head", "tail", "both"]:
+            raise ValueError("Optional parameter corrupt must be one of 'head', 'tail' or 'both'.")
+
+        if known_tuples is not None and not th.is_tensor(known_tuples):
+            raise TypeError("Optional parameter known_tuples must be of type torch.Tensor.")
+
+        if not isinstance(max_retries, int):
+            raise TypeError("Optional parameter max_retries must be of type int.")
+
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("Optional parameter seed must be of type int.")
+
+        self.corrupt = corrupt
+        self.max_retries = max_retries
+        self.device = device
+
+        self.generator = None
+        if seed is not None:
+            self.generator = th.Generator(device=device)
+            self.generator.manual_seed(seed)
+
+        self.known_tuples = None
+        if known_tuples is not None:
+            from mowl.evaluation.filtering import TupleSet
+            self.known_tuples = TupleSet(known_tuples.to(device))
+
+    def draw(self, data, column):
+        """Draws one entity for each tuple in ``data`` to replace the entity at ``column``.
+
+        :param data: Batch of tuples of shape ``(n, k)``.
+        :type data: :class:`torch.Tensor`
+        :param column: Index of the column being corrupted. It is ``0`` for heads and ``k - 1`` \
+for tails.
+        :type column: int
+        :rtype: :class:`torch.Tensor`
+        """
+        raise NotImplementedError()
+
+    def sample(self, data):
+        """Returns a corrupted copy of ``data``.
+
+        :param data: Batch of tuples of shape ``(n, k)``.
+        :type data: :class:`torch.Tensor`
+        :rtype: :class:`torch.Tensor`
+        """
+
+        data = data.to(self.device)
+        negatives = data.clone()
+        if len(data) == 0:
+            return negatives
+
+        tail_column = data.shape[1] - 1
+        if self.corrupt == "head":
+            columns = th.zeros(len(data), dtype=th.long, device=self.device)
+        elif self.corrupt == "tail":
+            columns = th.full((len(data),), tail_column, dtype=th.long, device=self.device)
+        else:
+            coins = th.rand(len(data), generator=self.generator, device=self.device)
+            columns = (coins < 0.5).long() * tail_column
+
+        pending = th.arange(len(data), device=self.device)
+        for _ in range(self.max_retries + 1):
+            self._corrupt(data, negatives, columns, pending)
+            if self.known_tuples is None:
+                break
+            pending = pending[self.known_tuples.contains(negatives[pending])]
+            if len(pending) == 0:
+                break
+
+        return negatives
+
+    __call__ = sample
+
+    def _corrupt(self, data, negatives, columns, rows):
+        for column in th.unique(columns[rows]).tolist():
+            selected = rows[columns[rows] == column]
+            negatives[selected, column] = self.draw(data[selected], column).to(negatives.dtype)
+
+
+class UniformNegativeSampler(NegativeSampler):
+    """Negative sampler drawing entities uniformly from a set of candidates.
+
+    :param candidates: Entity ids to draw from, or the number of entities ``n`` to draw from \
+``range(n)``.
+    :type candidates: :class:`torch.Tensor` or int
+    """
+
+    def __init__(self, candidates, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.candidates = _as_candidates(candidates, self.device)
+
+    def draw(self, data, column):
+        idxs = th.randint(len(self.candidates), (len(data),), generator=self.generator,
+                          device=self.device)
+        return self.candidates[idxs]
+
+
+class DegreeNegativeSampler(NegativeSampler):
+    """Negative sampler drawing entities with probability proportional to their degree raised \
+to ``power``. With the default value ``0.75``, frequent entities are drawn more often than with \
+uniform sampling, but less than proportionally to their frequency.
+
+    :param degrees: Degree of each entity, indexed by entity id. It can be computed, for \
+example, with ``torch.bincount(data.flatten())``.
+    :type degrees: :class:`torch.Tensor`
+    :param power: Exponent applied to the degrees. Defaults to ``0.75``.
+    :type power: float, optional
+    """
+
+    def __init__(self, degrees, *args, power=0.75, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if not th.is_tensor(degrees):
+            raise TypeError("Parameter degrees must be of type torch.Tensor.")
+
+        self.weights = degrees.to(self.device).double().pow(power)
+
+    def draw(self, data, column):
+        return th.multinomial(self.weights, len(data), replacement=True,
+                              generator=self.generator)
+
+
+class TypeConstrainedNegativeSampler(NegativeSampler):
+    """Negative sampler drawing entities uniformly from the candidates allowed by the relation \
+of each tuple. Tails are drawn from the range of the relation and heads from its domain. \
+Relations without constraints use the default candidates.
+
+    :param candidates: Default entity ids to draw from, or the number of entities.
+    :type candidates: :class:`torch.Tensor` or int
+    :param ranges: Dictionary mapping relation ids to the entity ids allowed as tails. Defaults \
+to ``None``.
+    :type ranges: dict, optional
+    :param domains: Dictionary mapping relation ids to the entity ids allowed as heads. Defaults \
+to ``None``.
+    :type domains: dict, optional
+    :param relation_column: Column of the tuples containing the relation. Defaults to ``1``.
+    :type relation_column: int, optional
+    """
+
+    def __init__(self, candidates, *args, ranges=None, domains=None, relation_column=1,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+
+        candidates = _as_candidates(candidates, self.device)
+        self.relation_column = relation_column
+        self._ranges = self._build_groups(ranges or dict(), candidates)
+        self._domains = self._build_groups(domains or dict(), candidates)
+
+    def _build_groups(self, constraints, candidates):
+        # Candidates of all relations are concatenated, the default candidates being the last group
+        relations = sorted(constraints)
+        groups = [_as_candidates(constraints[r], self.device) for r in relations] + [candidates]
+        if any(len(group) == 0 for group in groups):
+            raise ValueError("Candidate sets must not be empty.")
+
+        sizes = th.tensor([len(group) for group in groups], dtype=th.long, device=self.device)
+        offsets = th.cumsum(sizes, dim=0) - sizes
+        relations = th.tensor(relations, dtype=th.long, device=self.device)
+        return relations, offsets, sizes, th.cat(groups)
+
+    def draw(self, data, column):
+        relations, offsets, sizes, values = self._domains if column == 0 else self._ranges
+
+        rels = data[:, self.relation_column].long().contiguous()
+        groups = th.full_like(rels, len(relations))
+        if len(relations) > 0:
+            positions = th.searchsorted(relations, rels).clamp(max=len(relations) - 1)
+            groups = th.where(relations[positions] == rels, positions, groups)
+
+        noise = th.rand(len(data), generator=self.generator, device=self.device)
+        idxs = offsets[groups] + (noise * sizes[groups]).long().clamp(max=sizes[groups] - 1)
+        return values[idxs]
+
+
+class FilteredNegativeSampler(NegativeSampler):
+    """Negative sampler drawing entities uniformly from ``range(num_entities)`` among those not \
+known to be linked to the uncorrupted entity of each triple through its relation. Tails of \
+``(h, r, t)`` are drawn among the entities that are not tails of ``(h, r)`` in ``triples``, and \
+heads among those that are not heads of ``(r, t)``.
+
+    Known neighbours are stored in compressed sparse row (CSR) format keyed by \
+``(entity, relation)`` pairs. Instead of drawing again the entities that are known neighbours, \
+the :math:`k`-th allowed entity is computed directly as :math:`k` plus the number of known \
+neighbours skipped before it, with ``torch.searchsorted`` over the sorted neighbours. This makes \
+every draw exact, in a single pass over the batch. Rows whose pair is linked to all the entities \
+are not filtered.
+
+    :param num_entities: Number of entities to draw from.
+    :type num_entities: int
+    :param triples: Known triples ``(h, r, t)`` of shape ``(m, 3)``.
+    :type triples: :class:`torch.Tensor`
+    :param relation_column: Column of the tuples containing the relation. Defaults to ``1``.
+    :type relation_column: int, optional
+    """
+
+    def __init__(self, num_entities, triples, *args, relation_column=1, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if not isinstance(num_entities, int):
+            raise TypeError("Parameter num_entities must be of type int.")
+        if not th.is_tensor(triples):
+            raise TypeError("Parameter triples must be of type torch.Tensor.")
+
+        self.num_entities = num_entities
+        self.relation_column = relation_column
+
+        triples = triples.to(self.device).long().view(-1, 3)
+        relations = triples[:, relation_column]
+        self._num_relations = int(relations.max()) + 1 if len(triples) > 0 else 1
+        if (num_entities + 1) * num_entities * self._num_relations >= 2 ** 63:
+            raise ValueError("Entity and relation ids are too large to be encoded.")
+
+        self._heads = self._build_index(triples[:, 2], relations, triples[:, 0])
+        self._tails = self._build_index(triples[:, 0], relations, triples[:, 2])
+
+    def _build_index(self, entities, relations, neighbours):
+        num_entities = self.num_entities
+        keys = entities * self._num_relations + relations
+        combined = th.unique(keys * num_entities + neighbours, sorted=True)
+        keys, neighbours = combined // num_entities, combined % num_entities
+
+        pairs, counts = th.unique_consecutive(keys, return_counts=True)
+        indptr = th.zeros(len(pairs) + 1, dtype=th.long, device=self.device)
+        indptr[1:] = th.cumsum(counts, dim=0)
+
+        # Neighbours minus their rank within the row are non-decreasing in each row. Offsetting
+        # each row by (num_entities + 1) keeps them sorted across rows.
+        segments = th.repeat_interleave(th.arange(len(pairs), device=self.device), counts)
+        ranks = th.arange(len(neighbours), device=self.device) - indptr[segments]
+        skips = segments * (num_entities + 1) + neighbours - ranks
+        return pairs, counts, indptr, skips
+
+    def draw(self, data, column):
+        pairs, counts, indptr, skips = self._heads if column == 0 else self._tails
+        num_entities = self.num_entities
+        if len(pairs) == 0:
+            return th.randint(num_entities, (len(data),), generator=self.generator,
+                              device=self.device)
+
+        entities = data[:, data.shape[1] - 1 if column == 0 else 0].long()
+        relations = data[:, self.relation_column].long()
+        keys = (entities * self._num_relations + relations).contiguous()
+
+        rows = th.searchsorted(pairs, keys).clamp(max=len(pairs) - 1)
+        found = (relations >= 0) & (relations < self._num_relations) & (pairs[rows] == keys)
+        degrees = th.where(found, counts[rows], th.zeros_like(rows))
+        found &= degrees < num_entities
+        degrees = th.where(found, degrees, th.zeros_like(rows))
+
+        allowed = num_entities - degrees
+        noise = th.rand(len(data), generator=self.generator, device=self.device)
+        ranks = (noise * allowed).long().clamp(max=allowed - 1)
+
+        skipped = th.searchsorted(skips, rows * (num_entities + 1) + ranks, right=True) - \
+            indptr[rows]
+        return ranks + th.where(found, skipped, th.zeros_like(skipped))
+
+
+def _as_candidates(candidates, device):
+    if isinstance(candidates, int):
+        return th.arange(candidates, device=device)
+    if th.is_tensor(candidates):
+        return candidates.to(device).long()
+    return th.tensor(list(candidates), dtype=th.long, device=device)
@@ -0,0 +1,35 @@
+import hashlib
+import logging
+
+from java.util import ArrayList, Collections
+
+
+def axioms_digest(ontology):
+    """Returns the SHA-256 hash of the axioms of an ontology and its imports closure. The \
+axioms are sorted and hashed one at a time on the JVM by ``org.mowl.OntologyDigest``, which \
+reuses the hash of recently used ontologies until their axioms change.
+
+    :param ontology: The ontology.
+    :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+    :return: Hexadecimal digest.
+    :rtype: str
+    """
+
+    try:
+        from org.mowl import OntologyDigest
+    except ImportError:
+        logging.warning("org.mowl.OntologyDigest is not available. Axioms will be hashed one by "
+                        "one from Python. Rebuild the mOWL jars to hash them on the JVM.")
+    else:
+        return str(OntologyDigest.digest(ontology))
+
+    axioms = ArrayList()
+    for imported in ontology.getImportsClosure():
+        axioms.addAll(imported.getAxioms())
+    Collections.sort(axioms)
+
+    digest = hashlib.sha256()
+    for axiom in axioms:
+        digest.update(str(axiom.toString()).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
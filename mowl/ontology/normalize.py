@@ -9,6 +9,7 @@ from org.semanticweb.owlapi.model import OWLAxiom, OWLOntology, AxiomType, Class
 
 from java.util import HashSet
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 logger = logging.getLogger(__name__)
 handler = logging.StreamHandler()
@@ -18,15 +19,49 @@ logger.setLevel(logging.INFO)
 from mowl.owlapi import OWLAPIAdapter
 from deprecated.sphinx import versionchanged
 
+UNSUPPORTED_AXIOM_TYPES = {
+    AxiomType.SWRL_RULE, AxiomType.EQUIVALENT_OBJECT_PROPERTIES,
+    AxiomType.SYMMETRIC_OBJECT_PROPERTY, AxiomType.ASYMMETRIC_OBJECT_PROPERTY,
+    AxiomType.DATA_PROPERTY_RANGE, AxiomType.DATA_PROPERTY_DOMAIN,
+    AxiomType.FUNCTIONAL_DATA_PROPERTY, AxiomType.DISJOINT_UNION, AxiomType.HAS_KEY}
+
+UNSUPPORTED_CLASS_EXPRESSION_TYPES = {
+    ClassExpressionType.OBJECT_UNION_OF, ClassExpressionType.OBJECT_COMPLEMENT_OF,
+    ClassExpressionType.OBJECT_ALL_VALUES_FROM, ClassExpressionType.OBJECT_MIN_CARDINALITY,
+    ClassExpressionType.OBJECT_MAX_CARDINALITY, ClassExpressionType.OBJECT_EXACT_CARDINALITY,
+    ClassExpressionType.OBJECT_HAS_SELF, ClassExpressionType.OBJECT_ONE_OF,
+    ClassExpressionType.OBJECT_HAS_VALUE, ClassExpressionType.DATA_SOME_VALUES_FROM,
+    ClassExpressionType.DATA_ALL_VALUES_FROM, ClassExpressionType.DATA_HAS_VALUE,
+    ClassExpressionType.DATA_MIN_CARDINALITY, ClassExpressionType.DATA_MAX_CARDINALITY,
+    ClassExpressionType.DATA_EXACT_CARDINALITY}
+
+
 class ELNormalizer():
 
     """This class wraps the normalization functionality found in the Java library :class:`Jcel`. \
 The normalization process transforms an ontology into 7 normal forms in the description \
 logic EL language.
+
+    :param workers: Number of threads used to preprocess and reverse translate the axioms. \
+The JVM releases the Python GIL while running Java code, so chunks of axioms are processed \
+concurrently. Defaults to 1.
+    :type workers: int, optional
+    :param chunk_size: Number of axioms processed by each task. Defaults to 10000.
+    :type chunk_size: int, optional
     """
 
-    def __init__(self):
-        return
+    def __init__(self, workers=1, chunk_size=10000):
+        if not isinstance(workers, int):
+            raise TypeError("Optional parameter workers must be of type int.")
+        if not isinstance(chunk_size, int):
+            raise TypeError("Optional parameter chunk_size must be of type int.")
+        if workers < 1:
+            raise ValueError("Optional parameter workers must be greater than 0.")
+        if chunk_size < 1:
+            raise ValueError("Optional parameter chunk_size must be greater than 0.")
+
+        self.workers = workers
+        self.chunk_size = chunk_size
 
     def normalize(self, ontology, load=False):
         """Performs the normalization.
@@ -101,16 +136,43 @@ type org.semanticweb.owlapi.model.OWLOntology. Found: {type(ontology)}")
             "gci0": [], "gci1": [], "gci2": [], "gci3": [], "gci0_bot": [], "gci1_bot": [],
             "gci3_bot": [], "class_assertion": [], "object_property_assertion": []}
 
-        for ax in normalized_ontology:
+        ignored = 0
+        for processed, ignored_in_chunk in self.__map_chunks(self.__revert_chunk,
+                                                             normalized_ontology):
+            for key, value in processed:
+                axioms_dict[key].append(value)
+            ignored += ignored_in_chunk
+
+        if ignored > 0:
+            logging.info("Reverse translation. Ignored %d axioms", ignored)
+        return axioms_dict
+
+    def __revert_chunk(self, axioms):
+        processed = []
+        ignored = 0
+        for ax in axioms:
             try:
                 axiom = self.rTranslator.visit(ax)
                 key, value = process_axiom(axiom)
-                axioms_dict[key].append(value)
+                processed.append((key, value))
             except Exception as e:
-                logging.info("Reverse translation. Ignoring axiom: %s", ax)
-                logging.info(e)
+                ignored += 1
+                logging.debug("Reverse translation. Ignoring axiom: %s", ax)
+                logging.debug(e)
+        return processed, ignored
 
-        return axioms_dict
+    def __map_chunks(self, function, axioms):
+        """Applies ``function`` to consecutive chunks of ``axioms``, using ``workers`` threads. \
+Results are returned in the order of the chunks."""
+
+        axioms = list(axioms)
+        chunks = [axioms[i:i + self.chunk_size] for i in range(0, len(axioms), self.chunk_size)]
+
+        if self.workers == 1 or len(chunks) <= 1:
+            return [function(chunk) for chunk in chunks]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(function, chunks))
 
     # TODO: This method is missing unit tests
     def preprocess_ontology(self, ontology):
@@ -130,55 +192,10 @@ type org.semanticweb.owlapi.model.OWLOntology")
 
         tbox_axioms = ontology.getTBoxAxioms(Imports.fromBoolean(True))
         new_tbox_axioms = HashSet()
-        for axiom in tbox_axioms:
-            axiom_as_str = axiom.toString()
-
-            if "UnionOf" in axiom_as_str:
-                continue
-            elif "MinCardinality" in axiom_as_str:
-                continue
-            elif "ComplementOf" in axiom_as_str:
-                continue
-            elif "AllValuesFrom" in axiom_as_str:
-                continue
-            elif "MaxCardinality" in axiom_as_str:
-                continue
-            elif "ExactCardinality" in axiom_as_str:
-                continue
-            elif "Annotation" in axiom_as_str:
-                continue
-            elif "ObjectHasSelf" in axiom_as_str:
-                continue
-            elif "urn:swrl" in axiom_as_str:
-                continue
-            elif "EquivalentObjectProperties" in axiom_as_str:
-                continue
-            elif "SymmetricObjectProperty" in axiom_as_str:
-                continue
-            elif "AsymmetricObjectProperty" in axiom_as_str:
-                continue
-            elif "ObjectOneOf" in axiom_as_str:
-                continue
-            elif "ObjectHasValue" in axiom_as_str:
-                continue
-            elif "DataSomeValuesFrom" in axiom_as_str:
-                continue
-            elif "DataAllValuesFrom" in axiom_as_str:
-                continue
-            elif "DataHasValue" in axiom_as_str:
-                continue
-            elif "DataPropertyRange" in axiom_as_str:
-                continue
-            elif "DataPropertyDomain" in axiom_as_str:
-                continue
-            elif "FunctionalDataProperty" in axiom_as_str:
-                continue
-            elif "DisjointUnion" in axiom_as_str:
-                continue
-            elif "HasKey" in axiom_as_str:
-                continue
-            
-            else:
+        for supported in self.__map_chunks(
+                lambda chunk: [axiom for axiom in chunk if is_supported_axiom(axiom)],
+                tbox_axioms):
+            for axiom in supported:
                 new_tbox_axioms.add(axiom)
 
         owl_manager = OWLAPIAdapter().owl_manager
@@ -186,6 +203,25 @@ type org.semanticweb.owlapi.model.OWLOntology")
         return new_ontology
 
 
+def is_supported_axiom(axiom: OWLAxiom):
+    """Checks whether an axiom can be processed by the normalization. Annotated axioms, axioms of \
+a type in ``UNSUPPORTED_AXIOM_TYPES`` and axioms containing a class expression of a type in \
+``UNSUPPORTED_CLASS_EXPRESSION_TYPES`` are not supported.
+
+    :param axiom: Input axiom
+    :type axiom: :class:`org.semanticweb.owlapi.model.OWLAxiom`
+    :rtype: bool
+    """
+
+    if axiom.isAnnotated() or axiom.getAxiomType() in UNSUPPORTED_AXIOM_TYPES:
+        return False
+
+    for expression in axiom.getNestedClassExpressions():
+        if expression.getClassExpressionType() in UNSUPPORTED_CLASS_EXPRESSION_TYPES:
+            return False
+    return True
+
+
 def process_axiom(axiom: OWLAxiom):
 
     # Type check
@@ -1,7 +1,8 @@
-from .edge import Edge
+from .edge import Edge, EdgeTable
 from .dl2vec.model import DL2VecProjector
 from .owl2vec_star.model import OWL2VecStarProjector
 from .taxonomy.model import TaxonomyProjector
 from .taxonomy_rels.model import TaxonomyWithRelationsProjector
 from .categorical.model import CategoricalProjector
 from .factory import projector_factory
+from .cache import ProjectionCache, get_projection_cache
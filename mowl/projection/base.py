@@ -1,4 +1,4 @@
-from mowl.projection.edge import Edge
+from mowl.projection.edge import Edge, EdgeTable
 
 
 class ProjectionModel():
@@ -21,3 +21,27 @@ class ProjectionModel():
         '''
 
         raise NotImplementedError()
+
+    def project_table(self, ontology, *args, **kwargs):
+        '''
+        Performs the ontology parsing and returns the edges as a table.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        '''
+
+        return EdgeTable.from_edges(self.project(ontology, *args, **kwargs))
+
+    def get_parameters(self):
+        '''
+        Returns the parameters of the projector, that is, its public attributes of basic types. \
+Together with the class of the projector, they identify its projections in \
+:class:`mowl.projection.cache.ProjectionCache`.
+
+        :rtype: dict
+        '''
+
+        basic_types = (bool, int, float, str, list, tuple, type(None))
+        return {name: value for name, value in vars(self).items()
+                if not name.startswith("_") and isinstance(value, basic_types)}
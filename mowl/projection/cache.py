@@ -0,0 +1,127 @@
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+
+from mowl.ontology.digest import axioms_digest
+from mowl.projection.edge import EdgeTable
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectionCache():
+    """
+    Cache of ontology projections. Projections are stored as :class:`EdgeTable` objects keyed \
+by a hash of the ontology axioms (including the imports closure), the class of the projector, \
+its parameters and the extra arguments of the projection. Tables are kept in memory, up to \
+``max_size`` of them, and optionally saved as ``.npz`` files in ``cache_dir``, so that the same \
+ontology is projected only once across models, evaluators and runs.
+
+    :param cache_dir: Directory where projections are saved. Defaults to ``None``, which keeps \
+projections only in memory.
+    :type cache_dir: str, optional
+    :param max_size: Maximum number of projections kept in memory. The least recently used \
+projection is dropped first. Defaults to ``16``.
+    :type max_size: int, optional
+    """
+
+    def __init__(self, cache_dir=None, max_size=16):
+        if not isinstance(cache_dir, str) and cache_dir is not None:
+            raise TypeError("Optional parameter cache_dir must be of type str.")
+        if not isinstance(max_size, int):
+            raise TypeError("Optional parameter max_size must be of type int.")
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._tables = OrderedDict()
+
+    def __len__(self):
+        return len(self._tables)
+
+    def key(self, projector, ontology, *args, **kwargs):
+        """
+        Returns the key of a projection. The hash of the ontology axioms is computed with \
+:func:`mowl.ontology.digest.axioms_digest`, so that it is reused until the ontology changes.
+
+        :param projector: The projector.
+        :type projector: :class:`mowl.projection.base.ProjectionModel`
+        :param ontology: The ontology to be projected.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: str
+        """
+        projector_class = type(projector)
+        parameters = json.dumps([f"{projector_class.__module__}.{projector_class.__qualname__}",
+                                 projector.get_parameters(), args, kwargs],
+                                sort_keys=True, default=str)
+
+        digest = hashlib.sha256(axioms_digest(ontology).encode("utf-8"))
+        digest.update(parameters.encode("utf-8"))
+        return digest.hexdigest()
+
+    def project_table(self, projector, ontology, *args, **kwargs):
+        """
+        Returns the projection of the ontology as a table of edges, projecting it only if it \
+is not in the cache. Extra arguments are passed to :meth:`ProjectionModel.project_table \
+<mowl.projection.base.ProjectionModel.project_table>`.
+
+        :param projector: The projector.
+        :type projector: :class:`mowl.projection.base.ProjectionModel`
+        :param ontology: The ontology to be projected.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        """
+        key = self.key(projector, ontology, *args, **kwargs)
+        if key in self._tables:
+            self._tables.move_to_end(key)
+            return self._tables[key]
+
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = os.path.join(self.cache_dir, f"projection_{key}.npz")
+
+        if cache_file is not None and os.path.exists(cache_file):
+            logger.debug(f"Loading projection from {cache_file}")
+            table = EdgeTable.load(cache_file)
+        else:
+            table = projector.project_table(ontology, *args, **kwargs)
+            if cache_file is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp.npz"
+                table.save(tmp_file)
+                os.replace(tmp_file, cache_file)
+                logger.debug(f"Projection cached in {cache_file}")
+
+        self._tables[key] = table
+        while len(self._tables) > self.max_size:
+            self._tables.popitem(last=False)
+        return table
+
+    def project(self, projector, ontology, *args, **kwargs):
+        """
+        Same as :meth:`project_table`, but returns the edges as a list of :class:`Edge \
+<mowl.projection.edge.Edge>` objects, like :meth:`ProjectionModel.project \
+<mowl.projection.base.ProjectionModel.project>`.
+
+        :rtype: list of :class:`mowl.projection.edge.Edge`
+        """
+        return self.project_table(projector, ontology, *args, **kwargs).to_edges()
+
+    def clear(self):
+        """
+        Removes the projections kept in memory. Files in ``cache_dir`` are not removed.
+        """
+        self._tables.clear()
+
+
+_default_cache = ProjectionCache()
+
+
+def get_projection_cache():
+    """
+    Returns the projection cache shared by models and evaluators. Its ``cache_dir`` can be \
+set to also keep projections on disk.
+
+    :rtype: :class:`ProjectionCache`
+    """
+    return _default_cache
@@ -1,7 +1,7 @@
 from mowl.projection.base import ProjectionModel
 from org.mowl.Projectors import DL2VecProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge import EdgeTable
 import logging
 
 
@@ -21,6 +21,7 @@ class DL2VecProjector(ProjectionModel):
 
         if not isinstance(bidirectional_taxonomy, bool):
             raise TypeError("Optional parameter bidirectional_taxonomy must be of type boolean")
+        self.bidirectional_taxonomy = bidirectional_taxonomy
         self.projector = Projector(bidirectional_taxonomy)
 
     def project(self, ontology, with_individuals=False, verbose=False):
@@ -38,6 +39,17 @@ class DL2VecProjector(ProjectionModel):
         :rtype: list(:class:`mowl.projection.edge.Edge`)
         """
 
+        return self.project_table(ontology, with_individuals, verbose).to_edges()
+
+    def project_table(self, ontology, with_individuals=False, verbose=False):
+        r"""Generates the projection of the ontology as a table of edges. The parameters are the \
+same as in :meth:`project`.
+
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        """
+        return EdgeTable.from_java_edges(self._project_java(ontology, with_individuals, verbose))
+
+    def _project_java(self, ontology, with_individuals, verbose):
         if not isinstance(ontology, OWLOntology):
             raise TypeError(
                 "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
@@ -48,6 +60,4 @@ class DL2VecProjector(ProjectionModel):
         if not isinstance(verbose, bool):
             raise TypeError("Optional parameter verbose must be of type boolean")
 
-        edges = self.projector.project(ontology, with_individuals, verbose)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return self.projector.project(ontology, with_individuals, verbose)
@@ -1,7 +1,11 @@
 from pykeen.triples import TriplesFactory
 from deprecated.sphinx import versionadded, deprecated, versionchanged
 import numpy as np
+import pandas as pd
 import torch as th
+import logging
+
+from mowl.utils.data import pack_names, unpack_names
 
 
 class Edge:
@@ -80,6 +84,9 @@ class Edge:
         :rtype: (list of str, list of str)
         '''
 
+        if isinstance(edges, EdgeTable):
+            return (list(edges.entities), list(edges.relations))
+
         entities = set()
         relations = set()
 
@@ -111,6 +118,10 @@ class Edge:
         :type create_inverse_triple: bool, optional
         :rtype: :class:`pykeen.triples.triples_factory.TriplesFactory`
         """
+        if isinstance(edges, EdgeTable):
+            return edges.as_pykeen(create_inverse_triples=create_inverse_triples,
+                                   entity_to_id=entity_to_id, relation_to_id=relation_to_id)
+
         if entity_to_id is None or relation_to_id is None:
             classes, relations = Edge.getEntitiesAndRelations(edges)
 
@@ -130,3 +141,311 @@ class Edge:
                                          relation_to_id=relation_to_id,
                                          create_inverse_triples=create_inverse_triples)
         return triples_factory
+
+
+class EdgeTable():
+    """
+    Columnar store of graph edges. Edges are kept as a single ``(n, 3)`` ``int64`` array of \
+``(src, rel, dst)`` ids and a ``float32`` array of weights, while entity and relation names are \
+stored once in sorted vocabularies, the same ones returned by \
+:meth:`Edge.get_entities_and_relations`. Iterating over the table yields :class:`Edge` objects, \
+so it can be used where a list of edges is expected.
+
+    :param triples: Array of shape ``(n, 3)`` with the ids of source entity, relation and \
+destination entity of each edge.
+    :type triples: :class:`numpy.ndarray`
+    :param entities: Sorted names of the entities.
+    :type entities: list of str
+    :param relations: Sorted names of the relations.
+    :type relations: list of str
+    :param weights: Weight of each edge. Defaults to ``None``, which assigns weight ``1`` to \
+every edge.
+    :type weights: :class:`numpy.ndarray`, optional
+    """
+
+    def __init__(self, triples, entities, relations, weights=None):
+        triples = np.ascontiguousarray(triples, dtype=np.int64).reshape(-1, 3)
+        if weights is None:
+            weights = np.ones(len(triples), dtype=np.float32)
+
+        self.triples = triples
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.entities = list(entities)
+        self.relations = list(relations)
+        self._entity_to_id = None
+        self._relation_to_id = None
+
+    def __len__(self):
+        return len(self.triples)
+
+    def __iter__(self):
+        entities = self.entities
+        relations = self.relations
+        for (src, rel, dst), weight in zip(self.triples.tolist(), self.weights.tolist()):
+            yield Edge(entities[src], relations[rel], entities[dst], weight=weight)
+
+    def __getitem__(self, index):
+        """
+        Returns the edges selected by a slice, an array of positions or a boolean mask as a \
+new table. Its vocabularies contain only the entities and relations of the selected edges.
+
+        :rtype: :class:`EdgeTable`
+        """
+        triples = self.triples[index].reshape(-1, 3)
+        weights = self.weights[index].reshape(-1)
+
+        entity_ids, nodes = np.unique(triples[:, [0, 2]], return_inverse=True)
+        relation_ids, rels = np.unique(triples[:, 1], return_inverse=True)
+        nodes = nodes.reshape(-1, 2)
+        triples = np.stack([nodes[:, 0], rels.reshape(-1), nodes[:, 1]], axis=1)
+
+        entities = [self.entities[i] for i in entity_ids]
+        relations = [self.relations[i] for i in relation_ids]
+        return EdgeTable(triples, entities, relations, weights=weights)
+
+    @property
+    def src(self):
+        """
+        Returns the source entity ids.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self.triples[:, 0]
+
+    @property
+    def rel(self):
+        """
+        Returns the relation ids.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self.triples[:, 1]
+
+    @property
+    def dst(self):
+        """
+        Returns the destination entity ids.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self.triples[:, 2]
+
+    @property
+    def entity_to_id(self):
+        """
+        Returns a dictionary mapping entity names to ids.
+
+        :rtype: dict
+        """
+        if self._entity_to_id is None:
+            self._entity_to_id = {name: idx for idx, name in enumerate(self.entities)}
+        return self._entity_to_id
+
+    @property
+    def relation_to_id(self):
+        """
+        Returns a dictionary mapping relation names to ids.
+
+        :rtype: dict
+        """
+        if self._relation_to_id is None:
+            self._relation_to_id = {name: idx for idx, name in enumerate(self.relations)}
+        return self._relation_to_id
+
+    @classmethod
+    def from_strings(cls, srcs, rels, dsts, weights=None):
+        """
+        Builds a table from parallel sequences of names.
+
+        :param srcs: Source entity names.
+        :type srcs: list of str
+        :param rels: Relation names.
+        :type rels: list of str
+        :param dsts: Destination entity names.
+        :type dsts: list of str
+        :param weights: Edge weights. Defaults to ``None``.
+        :type weights: list of float, optional
+        :rtype: :class:`EdgeTable`
+        """
+        num_edges = len(srcs)
+        if not num_edges == len(rels) == len(dsts):
+            raise ValueError("Parameters srcs, rels and dsts must have the same length.")
+
+        nodes = pd.Series(list(srcs) + list(dsts), dtype=object)
+        node_ids, entities = pd.factorize(nodes, sort=True)
+        relation_ids, relations = pd.factorize(pd.Series(list(rels), dtype=object), sort=True)
+
+        triples = np.stack([node_ids[:num_edges], relation_ids, node_ids[num_edges:]], axis=1)
+        return cls(triples, entities.tolist(), relations.tolist(), weights=weights)
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Builds a table from a list of :class:`Edge` objects.
+
+        :param edges: List of edges.
+        :type edges: list of :class:`Edge`
+        :rtype: :class:`EdgeTable`
+        """
+        if isinstance(edges, EdgeTable):
+            return edges
+
+        edges = list(edges)
+        srcs, rels, dsts = Edge.zip(edges) if len(edges) > 0 else ((), (), ())
+        weights = [edge.weight for edge in edges]
+        return cls.from_strings(srcs, rels, dsts, weights=weights)
+
+    @classmethod
+    def from_indexed(cls, ids, names, weights=None):
+        """
+        Builds a table from triples given as ids into a single table of names, which may \
+contain both entities and relations.
+
+        :param ids: Array of shape ``(n, 3)`` with indices into ``names``.
+        :type ids: :class:`numpy.ndarray`
+        :param names: Names referenced by ``ids``.
+        :type names: list of str
+        :param weights: Edge weights. Defaults to ``None``.
+        :type weights: :class:`numpy.ndarray`, optional
+        :rtype: :class:`EdgeTable`
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1, 3)
+        names = np.array(names, dtype=object).reshape(-1)
+
+        columns = []
+        vocabularies = []
+        for used in (ids[:, [0, 2]], ids[:, [1]]):
+            codes, inverse = np.unique(used, return_inverse=True)
+            vocabulary = names[codes]
+            order = np.argsort(vocabulary, kind="stable")
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[order] = np.arange(len(order))
+            columns.append(ranks[inverse.reshape(used.shape)])
+            vocabularies.append(vocabulary[order].tolist())
+
+        nodes, rels = columns
+        triples = np.stack([nodes[:, 0], rels[:, 0], nodes[:, 1]], axis=1)
+        return cls(triples, vocabularies[0], vocabularies[1], weights=weights)
+
+    @classmethod
+    def from_java_edges(cls, edges):
+        """
+        Builds a table from the Java edges returned by the Scala projectors. The edges are \
+packed on the JVM side by ``org.mowl.Utils.packTriples`` and read as arrays, so that the cost \
+of crossing the JVM boundary grows with the number of distinct names instead of with the number \
+of edges.
+
+        :param edges: Java edges.
+        :type edges: :class:`java.util.ArrayList`
+        :rtype: :class:`EdgeTable`
+        """
+        try:
+            from org.mowl import Utils
+            packed = Utils.packTriples(edges)
+        except (ImportError, AttributeError):
+            logging.warning("org.mowl.Utils.packTriples is not available. Edges will be read one "
+                            "by one from the JVM. Rebuild the mOWL jars to transfer them in bulk.")
+            srcs, rels, dsts = [], [], []
+            for edge in edges:
+                srcs.append(str(edge.src()))
+                rels.append(str(edge.rel()))
+                dsts.append(str(edge.dst()))
+            return cls.from_strings(srcs, rels, dsts)
+
+        ids = np.asarray(packed.ids(), dtype=np.int64)
+        return cls.from_indexed(ids, unpack_names(packed.names(), packed.nameOffsets()))
+
+    def to_edges(self):
+        """
+        Returns the edges as a list of :class:`Edge` objects.
+
+        :rtype: list of :class:`Edge`
+        """
+        return list(self)
+
+    def deduplicate(self):
+        """
+        Returns a new table without repeated ``(src, rel, dst)`` triples. The first occurrence \
+of each triple is kept.
+
+        :rtype: :class:`EdgeTable`
+        """
+        _, first = np.unique(self.triples, axis=0, return_index=True)
+        return self[np.sort(first)]
+
+    def to_csr(self):
+        """
+        Returns the table as a :class:`mowl.walking.csr.CSRGraph`. Entities keep their ids and \
+relation ids are shifted by the number of entities.
+
+        :rtype: :class:`mowl.walking.csr.CSRGraph`
+        """
+        from mowl.walking.csr import CSRGraph
+
+        num_nodes = len(self.entities)
+        return CSRGraph(self.src, self.rel + num_nodes, self.dst, num_nodes=num_nodes,
+                        weights=self.weights, vocabulary=self.entities + self.relations)
+
+    def as_pykeen(self, create_inverse_triples=True, entity_to_id=None, relation_to_id=None):
+        """
+        Transforms the table into a :class:`pykeen.triples.triples_factory.TriplesFactory`. \
+Without custom mappings, the triples are shared with the factory without copying.
+
+        :param create_inverse_triples: Whether to create inverse triples. Defaults to ``True``
+        :type create_inverse_triples: bool, optional
+        :param entity_to_id: Custom mapping of entity names to ids. Defaults to ``None``.
+        :type entity_to_id: dict, optional
+        :param relation_to_id: Custom mapping of relation names to ids. Defaults to ``None``.
+        :type relation_to_id: dict, optional
+        :rtype: :class:`pykeen.triples.triples_factory.TriplesFactory`
+        """
+        triples = self.triples
+        if entity_to_id is None:
+            entity_to_id = self.entity_to_id
+        else:
+            mapping = np.array([entity_to_id[name] for name in self.entities], dtype=np.int64)
+            triples = triples.copy()
+            triples[:, [0, 2]] = mapping[triples[:, [0, 2]]]
+        if relation_to_id is None:
+            relation_to_id = self.relation_to_id
+        else:
+            mapping = np.array([relation_to_id[name] for name in self.relations], dtype=np.int64)
+            triples = triples.copy() if triples is self.triples else triples
+            triples[:, 1] = mapping[triples[:, 1]]
+
+        return TriplesFactory(th.from_numpy(triples), entity_to_id=entity_to_id,
+                              relation_to_id=relation_to_id,
+                              create_inverse_triples=create_inverse_triples)
+
+    def save(self, path):
+        """
+        Saves the table into a ``.npz`` file. Vocabularies are stored as UTF-8 bytes with \
+offsets, as written by :func:`mowl.utils.data.pack_names`.
+
+        :param path: Path of the file.
+        :type path: str
+        """
+        entity_names, entity_offsets = pack_names(self.entities)
+        relation_names, relation_offsets = pack_names(self.relations)
+        np.savez(path, triples=self.triples, weights=self.weights,
+                 entity_names=entity_names, entity_offsets=entity_offsets,
+                 relation_names=relation_names, relation_offsets=relation_offsets)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a table saved with :meth:`save`.
+
+        :param path: Path of the file.
+        :type path: str
+        :rtype: :class:`EdgeTable`
+        """
+        with np.load(path) as data:
+            if "entity_names" in data:
+                entities = unpack_names(data["entity_names"], data["entity_offsets"])
+                relations = unpack_names(data["relation_names"], data["relation_offsets"])
+            else:
+                # Files saved with fixed-width string vocabularies
+                entities = data["entities"].tolist()
+                relations = data["relations"].tolist()
+            return cls(data["triples"], entities, relations, weights=data["weights"])
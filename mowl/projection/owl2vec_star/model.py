@@ -1,5 +1,5 @@
 from mowl.projection.base import ProjectionModel
-from mowl.projection.edge import Edge
+from mowl.projection.edge import EdgeTable
 from org.mowl.Projectors import OWL2VecStarProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
 
@@ -42,12 +42,22 @@ class OWL2VecStarProjector(ProjectionModel):
         :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
         """
         
+        return self.project_table(ontology).to_edges()
+
+    def project_table(self, ontology):
+        r"""Generates the projection of the ontology as a table of edges.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        """
+        table = EdgeTable.from_java_edges(self._project_java(ontology))
+        if "" in table.entity_to_id:
+            table = table[table.dst != table.entity_to_id[""]]
+        return table
+
+    def _project_java(self, ontology):
         if not isinstance(ontology, OWLOntology):
             raise TypeError(
                 "Parameter ontology must be of type org.semanticweb.owlapi.model.OWLOntology")
-        edges = self.projector.project(ontology)
-
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in
-                 edges if str(e.dst()) != ""]
-
-        return edges
+        return self.projector.project(ontology)
@@ -2,7 +2,7 @@ from mowl.projection.base import ProjectionModel
 
 from org.mowl.Projectors import TaxonomyProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge import EdgeTable
 
 
 class TaxonomyProjector(ProjectionModel):
@@ -19,6 +19,7 @@ class TaxonomyProjector(ProjectionModel):
 
         if not isinstance(bidirectional_taxonomy, bool):
             raise TypeError("Optional parameter bidirectional_taxonomy must be of type boolean")
+        self.bidirectional_taxonomy = bidirectional_taxonomy
         self.projector = Projector(bidirectional_taxonomy)
 
     def project(self, ontology):
@@ -28,11 +29,21 @@ class TaxonomyProjector(ProjectionModel):
         :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
         """
         
+        return self.project_table(ontology).to_edges()
+
+    def project_table(self, ontology):
+        r"""Generates the projection of the ontology as a table of edges.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        """
+        return EdgeTable.from_java_edges(self._project_java(ontology))
+
+    def _project_java(self, ontology):
         if not isinstance(ontology, OWLOntology):
             raise TypeError("Parameter ontology must be of \
 type org.semanticweb.owlapi.model.OWLOntology")
-        edges = self.projector.project(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return self.projector.project(ontology)
 
                             
@@ -1,6 +1,6 @@
 from org.mowl.Projectors import TaxonomyWithRelsProjector as Projector
 from org.semanticweb.owlapi.model import OWLOntology
-from mowl.projection.edge import Edge
+from mowl.projection.edge import EdgeTable
 
 from mowl.projection.base import ProjectionModel
 
@@ -46,6 +46,9 @@ relations a non-empty list")
         for r in relations:
             relationsJ.add(r)
 
+        self.taxonomy = taxonomy
+        self.bidirectional_taxonomy = bidirectional_taxonomy
+        self.relations = [str(r) for r in relations]
         self.projector = Projector(taxonomy, bidirectional_taxonomy, relationsJ)
 
     def project(self, ontology):
@@ -55,9 +58,19 @@ relations a non-empty list")
         :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
         """
         
+        return self.project_table(ontology).to_edges()
+
+    def project_table(self, ontology):
+        r"""Generates the projection of the ontology as a table of edges.
+
+        :param ontology: The ontology to be processed.
+        :type ontology: :class:`org.semanticweb.owlapi.model.OWLOntology`
+        :rtype: :class:`mowl.projection.edge.EdgeTable`
+        """
+        return EdgeTable.from_java_edges(self._project_java(ontology))
+
+    def _project_java(self, ontology):
         if not isinstance(ontology, OWLOntology):
             raise TypeError('Parameter ontology must be of type \
 org.semanticweb.owlapi.model.OWLOntology')
-        edges = self.projector.project(ontology)
-        edges = [Edge(str(e.src()), str(e.rel()), str(e.dst())) for e in edges]
-        return edges
+        return self.projector.project(ontology)
@@ -1,3 +1,4 @@
+import numpy as np
 import torch as th
 
 
@@ -59,3 +60,39 @@ class FastTensorDataLoader:
 
     def __len__(self):
         return self.n_batches
+
+
+def pack_names(names):
+    """
+    Encodes names as a table of UTF-8 names written one after the other. This is the inverse \
+of :func:`unpack_names`.
+
+    :param names: Names to encode.
+    :type names: list of str
+    :return: Concatenated UTF-8 encoded names and the start of each name followed by the end of \
+the last one.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_names(names, offsets):
+    """
+    Decodes a table of UTF-8 names written one after the other, such as the ones returned by \
+``org.mowl.Utils.packTriples`` and ``org.mowl.Utils.packAxioms``. The name with id ``i`` is \
+``names[offsets[i]:offsets[i + 1]]``.
+
+    :param names: Concatenated UTF-8 encoded names.
+    :type names: bytes or array of int8
+    :param offsets: Start of each name followed by the end of the last one.
+    :type offsets: array of int
+    :rtype: list of str
+    """
+
+    data = np.asarray(names, dtype=np.int8).tobytes()
+    offsets = np.asarray(offsets, dtype=np.int64).tolist()
+    return [data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
@@ -1,3 +1,5 @@
+from .csr import CSRGraph, random_walks, iter_random_walks
+from .corpus import WalkCorpus
 from .walking import WalkingModel
 from .deepwalk.model import DeepWalk
 from .node2vec.model import Node2Vec
@@ -0,0 +1,198 @@
+import json
+import os
+
+import numpy as np
+
+
+class WalkCorpus():
+    """
+    Collection of random walks stored as integer ids over a shared vocabulary. The tokens of all \
+the walks are kept in a single flat ``uint32`` array and the start of each walk in an ``int64`` \
+array of offsets. Iterating over the corpus yields each walk as a list of strings, as expected by \
+:class:`gensim.models.word2vec.Word2Vec`, and can be repeated for every epoch without reading or \
+parsing text. Each call to :meth:`add` or :meth:`add_sentences` appends a new segment, which can \
+be retrieved with :meth:`segment`.
+
+    :param vocabulary: Initial vocabulary. Defaults to ``None``.
+    :type vocabulary: list, optional
+    """
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = []
+        self._token_ids = dict()
+        self.tokens = np.zeros(0, dtype=np.uint32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.segments = np.zeros(1, dtype=np.int64)
+
+        if vocabulary is not None:
+            self._map_vocabulary(vocabulary)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_tokens(self):
+        """
+        Returns the total number of tokens in the corpus.
+
+        :rtype: int
+        """
+        return len(self.tokens)
+
+    def _map_vocabulary(self, vocabulary):
+        # Adds the new names to the vocabulary and returns the corpus id of each name
+        ids = np.zeros(len(vocabulary), dtype=np.int64)
+        for i, name in enumerate(vocabulary):
+            if name not in self._token_ids:
+                self._token_ids[name] = len(self.vocabulary)
+                self.vocabulary.append(name)
+            ids[i] = self._token_ids[name]
+        return ids
+
+    def add(self, walks, vocabulary=None):
+        """
+        Adds walks to the corpus.
+
+        :param walks: Integer array of shape ``(n, l)`` with one walk per row, padded at the end \
+with negative values, as returned by :func:`mowl.walking.csr.random_walks`.
+        :type walks: :class:`numpy.ndarray`
+        :param vocabulary: Names of the ids used in ``walks``. Defaults to ``None``, which means \
+that the walks already use the ids of the corpus.
+        :type vocabulary: list, optional
+        """
+        walks = np.asarray(walks)
+        mask = walks >= 0
+        tokens = walks[mask]
+        if vocabulary is not None:
+            tokens = self._map_vocabulary(vocabulary)[tokens]
+        elif len(tokens) > 0 and tokens.max() >= len(self.vocabulary):
+            raise ValueError("Walks contain ids that are not in the vocabulary.")
+
+        lengths = mask.sum(axis=1)
+        offsets = self.offsets[-1] + np.cumsum(lengths)
+        self.tokens = np.concatenate([self.tokens, tokens.astype(np.uint32)])
+        self.offsets = np.concatenate([self.offsets, offsets])
+        self.segments = np.append(self.segments, len(self))
+
+    def add_sentences(self, sentences):
+        """
+        Adds walks given as lists of strings.
+
+        :param sentences: Iterable of lists of tokens.
+        :type sentences: iterable
+        """
+        tokens, lengths = [], []
+        for sentence in sentences:
+            for name in sentence:
+                if name not in self._token_ids:
+                    self._token_ids[name] = len(self.vocabulary)
+                    self.vocabulary.append(name)
+                tokens.append(self._token_ids[name])
+            lengths.append(len(sentence))
+
+        offsets = self.offsets[-1] + np.cumsum(np.array(lengths, dtype=np.int64))
+        self.tokens = np.concatenate([self.tokens, np.array(tokens, dtype=np.uint32)])
+        self.offsets = np.concatenate([self.offsets, offsets])
+        self.segments = np.append(self.segments, len(self))
+
+    @property
+    def num_segments(self):
+        """
+        Returns the number of segments of the corpus.
+
+        :rtype: int
+        """
+        return len(self.segments) - 1
+
+    def segment(self, index):
+        """
+        Returns the walks added by one call to :meth:`add` or :meth:`add_sentences` as a new \
+corpus sharing the vocabulary and the token array of this one.
+
+        :param index: Index of the segment. Negative values count from the last segment.
+        :type index: int
+        :rtype: :class:`WalkCorpus`
+        """
+        index = range(self.num_segments)[index]
+        first, last = self.segments[index], self.segments[index + 1]
+
+        segment = WalkCorpus()
+        segment.vocabulary = self.vocabulary
+        segment._token_ids = self._token_ids
+        segment.tokens = self.tokens[self.offsets[first]:self.offsets[last]]
+        segment.offsets = self.offsets[first:last + 1] - self.offsets[first]
+        segment.segments = np.array([0, last - first], dtype=np.int64)
+        return segment
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Reads a corpus from a text file with one walk per line and tokens separated by spaces.
+
+        :param path: Path of the text file.
+        :type path: str
+        :rtype: :class:`WalkCorpus`
+        """
+        corpus = cls()
+        with open(path, "r") as f:
+            corpus.add_sentences(line.split() for line in f)
+        return corpus
+
+    def __iter__(self):
+        names = np.array(self.vocabulary, dtype=object)
+        offsets = np.asarray(self.offsets)
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield names[self.tokens[start:end]].tolist()
+
+    def save(self, path):
+        """
+        Saves the corpus into a directory in binary format: the tokens, offsets and segments as \
+``.npy`` files and the vocabulary as a JSON list.
+
+        :param path: Path of the directory.
+        :type path: str
+        """
+        os.makedirs(path, exist_ok=True)
+        # Files are replaced instead of overwritten, since they might be memory-mapped
+        arrays = [("tokens.npy", self.tokens), ("offsets.npy", self.offsets),
+                  ("segments.npy", self.segments)]
+        for name, array in arrays:
+            tmp_path = os.path.join(path, f"tmp_{name}")
+            np.save(tmp_path, array)
+            os.replace(tmp_path, os.path.join(path, name))
+        with open(os.path.join(path, "vocabulary.json"), "w") as f:
+            json.dump(self.vocabulary, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads a corpus saved with :meth:`save`.
+
+        :param path: Path of the directory.
+        :type path: str
+        :param mmap: If ``True``, tokens and offsets are memory-mapped instead of read into \
+memory. Defaults to ``True``.
+        :type mmap: bool, optional
+        :rtype: :class:`WalkCorpus`
+        """
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, "vocabulary.json"), "r") as f:
+            corpus = cls(json.load(f))
+        corpus.tokens = np.load(os.path.join(path, "tokens.npy"), mmap_mode=mmap_mode)
+        corpus.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode=mmap_mode)
+        corpus.segments = np.load(os.path.join(path, "segments.npy"))
+        return corpus
+
+    def spill(self, path):
+        """
+        Saves the corpus into ``path`` and replaces its arrays with memory-mapped views of the \
+saved files, so that they do not stay in memory.
+
+        :param path: Path of the directory.
+        :type path: str
+        :rtype: :class:`WalkCorpus`
+        """
+        self.save(path)
+        self.tokens = np.load(os.path.join(path, "tokens.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+        return self
@@ -0,0 +1,348 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+WALK_METHODS = ["deepwalk", "node2vec"]
+SAMPLING_METHODS = ["exact", "rejection"]
+
+
+class CSRGraph():
+    """
+    Directed multigraph stored in compressed sparse row (CSR) format. Node and relation names \
+share a single vocabulary: nodes take the ids ``[0, num_nodes)`` and relations that are not nodes \
+take the following ids, so that walks mixing nodes and relations can be stored in a single \
+integer array.
+
+    :param src: Source node id of each edge.
+    :type src: :class:`numpy.ndarray`
+    :param rel: Relation id of each edge.
+    :type rel: :class:`numpy.ndarray`
+    :param dst: Destination node id of each edge.
+    :type dst: :class:`numpy.ndarray`
+    :param num_nodes: Number of nodes. Defaults to ``None``, which takes the largest node id \
+plus one.
+    :type num_nodes: int, optional
+    :param weights: Weight of each edge. Defaults to ``None``, which assigns weight ``1`` to \
+every edge.
+    :type weights: :class:`numpy.ndarray`, optional
+    :param vocabulary: Names of the ids used in the graph. Defaults to ``None``.
+    :type vocabulary: list, optional
+    """
+
+    def __init__(self, src, rel, dst, num_nodes=None, weights=None, vocabulary=None):
+        src = np.asarray(src, dtype=np.int64)
+        rel = np.asarray(rel, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int64)
+
+        if not len(src) == len(rel) == len(dst):
+            raise ValueError("Arrays src, rel and dst must have the same length.")
+
+        if num_nodes is None:
+            num_nodes = int(max(src.max(), dst.max())) + 1 if len(src) > 0 else 0
+        if weights is None:
+            weights = np.ones(len(src), dtype=np.float32)
+        weights = np.asarray(weights, dtype=np.float32)
+
+        # Rows are sorted by destination so that edge_keys is sorted as well
+        order = np.lexsort((dst, src))
+        src, rel, dst, weights = src[order], rel[order], dst[order], weights[order]
+
+        self.num_nodes = num_nodes
+        self.indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum(np.bincount(src, minlength=num_nodes))
+        self.indices = dst.astype(np.int32)
+        self.relations = rel
+        self.weights = weights
+        self.edge_keys = src * num_nodes + dst
+        self.vocabulary = vocabulary
+        self._cumulative_weights = None
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def degrees(self):
+        """
+        Returns the out-degree of each node.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        return np.diff(self.indptr)
+
+    @property
+    def cumulative_weights(self):
+        """
+        Returns the cumulative sum of the edge weights, used to draw neighbors proportionally to \
+the weights of the edges.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._cumulative_weights is None:
+            self._cumulative_weights = np.cumsum(self.weights, dtype=np.float64)
+        return self._cumulative_weights
+
+    def sample_neighbors(self, nodes, rng):
+        """
+        Draws one outgoing edge of each node with probability proportional to the edge weights. \
+All nodes must have at least one outgoing edge.
+
+        :param nodes: Node ids.
+        :type nodes: :class:`numpy.ndarray`
+        :param rng: Random generator.
+        :type rng: :class:`numpy.random.Generator`
+        :return: Positions of the drawn edges in :attr:`indices`.
+        :rtype: :class:`numpy.ndarray`
+        """
+        starts, ends = self.indptr[nodes], self.indptr[nodes + 1]
+        cumulative = self.cumulative_weights
+        before = np.where(starts > 0, cumulative[starts - 1], 0.)
+        targets = before + rng.random(len(nodes)) * (cumulative[ends - 1] - before)
+        return np.searchsorted(cumulative, targets, side="right").clip(starts, ends - 1)
+
+    def has_edges(self, src, dst):
+        """
+        Checks whether there is an edge (with any relation) from each node in ``src`` to the \
+corresponding node in ``dst``.
+
+        :param src: Source node ids.
+        :type src: :class:`numpy.ndarray`
+        :param dst: Destination node ids.
+        :type dst: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ndarray`
+        """
+        if len(self.edge_keys) == 0:
+            return np.zeros(len(src), dtype=bool)
+        keys = np.asarray(src, dtype=np.int64) * self.num_nodes + np.asarray(dst, dtype=np.int64)
+        positions = np.searchsorted(self.edge_keys, keys).clip(max=len(self.edge_keys) - 1)
+        return self.edge_keys[positions] == keys
+
+    def predecessors(self, nodes, hops=1):
+        """
+        Returns the nodes from which any of ``nodes`` can be reached in at most ``hops`` steps, \
+including ``nodes`` themselves.
+
+        :param nodes: Node ids.
+        :type nodes: :class:`numpy.ndarray`
+        :param hops: Maximum number of steps. Defaults to ``1``.
+        :type hops: int, optional
+        :rtype: :class:`numpy.ndarray`
+        """
+        reached = np.zeros(self.num_nodes, dtype=bool)
+        reached[np.asarray(nodes, dtype=np.int64)] = True
+        sources = np.repeat(np.arange(self.num_nodes), self.degrees)
+        for _ in range(hops):
+            new = sources[reached[self.indices]]
+            if reached[new].all():
+                break
+            reached[new] = True
+        return np.flatnonzero(reached)
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Builds a graph from a list of edges.
+
+        :param edges: List of edges or table of edges.
+        :type edges: list(:class:`mowl.projection.edge.Edge`) or \
+:class:`mowl.projection.edge.EdgeTable`
+        :rtype: :class:`CSRGraph`
+        """
+        if hasattr(edges, "to_csr"):
+            return edges.to_csr()
+
+        node_ids = dict()
+        for edge in edges:
+            node_ids.setdefault(edge.src, len(node_ids))
+            node_ids.setdefault(edge.dst, len(node_ids))
+        num_nodes = len(node_ids)
+
+        ids = dict(node_ids)
+        for edge in edges:
+            ids.setdefault(edge.rel, len(ids))
+
+        src = np.fromiter((ids[edge.src] for edge in edges), dtype=np.int64, count=len(edges))
+        rel = np.fromiter((ids[edge.rel] for edge in edges), dtype=np.int32, count=len(edges))
+        dst = np.fromiter((ids[edge.dst] for edge in edges), dtype=np.int64, count=len(edges))
+        weights = np.fromiter((edge.weight for edge in edges), dtype=np.float32,
+                              count=len(edges))
+        return cls(src, rel, dst, num_nodes=num_nodes, weights=weights, vocabulary=list(ids))
+
+
+def iter_random_walks(graph, starts, walk_length, method="deepwalk", alpha=0., p=1., q=1.,
+                      sampling="exact", restart_id=-1, seed=None, block_size=4096):
+    """
+    Generates random walks block by block in the current process. Walks alternate nodes and \
+relations: ``[node, rel, node, rel, ..., node]``, and have at most ``2 * walk_length - 1`` \
+tokens. Walks reaching a node without outgoing edges stop early and are padded with ``-1``.
+
+    :param graph: The graph to walk on.
+    :type graph: :class:`CSRGraph`
+    :param starts: Start node of each walk.
+    :type starts: :class:`numpy.ndarray`
+    :param walk_length: Maximum number of nodes of each walk.
+    :type walk_length: int
+    :param method: Either ``"deepwalk"`` or ``"node2vec"``. Defaults to ``"deepwalk"``.
+    :type method: str, optional
+    :param alpha: DeepWalk probability of restarting the walk at its start node. Restarts are \
+recorded with the ``restart_id`` token. Defaults to ``0``.
+    :type alpha: float, optional
+    :param p: node2vec return hyperparameter. Defaults to ``1``.
+    :type p: float, optional
+    :param q: node2vec in-out hyperparameter. Defaults to ``1``.
+    :type q: float, optional
+    :param sampling: How node2vec draws the next node. With ``"exact"``, the biased weights of \
+all the neighbors of the current node are computed at every step, which costs time linear in its \
+degree. With ``"rejection"``, a neighbor is proposed proportionally to the edge weights and \
+accepted with probability equal to its bias divided by the largest bias, :math:`\\max(1/p, 1, \
+1/q)`, which costs constant expected time per step and keeps hubs cheap. Both produce the same \
+distribution of walks and, unlike alias tables, neither stores anything per pair of edges. \
+Defaults to ``"exact"``.
+    :type sampling: str, optional
+    :param restart_id: Token written before the start node when a DeepWalk walk restarts. \
+Defaults to ``-1``.
+    :type restart_id: int, optional
+    :param seed: Seed of the walks. Block ``i`` uses a generator seeded with ``(seed, i)``, so \
+that the walks do not depend on the number of workers. Defaults to ``None``.
+    :type seed: int, optional
+    :param block_size: Number of walks generated at a time. Defaults to ``4096``.
+    :type block_size: int, optional
+    :return: Generator of ``int32`` arrays of shape ``(n, 2 * walk_length - 1)``.
+    """
+    if method not in WALK_METHODS:
+        raise ValueError(f"Parameter method must be one of {WALK_METHODS}.")
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Parameter sampling must be one of {SAMPLING_METHODS}.")
+
+    entropy = np.random.SeedSequence(seed).entropy
+    starts = np.asarray(starts, dtype=np.int64)
+    params = (walk_length, method, alpha, p, q, sampling, restart_id)
+    for block, first in enumerate(range(0, len(starts), block_size)):
+        rng = np.random.default_rng([entropy, block])
+        yield _walk_block(graph, starts[first:first + block_size], rng, *params)
+
+
+def random_walks(graph, starts, walk_length, method="deepwalk", alpha=0., p=1., q=1.,
+                 sampling="exact", restart_id=-1, seed=None, block_size=4096, workers=1):
+    """
+    Generates random walks in a single ``int32`` array. With more than one worker, blocks of \
+walks are generated by a pool of threads that read the CSR arrays of the graph and write into \
+the output array, and the function returns once all of them have finished. Threads are used \
+instead of processes because the process usually hosts the JVM, which does not survive a fork. \
+The parameters are the ones of :func:`iter_random_walks`.
+
+    :param workers: Number of threads. Defaults to ``1``.
+    :type workers: int, optional
+    :rtype: :class:`numpy.ndarray`
+    """
+    width = 2 * walk_length - 1
+    num_blocks = -(-len(starts) // block_size)
+    kwargs = dict(method=method, alpha=alpha, p=p, q=q, sampling=sampling,
+                  restart_id=restart_id, seed=seed, block_size=block_size)
+
+    if workers <= 1 or num_blocks <= 1:
+        walks = list(iter_random_walks(graph, starts, walk_length, **kwargs))
+        if len(walks) == 0:
+            return np.zeros((0, width), dtype=np.int32)
+        return np.concatenate(walks)
+
+    if method not in WALK_METHODS:
+        raise ValueError(f"Parameter method must be one of {WALK_METHODS}.")
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Parameter sampling must be one of {SAMPLING_METHODS}.")
+
+    if method == "node2vec":
+        # Computed before starting the threads so that they share it
+        graph.cumulative_weights
+
+    starts = np.asarray(starts, dtype=np.int64)
+    walks = np.empty((len(starts), width), dtype=np.int32)
+    entropy = np.random.SeedSequence(seed).entropy
+    params = (walk_length, method, alpha, p, q, sampling, restart_id)
+
+    def fill_block(block):
+        first = block * block_size
+        last = first + block_size
+        rng = np.random.default_rng([entropy, block])
+        walks[first:last] = _walk_block(graph, starts[first:last], rng, *params)
+
+    with ThreadPoolExecutor(max_workers=min(workers, num_blocks)) as executor:
+        list(executor.map(fill_block, range(num_blocks)))
+    return walks
+
+
+def _walk_block(graph, starts, rng, walk_length, method, alpha, p, q, sampling, restart_id):
+    walks = np.full((len(starts), 2 * walk_length - 1), -1, dtype=np.int32)
+    walks[:, 0] = starts
+
+    rows = np.arange(len(starts))
+    current = starts
+    for column in range(1, walks.shape[1], 2):
+        degrees = graph.indptr[current + 1] - graph.indptr[current]
+        active = degrees > 0
+        rows, current, degrees = rows[active], current[active], degrees[active]
+        if len(rows) == 0:
+            break
+
+        if method == "deepwalk":
+            positions = graph.indptr[current] + rng.integers(degrees)
+            nodes = graph.indices[positions].astype(np.int64)
+            relations = graph.relations[positions]
+            if alpha > 0:
+                restart = rng.random(len(rows)) < alpha
+                nodes = np.where(restart, walks[rows, 0], nodes)
+                relations = np.where(restart, restart_id, relations)
+        else:
+            previous = walks[rows, column - 3] if column > 1 else None
+            if previous is None:
+                positions = graph.sample_neighbors(current, rng)
+            elif sampling == "rejection":
+                positions = _node2vec_rejection_step(graph, current, previous, p, q, rng)
+            else:
+                positions = _node2vec_step(graph, current, previous, degrees, p, q, rng)
+            nodes = graph.indices[positions].astype(np.int64)
+            relations = graph.relations[positions]
+
+        walks[rows, column] = relations
+        walks[rows, column + 1] = nodes
+        current = nodes
+    return walks
+
+
+def _node2vec_step(graph, current, previous, degrees, p, q, rng):
+    # Biased weights of the neighbors of all walkers, laid out one segment per walker
+    segments = np.repeat(np.arange(len(current)), degrees)
+    offsets = np.arange(len(segments)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+    positions = graph.indptr[current][segments] + offsets
+
+    neighbors = graph.indices[positions]
+    back = previous[segments]
+    weights = graph.weights[positions] * _node2vec_bias(graph, neighbors, back, p, q)
+    return positions[_sample_segments(weights, degrees, rng)]
+
+
+def _node2vec_rejection_step(graph, current, previous, p, q, rng):
+    max_bias = max(1 / p, 1., 1 / q)
+    positions = np.zeros(len(current), dtype=np.int64)
+    pending = np.arange(len(current))
+    while len(pending) > 0:
+        proposals = graph.sample_neighbors(current[pending], rng)
+        bias = _node2vec_bias(graph, graph.indices[proposals], previous[pending], p, q)
+        accepted = rng.random(len(pending)) * max_bias < bias
+        positions[pending[accepted]] = proposals[accepted]
+        pending = pending[~accepted]
+    return positions
+
+
+def _node2vec_bias(graph, neighbors, previous, p, q):
+    return np.where(neighbors == previous, 1 / p,
+                    np.where(graph.has_edges(neighbors, previous), 1., 1 / q))
+
+
+def _sample_segments(weights, lengths, rng):
+    # Draws one index per segment of weights with probability proportional to the weights
+    cumulative = np.cumsum(weights)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    before = np.where(starts > 0, cumulative[starts - 1], 0.)
+    targets = before + rng.random(len(lengths)) * (cumulative[ends - 1] - before)
+    return np.searchsorted(cumulative, targets, side="right").clip(starts, ends - 1)
@@ -29,9 +29,12 @@ class DeepWalk(WalkingModel):
                  alpha=0.,
                  outfile=None,
                  workers=1,
-                 seed=0
+                 seed=0,
+                 backend="jvm",
+                 corpus_dir=None
                  ):
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         backend=backend, corpus_dir=corpus_dir)
 
         # Type checking
         if not isinstance(alpha, float):
@@ -44,27 +47,36 @@ class DeepWalk(WalkingModel):
 
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
     focus on when generating the random walks.")
-    def walk(self, edges, nodes_of_interest=None):
-        if nodes_of_interest is None:
-            nodes_of_interest = ArrayList()
-        else:
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None, hops=0):
+        self._check_start_nodes(start_nodes)
+        if nodes_of_interest is not None:
             all_nodes, _ = PyEdge.get_entities_and_relations(edges)
             all_nodes = set(all_nodes)
             python_nodes = nodes_of_interest[:]
-            nodes_of_interest = ArrayList()
+            nodes_of_interest = []
             for node in python_nodes:
                 if node in all_nodes:
-                    nodes_of_interest.add(node)
+                    nodes_of_interest.append(node)
                 else:
                     logger.info(f"Node {node} does not exist in the graph. Ignoring it.")
 
+        if self.backend == "python":
+            self._walk_native(edges, nodes_of_interest, start_nodes=start_nodes, hops=hops,
+                              append=True, seed=self.seed, method="deepwalk",
+                              alpha=self.alpha)
+            return
+
+        nodes_of_interestJ = ArrayList()
+        for node in nodes_of_interest or []:
+            nodes_of_interestJ.add(node)
+
         edgesJ = ArrayList()
         for edge in edges:
             newEdge = Edge(edge.src, edge.rel, edge.dst)
             edgesJ.add(newEdge)
 
         walker = DW(edgesJ, self.num_walks, self.walk_length, self.alpha, self.workers,
-                    self.outfile, nodes_of_interest, self.seed)
+                    self.outfile, nodes_of_interestJ, self.seed)
 
         walker.walk()
 
@@ -6,11 +6,13 @@ WALKING_METHODS = ["deepwalk", "node2vec"]
 
 
 def walker_factory(method_name, num_walks, walk_length, outfile=None, workers=1, alpha=0.,
-                   p=1., q=1.):
+                   p=1., q=1., backend="jvm"):
 
     if method_name == "deepwalk":
-        return DeepWalk(num_walks, walk_length, alpha=alpha, outfile=outfile, workers=workers)
+        return DeepWalk(num_walks, walk_length, alpha=alpha, outfile=outfile, workers=workers,
+                        backend=backend)
     elif method_name == "node2vec":
-        return Node2Vec(num_walks, walk_length, p=p, q=q, outfile=outfile, workers=workers)
+        return Node2Vec(num_walks, walk_length, p=p, q=q, outfile=outfile, workers=workers,
+                        backend=backend)
     else:
         raise ValueError(INVALID_WALKER_NAME)
@@ -20,6 +20,13 @@ class Node2Vec(WalkingModel):
     :type p: float
     :param q: In-out hyperparameter. Default is 1.
     :type q: float
+    :param seed: Seed of the walks generated with the ``"python"`` backend. Default is ``None``.
+    :type seed: int, optional
+    :param sampling: Either ``"exact"`` or ``"rejection"``. With ``"rejection"``, the next node \
+is drawn by rejection sampling, which needs neither the per-edge alias tables of the JVM backend \
+nor time linear in the degree of hubs, and produces the same distribution of walks. It requires \
+``backend="python"``. Default is ``"exact"``.
+    :type sampling: str, optional
     '''
 
     def __init__(self,
@@ -28,10 +35,15 @@ class Node2Vec(WalkingModel):
                  p=1,
                  q=1,
                  outfile=None,
-                 workers=1
+                 workers=1,
+                 seed=None,
+                 sampling="exact",
+                 backend="jvm",
+                 corpus_dir=None
                  ):
 
-        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers)
+        super().__init__(num_walks, walk_length, outfile=outfile, workers=workers,
+                         backend=backend, corpus_dir=corpus_dir)
 
         # Type checking
         if not isinstance(p, float):
@@ -44,30 +56,45 @@ class Node2Vec(WalkingModel):
                 q = float(q)
             else:
                 raise TypeError("Optional parameter q must be of type int or float")
+        if sampling not in ["exact", "rejection"]:
+            raise ValueError("Optional parameter sampling must be one of 'exact' or 'rejection'")
+        if sampling == "rejection" and backend != "python":
+            raise ValueError("Rejection sampling requires backend='python'")
         self.p = p
         self.q = q
+        self.seed = seed
+        self.sampling = sampling
 
-    def walk(self, edges, nodes_of_interest=None):
-        if nodes_of_interest is None:
-            nodes_of_interest = ArrayList()
-        else:
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None, hops=0):
+        self._check_start_nodes(start_nodes)
+        if nodes_of_interest is not None:
             all_nodes, _ = PyEdge.getEntitiesAndRelations(edges)
             all_nodes = set(all_nodes)
             python_nodes = nodes_of_interest[:]
-            nodes_of_interest = ArrayList()
+            nodes_of_interest = []
             for node in python_nodes:
                 if node in all_nodes:
-                    nodes_of_interest.add(node)
+                    nodes_of_interest.append(node)
                 else:
                     logger.info(f"Node {node} does not exist in the graph. Ignoring it.")
 
+        if self.backend == "python":
+            self._walk_native(edges, nodes_of_interest, start_nodes=start_nodes, hops=hops,
+                              seed=self.seed, method="node2vec",
+                              p=self.p, q=self.q, sampling=self.sampling)
+            return
+
+        nodes_of_interestJ = ArrayList()
+        for node in nodes_of_interest or []:
+            nodes_of_interestJ.add(node)
+
         edgesJ = ArrayList()
         for edge in edges:
             newEdge = Edge(edge.src, edge.rel, edge.dst, edge.weight)
             edgesJ.add(newEdge)
 
         walker = N2V(edgesJ, self.num_walks, self.walk_length, self.p, self.q, self.workers,
-                     self.outfile, nodes_of_interest)
+                     self.outfile, nodes_of_interestJ)
 
         walker.walk()
 
@@ -2,6 +2,12 @@ import os
 import time
 from deprecated.sphinx import versionchanged, versionadded
 import tempfile
+import numpy as np
+from mowl.walking.csr import CSRGraph, random_walks
+from mowl.walking.corpus import WalkCorpus
+
+BACKENDS = ["jvm", "python"]
+RESTART_TOKEN = "*****"
 
 
 class WalkingModel():
@@ -15,9 +21,19 @@ class WalkingModel():
     :type walk_length: int
     :param workers: Number of threads to be used for computing the walks, defaults to 1'
     :type workers: int, optional
+    :param backend: Either ``"jvm"``, which generates the walks with the Scala walkers, or \
+``"python"``, which generates them with :mod:`mowl.walking.csr` in vectorized blocks over a CSR \
+adjacency, using ``workers`` threads. The ``"python"`` backend returns as soon as the walks \
+are written and keeps them in :attr:`walks`. Defaults to ``"jvm"``.
+    :type backend: str, optional
+    :param corpus_dir: Directory where the ``"python"`` backend saves the walks in the binary \
+format of :class:`mowl.walking.corpus.WalkCorpus`, memory-mapped afterwards, instead of writing \
+them to ``outfile`` as text. Defaults to ``None``.
+    :type corpus_dir: str, optional
     '''
 
-    def __init__(self, num_walks, walk_length, outfile, workers=1):
+    def __init__(self, num_walks, walk_length, outfile, workers=1, backend="jvm",
+                 corpus_dir=None):
 
         if not isinstance(num_walks, int):
             raise TypeError("Parameter num_walks must be an integer")
@@ -25,6 +41,10 @@ class WalkingModel():
             raise TypeError("Parameter walk_length must be an integer")
         if not isinstance(workers, int):
             raise TypeError("Optional parameter workers must be an integer")
+        if backend not in BACKENDS:
+            raise ValueError(f"Optional parameter backend must be one of {BACKENDS}")
+        if corpus_dir is not None and not isinstance(corpus_dir, str):
+            raise TypeError("Optional parameter corpus_dir must be a string")
 
         if outfile is None:
             tmp_file = tempfile.NamedTemporaryFile()
@@ -37,11 +57,30 @@ class WalkingModel():
         self.num_walks = num_walks
         self.walk_length = walk_length
         self.workers = workers
+        self.backend = backend
+
+        self.corpus_dir = corpus_dir
+
+        self.walks = None
+        self.vocabulary = None
+        self._corpus = None
+
+    @property
+    def corpus(self):
+        """
+        Returns the walks generated so far as a :class:`mowl.walking.corpus.WalkCorpus`. The \
+``"python"`` backend keeps it up to date in memory. Otherwise, it is read from ``outfile``.
+
+        :rtype: :class:`mowl.walking.corpus.WalkCorpus`
+        """
+        if self.backend == "python":
+            return self._corpus
+        return WalkCorpus.from_file(self.outfile)
 
     # Abstract methods
     @versionchanged(version="0.1.0", reason="The method now can accept a list of entities to \
         focus on when generating the random walks.")
-    def walk(self, edges, nodes_of_interest=None):
+    def walk(self, edges, nodes_of_interest=None, start_nodes=None, hops=0):
         '''
         This method will generate random walks from a graph in the form of edgelist.
 
@@ -51,11 +90,65 @@ class WalkingModel():
         contains at least one word of interest, it will be saved into disk, otherwise it will be \
         ignored.  If no list is input, all the nodes will be considered. Defaults to ``None``
         :type nodes_of_interest: list, optional
+        :param start_nodes: List of node names to start the walks from, together with the nodes \
+that reach them in at most ``hops`` steps. The new walks are appended to :attr:`corpus` as a new \
+segment. Only supported by the ``"python"`` backend. Defaults to ``None``, which starts walks \
+from all the nodes.
+        :type start_nodes: list, optional
+        :param hops: Number of steps used to extend ``start_nodes``. Defaults to ``0``.
+        :type hops: int, optional
         '''
 
         raise NotImplementedError()
 
 
+    def _check_start_nodes(self, start_nodes):
+        if start_nodes is not None and self.backend != "python":
+            raise ValueError("Parameter start_nodes requires backend='python'")
+
+    def _walk_native(self, edges, nodes_of_interest=None, start_nodes=None, hops=0,
+                     append=False, seed=None, **kwargs):
+        """
+        Generates the walks with the ``"python"`` backend, stores them in :attr:`walks` as an \
+``int32`` array of ids of :attr:`vocabulary` padded with ``-1``, adds them to :attr:`corpus` and \
+writes them to the output file.
+        """
+        graph = CSRGraph.from_edges(edges)
+        vocabulary = graph.vocabulary + [RESTART_TOKEN]
+        node_ids = {name: idx for idx, name in enumerate(graph.vocabulary[:graph.num_nodes])}
+
+        if start_nodes is None:
+            nodes = np.arange(graph.num_nodes)
+        else:
+            append = True
+            nodes = [node_ids[node] for node in start_nodes if node in node_ids]
+            nodes = graph.predecessors(nodes, hops=hops)
+
+        rng = np.random.default_rng(seed)
+        starts = np.concatenate([rng.permutation(nodes) for _ in range(self.num_walks)])
+        walks = random_walks(graph, starts, self.walk_length, restart_id=len(vocabulary) - 1,
+                             seed=seed, workers=self.workers, **kwargs)
+
+        if nodes_of_interest:
+            interest_ids = [node_ids[node] for node in nodes_of_interest]
+            walks = walks[np.isin(walks, interest_ids).any(axis=1)]
+
+        self.walks = walks
+        self.vocabulary = vocabulary
+
+        if not append or self._corpus is None:
+            self._corpus = WalkCorpus()
+        self._corpus.add(walks, vocabulary)
+        if self.corpus_dir is not None:
+            self._corpus.spill(self.corpus_dir)
+            return
+
+        names = np.array(vocabulary, dtype=object)
+        lengths = (walks >= 0).sum(axis=1)
+        with open(self.outfile, "a" if append else "w") as f:
+            f.writelines(" ".join(names[walk[:length]]) + "\n"
+                         for walk, length in zip(walks, lengths))
+
     def wait_for_all_walks(self):
         """
         This method waits until all the walks are written to the output file.
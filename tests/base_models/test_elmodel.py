@@ -4,7 +4,8 @@ from mowl.base_models.model import Model
 from mowl.datasets import Dataset
 from tests.datasetFactory import FamilyDataset, PPIYeastSlimDataset
 from mowl.datasets.el import ELDataset
-from mowl.models import ELEmbeddings
+from mowl.models import ELEmbeddings, ELBE, BoxSquaredEL
+from mowl.nn import UniformNegativeSampler
 import random
 import torch as th
 import numpy as np
@@ -215,3 +216,59 @@ non-existing attributes"""
                 self.assertIsInstance(key, str)
                 self.assertIsInstance(value, np.ndarray)
                 self.assertEqual(value.shape, (embed_dim,))
+
+    def test_training_batches(self):
+        """This should check that training_batches covers all non-empty GCI datasets in \
+batches of at most batch_size"""
+
+        model = ELEmbeddings(self.family_dataset, embed_dim=2, batch_size=2)
+        batches = list(model.training_batches())
+
+        non_empty = {k for k, v in model.training_datasets.items() if len(v) > 0}
+        num_batches = sum((len(v) + 1) // 2 for k, v in model.training_datasets.items()
+                          if k in non_empty)
+
+        self.assertEqual(len(batches), num_batches)
+        for gci_name, batch in batches:
+            with self.subTest(gci_name=gci_name):
+                self.assertIn(gci_name, non_empty)
+                self.assertLessEqual(len(batch), 2)
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter temperature must be greater \
+than 0."):
+            list(model.training_batches(temperature=0))
+
+    def test_train_minibatch(self):
+        """This should check that train_minibatch returns one loss per epoch"""
+
+        model = ELEmbeddings(self.family_dataset, embed_dim=2, batch_size=2)
+        samplers = {"gci2": UniformNegativeSampler(len(model.class_index_dict))}
+        losses = model.train_minibatch(epochs=2, negative_samplers=samplers, accumulation_steps=2)
+
+        self.assertEqual(len(losses), 2)
+        self.assertTrue(all(np.isfinite(loss) for loss in losses))
+
+    def test_train_minibatch_required_attributes(self):
+        """This should check that train_minibatch fails with a clear error if the model does \
+not define module, epochs or learning_rate"""
+
+        model = EmbeddingELModel(self.family_dataset, 2, 2)
+        with self.assertRaisesRegex(AttributeError, "Attribute module is not set."):
+            model.train_minibatch()
+
+        model.module = th.nn.Embedding(1, 1)
+        with self.assertRaisesRegex(ValueError, "Optional parameter epochs is required"):
+            model.train_minibatch()
+        with self.assertRaisesRegex(ValueError, "Optional parameter optimizer is required"):
+            model.train_minibatch(epochs=1)
+
+    def test_train_with_minibatch(self):
+        """This should check that the built-in models can be trained with train_minibatch"""
+
+        for model_class in [ELEmbeddings, ELBE, BoxSquaredEL]:
+            with self.subTest(model=model_class.__name__):
+                model = model_class(self.family_dataset, embed_dim=2, batch_size=2, epochs=2)
+                before = [p.clone() for p in model.module.parameters()]
+                model.train(minibatch=True)
+                after = list(model.module.parameters())
+                self.assertTrue(any(not th.equal(b, a) for b, a in zip(before, after)))
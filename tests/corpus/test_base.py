@@ -5,7 +5,16 @@ import shutil
 import mowl
 mowl.init_jvm("10g")
 from mowl.corpus import extract_and_save_axiom_corpus, \
-    extract_and_save_annotation_corpus, extract_axiom_corpus, extract_annotation_corpus
+    extract_and_save_annotation_corpus, extract_axiom_corpus, extract_annotation_corpus, \
+    iter_axiom_corpus, iter_annotation_corpus, tokenize_corpus
+from mowl.corpus.base import _corpus_renderer
+from mowl.walking import WalkCorpus
+from org.mowl import MOWLShortFormProvider
+from org.semanticweb.owlapi.manchestersyntax.renderer import \
+    ManchesterOWLSyntaxOWLObjectRendererImpl
+from org.semanticweb.owlapi.model import OWLLiteral
+from org.semanticweb.owlapi.search import EntitySearcher
+from jpype.types import JString
 
 
 class TestBase(TestCase):
@@ -162,3 +171,93 @@ class TestBase(TestCase):
 
         self.assertIsInstance(extract_annotation_corpus(self.ppi_yeast_slim_dataset.ontology),
                               list)
+
+    #########################################
+
+    def test_iter_axiom_corpus_params_types(self):
+        """This should test the type checking of the method `iter_axiom_corpus`."""
+
+        ontology = self.family_dataset.ontology
+        self.assertRaisesRegex(TypeError, "Optional parameter batch_size must be of type int",
+                               iter_axiom_corpus, ontology, batch_size="1")
+        self.assertRaisesRegex(TypeError, "Optional parameter workers must be of type int",
+                               iter_axiom_corpus, ontology, workers="1")
+        self.assertRaisesRegex(TypeError, "Optional parameter deduplicate must be of type bool",
+                               iter_axiom_corpus, ontology, deduplicate=1)
+        self.assertRaisesRegex(ValueError, "Optional parameter batch_size must be positive",
+                               iter_axiom_corpus, ontology, batch_size=0)
+
+    def test_iter_axiom_corpus_is_rendered_on_the_jvm(self):
+        """This should test that the axiom corpus is rendered by the JVM `CorpusRenderer`."""
+
+        from org.mowl.Corpus import CorpusRenderer
+        renderer = _corpus_renderer(2)
+        self.assertIsInstance(renderer, CorpusRenderer)
+        self.assertEqual(renderer.workers(), 2)
+
+    def test_closed_batches_stop_rendering(self):
+        """This should test that rendered batches can be closed before being read entirely, as \
+when a corpus generator is abandoned."""
+
+        ontology = self.ppi_yeast_slim_dataset.ontology
+        batches = _corpus_renderer(2).renderAxioms(ontology, 1)
+        self.assertTrue(batches.hasNext())
+        batches.next()
+        batches.close()
+        self.assertFalse(batches.hasNext())
+
+        corpus = iter_axiom_corpus(ontology, batch_size=1, workers=2)
+        next(corpus)
+        corpus.close()
+
+    def test_iter_axiom_corpus_batches_and_workers(self):
+        """This should test that the axiom corpus matches the axioms rendered one by one, for \
+any batch size and number of workers."""
+
+        ontology = self.ppi_yeast_slim_dataset.ontology
+        renderer = ManchesterOWLSyntaxOWLObjectRendererImpl()
+        renderer.setShortFormProvider(MOWLShortFormProvider())
+        expected = [str(renderer.render(axiom).replaceAll(JString("[\\r\\n|\\r|\\n()|<|>]"),
+                                                          JString("")))
+                    for axiom in ontology.getAxioms()]
+
+        for batch_size, workers in [(10000, 1), (7, 3)]:
+            corpus = list(iter_axiom_corpus(ontology, batch_size=batch_size, workers=workers))
+            self.assertEqual(corpus, expected)
+
+    def test_iter_annotation_corpus(self):
+        """This should test that the annotation corpus matches the annotations read one entity \
+at a time."""
+
+        ontology = self.ppi_yeast_slim_dataset.ontology
+        expected = []
+        entities = [(owl_class, str(owl_class.toStringID()))
+                    for owl_class in ontology.getClassesInSignature()]
+        entities += [(owl_individual, str(owl_individual.toStringID()))
+                     for owl_individual in ontology.getIndividualsInSignature()]
+        for entity, name in entities:
+            for annotation in EntitySearcher.getAnnotations(entity, ontology):
+                if isinstance(annotation.getValue(), OWLLiteral):
+                    obj_property = str(annotation.getProperty()).replace("\n", " ")
+                    value = str(annotation.getValue().getLiteral()).replace("\n", " ")
+                    expected.append(f'{name} {obj_property} {value}')
+
+        corpus = list(iter_annotation_corpus(ontology, batch_size=5, workers=2))
+        self.assertEqual(corpus, expected)
+
+    def test_deduplicate(self):
+        """This should test that repeated sentences are returned only once."""
+
+        ontology = self.family_dataset.ontology
+        corpus = list(iter_axiom_corpus(ontology, batch_size=2, deduplicate=True))
+        self.assertEqual(len(corpus), len(set(corpus)))
+        self.assertEqual(set(corpus), set(extract_axiom_corpus(ontology)))
+
+    def test_tokenize_corpus(self):
+        """This should test that sentences are tokenized into a WalkCorpus."""
+
+        sentences = list(iter_axiom_corpus(self.family_dataset.ontology))
+        corpus = tokenize_corpus(sentences)
+        self.assertIsInstance(corpus, WalkCorpus)
+        self.assertEqual(list(corpus), [sentence.split() for sentence in sentences])
+
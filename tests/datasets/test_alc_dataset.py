@@ -55,6 +55,13 @@ org.semanticweb.owlapi.model.OWLOntology."):
         with self.assertRaisesRegex(TypeError, "Optional parameter device must be of type str"):
             ALCDataset(self.ontology, self.dataset, device=1)
 
+        with self.assertRaisesRegex(TypeError, "Optional parameter workers must be of type int."):
+            ALCDataset(self.ontology, self.dataset, workers="1")
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter chunk_size must be greater \
+than 0."):
+            ALCDataset(self.ontology, self.dataset, chunk_size=0)
+
     def test_get_axiom_pattern(self):
         """This should check axiom patterns"""
         alc_dataset = ALCDataset(self.ontology, self.dataset)
@@ -96,3 +103,24 @@ org.semanticweb.owlapi.model.OWLOntology."):
             self.assertIsInstance(axiom, OWLAxiom)
             self.assertIsInstance(dataset, TensorDataset)
         self.assertEqual(len(grouped_datasets), 5)
+
+    def test_get_axiom_signature(self):
+        """This should check that axiom signatures are computed with the axiom vectors"""
+        alc_dataset = ALCDataset(self.ontology, self.dataset)
+        has_child_person = self.adapter.create_object_some_values_from(
+            self.has_child, self.person)
+        axiom = self.adapter.create_subclass_of(self.parent, has_child_person)
+
+        signature, vector = alc_dataset.get_axiom_signature(axiom)
+        self.assertEqual(signature, ("subclass", ("class", 0), ("some", ("class", 0))))
+        self.assertEqual(vector, alc_dataset.get_axiom_vector(axiom))
+
+    def test_get_datasets_with_workers(self):
+        """This should check that datasets encoded by several workers are the same as the \
+datasets encoded by one worker"""
+        datasets, _ = ALCDataset(self.ontology, self.dataset).get_datasets()
+        parallel_datasets, _ = ALCDataset(self.ontology, self.dataset, workers=2,
+                                          chunk_size=2).get_datasets()
+        self.assertEqual(set(datasets), set(parallel_datasets))
+        for pattern, dataset in datasets.items():
+            self.assertTrue(dataset.tensors[0].equal(parallel_datasets[pattern].tensors[0]))
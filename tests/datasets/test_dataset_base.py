@@ -54,6 +54,23 @@ class TestDataset(TestCase):
         dataset = Dataset(self.training_ont)
         self.assertEqual({}, dataset.labels)
 
+    def test_version_and_cached_vocabularies(self):
+        """This checks that entity vocabularies are cached until add_axioms is called"""
+
+        adapter = OWLAPIAdapter()
+        ontology = adapter.owl_manager.createOntology()
+        dataset = Dataset(ontology)
+        self.assertEqual(dataset.version, 0)
+
+        class_index_dict = dataset.classes.as_str_index_dict
+        self.assertIs(class_index_dict, dataset.classes.as_str_index_dict)
+
+        new_class = adapter.create_class("http://NewClass")
+        dataset.add_axioms(adapter.data_factory.getOWLDeclarationAxiom(new_class))
+        self.assertEqual(dataset.version, 1)
+        self.assertNotIn("http://NewClass", class_index_dict)
+        self.assertIn("http://NewClass", dataset.classes.as_str_index_dict)
+
 ###############################################################
 
 
@@ -351,6 +368,17 @@ OWLIndividual objects"""
         self.assertFalse(owl_prop_str.endswith(">"))
         self.assertTrue(owl_prop_str.startswith("http://"))
 
+    def test_name_and_id_arrays(self):
+        """This checks that the NumPy arrays of names and ids agree with the index dictionary"""
+
+        classes = self.ds.classes
+        names = classes.as_str_array
+        ids = classes.as_id_array
+
+        self.assertEqual(names.tolist(), classes.as_str)
+        self.assertEqual(ids.tolist(), [classes.as_str_index_dict[name] for name in names])
+        self.assertFalse(names.flags.writeable)
+
     def test_format_of_individual_as_str(self):
         """This checks if the format of the individual string is correct"""
 
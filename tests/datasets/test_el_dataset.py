@@ -1,5 +1,7 @@
 from inspect import classify_class_attrs
 from unittest import TestCase
+import os
+import tempfile
 
 from tests.datasetFactory import FamilyDataset
 from mowl.datasets import ELDataset
@@ -42,6 +44,17 @@ must be of type dict"):
         with self.assertRaisesRegex(TypeError, "Optional parameter device must be of type str"):
             ELDataset(self.dataset_family.ontology, device=1)
 
+        with self.assertRaisesRegex(TypeError, "Optional parameter cache_dir must be of type str"):
+            ELDataset(self.dataset_family.ontology, cache_dir=1)
+
+        with self.assertRaisesRegex(TypeError, "Optional parameter normalization_workers must be \
+of type int."):
+            ELDataset(self.dataset_family.ontology, normalization_workers="1")
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter normalization_workers must \
+be greater than 0."):
+            ELDataset(self.dataset_family.ontology, normalization_workers=0)
+
     def test_extended_parameter_false(self):
         """This should check if the extended parameter works as expected when set to false"""
 
@@ -90,3 +103,24 @@ must be of type dict"):
         true_gci3 = set()
         true_gci3.add((object_property_index_dict[self.has_child], class_index_dict[self.person],
                       class_index_dict[self.parent]))
+
+    def test_cache_dir(self):
+        """This should check that the normalized GCIs are cached and loaded back unchanged"""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            dataset = ELDataset(self.dataset_family.ontology, cache_dir=cache_dir)
+            gcis = dataset.get_gci_datasets()
+            self.assertEqual(os.listdir(cache_dir), [f"{dataset.fingerprint()}.npz"])
+
+            cached_dataset = ELDataset(self.dataset_family.ontology, cache_dir=cache_dir)
+            cached_gcis = cached_dataset.get_gci_datasets()
+
+            self.assertEqual(dataset.class_index_dict, cached_dataset.class_index_dict)
+            self.assertEqual(gcis.keys(), cached_gcis.keys())
+            for name in gcis:
+                self.assertEqual(set(map(tuple, gcis[name].data.tolist())),
+                                 set(map(tuple, cached_gcis[name].data.tolist())))
+
+            not_extended = ELDataset(self.dataset_family.ontology, extended=False,
+                                     cache_dir=cache_dir)
+            self.assertNotEqual(dataset.fingerprint(), not_extended.fingerprint())
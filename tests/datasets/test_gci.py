@@ -0,0 +1,95 @@
+from unittest import TestCase
+from types import SimpleNamespace
+
+from mowl.datasets.gci import encode_gcis, pack_gcis
+from mowl.ontology.normalize import ELNormalizer
+from mowl.owlapi import OWLAPIAdapter
+from java.util import HashSet
+import torch as th
+
+
+class TestEncodeGCIs(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.class_index_dict = {"http://Male": 3, "http://Female": 0, "http://Person": 7}
+        self.object_property_index_dict = {"http://hasChild": 1}
+
+    def test_encode_gcis(self):
+        """This should check that each column is mapped through its index dictionary"""
+
+        gcis = [SimpleNamespace(subclass="http://Male", object_property="http://hasChild",
+                                filler="http://Person"),
+                SimpleNamespace(subclass="http://Female", object_property="http://hasChild",
+                                filler="http://Male")]
+
+        columns = [("subclass", self.class_index_dict),
+                   ("object_property", self.object_property_index_dict),
+                   ("filler", self.class_index_dict)]
+
+        encoded = encode_gcis(gcis, columns)
+        self.assertEqual(encoded.dtype, th.long)
+        self.assertEqual(encoded.tolist(), [[3, 1, 7], [0, 1, 3]])
+
+    def test_encode_empty_gcis(self):
+        """This should check that an empty list of axioms is encoded into an empty tensor"""
+
+        columns = [("subclass", self.class_index_dict), ("superclass", self.class_index_dict)]
+        encoded = encode_gcis([], columns)
+        self.assertEqual(tuple(encoded.shape), (0, 2))
+
+    def test_encode_unknown_entity(self):
+        """This should check that an entity missing from the index dictionary raises KeyError"""
+
+        gcis = [SimpleNamespace(subclass="http://Male", superclass="http://Unknown")]
+        columns = [("subclass", self.class_index_dict), ("superclass", self.class_index_dict)]
+
+        with self.assertRaisesRegex(KeyError, "http://Unknown"):
+            encode_gcis(gcis, columns)
+
+
+class TestPackGCIs(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        adapter = OWLAPIAdapter()
+        ontology = adapter.create_ontology("http://mowl/test_pack_gcis")
+        male, female, person = [adapter.create_class(f"http://{name}")
+                                for name in ["Male", "Female", "Person"]]
+        has_child = adapter.create_object_property("http://hasChild")
+
+        axioms = HashSet()
+        axioms.add(adapter.create_subclass_of(
+            male, adapter.create_object_some_values_from(has_child, person)))
+        axioms.add(adapter.create_subclass_of(
+            female, adapter.create_object_some_values_from(has_child, male)))
+        axioms.add(adapter.create_subclass_of(
+            adapter.create_object_intersection_of(male, female), person))
+        adapter.owl_manager.addAxioms(ontology, axioms)
+
+        self.gcis = ELNormalizer().normalize(ontology)
+
+    def test_pack_gcis(self):
+        """This should check that normalized axioms are read in bulk on the JVM with the same \
+entities as their attributes"""
+
+        attributes = ["subclass", "object_property", "filler"]
+        with self.assertNoLogs(level="WARNING"):
+            ids, names = pack_gcis(self.gcis["gci2"], attributes)
+
+        self.assertEqual(ids.shape, (2, 3))
+        expected = [[getattr(gci, attribute) for attribute in attributes]
+                    for gci in self.gcis["gci2"]]
+        self.assertEqual([[names[i] for i in row] for row in ids.tolist()], expected)
+
+    def test_encode_normalized_gcis(self):
+        """This should check that normalized axioms are encoded as their attributes"""
+
+        class_index_dict = {"http://Male": 3, "http://Female": 0, "http://Person": 7}
+        columns = [("left_subclass", class_index_dict), ("right_subclass", class_index_dict),
+                   ("superclass", class_index_dict)]
+
+        encoded = encode_gcis(self.gcis["gci1"], columns)
+        expected = [[class_index_dict[getattr(gci, attribute)] for attribute, _ in columns]
+                    for gci in self.gcis["gci1"]]
+        self.assertEqual(encoded.tolist(), expected)
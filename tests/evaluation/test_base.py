@@ -1,6 +1,7 @@
 import tests
 from unittest import TestCase
-from mowl.evaluation import BaseRankingEvaluator
+from mowl.evaluation import BaseRankingEvaluator, SubsumptionEvaluator, GDAEvaluator
+from mowl.evaluation.base import compute_ranks, RankHistogram
 import torch as th
 from utils import auc_from_mr
 
@@ -466,3 +467,145 @@ class TestBaseRankingEvaluatorSomeEntitiesOnly(TestCase):
 
         diff_fauc = abs(fauc - true_fauc)
         self.assertLess(diff_fauc, allowed_diff)
+
+    def test_streaming_matches_full_scoring(self):
+        filter_data = th.cat([self.train_set_tensor, self.extra_set_tensor], dim=0)
+
+        evaluator = BaseRankingEvaluator(self.entities_tensor, self.entities_tensor, 2, "cpu")
+        metrics = evaluator.compute_ranking_metrics(self.evaluation_model, self.valid_set_tensor, mode="both", filter_data=filter_data, top_k=2)
+
+        streaming_evaluator = BaseRankingEvaluator(self.entities_tensor, self.entities_tensor, 2, "cpu")
+        streaming_metrics = streaming_evaluator.compute_ranking_metrics(self.evaluation_model, self.valid_set_tensor, mode="both", filter_data=filter_data, max_elements=3, top_k=2)
+
+        self.assertEqual(metrics, streaming_metrics)
+        for side in ["head_centric", "tail_centric"]:
+            scores, entities = evaluator.top_k_predictions[side]
+            streaming_scores, streaming_entities = streaming_evaluator.top_k_predictions[side]
+            self.assertTrue(th.equal(scores, streaming_scores))
+            self.assertTrue(th.equal(entities, streaming_entities))
+
+
+class TestRankComputation(TestCase):
+
+    def test_compute_ranks(self):
+        scores = th.tensor([[0.1, 0.5, 0.3, 0.2],
+                            [0.4, 0.3, 0.2, 0.1]])
+        targets = th.tensor([2, 0])
+
+        ranks = compute_ranks(scores, targets)
+        self.assertEqual(ranks.tolist(), [3, 4])
+
+    def test_compute_ranks_with_ties(self):
+        """This should check that candidates tied with the target rank it last among them"""
+        inf = float("inf")
+        scores = th.tensor([[0.2, 0.2, 0.2, 0.2],
+                            [0.1, 0.3, 0.3, 0.5],
+                            [inf, inf, inf, inf],
+                            [0.1, inf, inf, inf]])
+        targets = th.tensor([0, 1, 2, 3])
+
+        ranks = compute_ranks(scores, targets)
+        self.assertEqual(ranks.tolist(), [4, 3, 4, 4])
+
+    def test_tied_scores_rank_last(self):
+        """This should check that a model with constant scores gets the worst ranks with and \
+without chunking"""
+        class ConstantModel(th.nn.Module):
+            def forward(self, x):
+                return th.zeros(len(x))
+
+        entities = th.arange(4)
+        test_data = th.tensor([[0, 1], [2, 3]])
+        for max_elements in [None, 3]:
+            evaluator = BaseRankingEvaluator(entities, entities, 2, "cpu")
+            metrics = evaluator.compute_ranking_metrics(ConstantModel(), test_data, mode="both",
+                                                        filter_data=test_data,
+                                                        max_elements=max_elements)
+            self.assertEqual(metrics["mr"], 4)
+            self.assertEqual(metrics["hits@1"], 0)
+            self.assertEqual(metrics["f_mr"], 4)
+
+    def test_rank_histogram(self):
+        histogram = RankHistogram(4)
+        histogram.update(th.tensor([3, 4]))
+        histogram.update(th.tensor([1]))
+
+        self.assertEqual(histogram.mean_rank(3), 8 / 3)
+        self.assertEqual(histogram.mean_reciprocal_rank(3), (1 / 3 + 1 / 4 + 1) / 3)
+        self.assertEqual(histogram.hits_at(3, 3), 2 / 3)
+        self.assertEqual(histogram.as_dict(), {1: 1, 3: 1, 4: 1})
+
+
+class ScoreAllModel(th.nn.Module):
+    """Scores with forward are the entity ids and scores with score_all_tails and \
+score_all_heads are their negations, so that the test can tell which one was used"""
+
+    def forward(self, x, gci_name):
+        return (x[:, 0] * 10 + x[:, -1]).float()
+
+    def score_all_tails(self, heads, rels=None, candidates=None):
+        return -(heads.view(-1, 1) * 10 + candidates.view(1, -1)).float()
+
+    def score_all_heads(self, rels, tails, candidates=None):
+        return -(candidates.view(1, -1) * 10 + tails.view(-1, 1)).float()
+
+
+class TestScoreAllCandidates(TestCase):
+
+    def make_evaluator(self, evaluator_class):
+        evaluator = evaluator_class.__new__(evaluator_class)
+        entities = th.arange(4)
+        BaseRankingEvaluator.__init__(evaluator, entities, entities, 2, "cpu")
+        return evaluator
+
+    def test_built_in_get_scores(self):
+        """This should check that evaluators with a built-in get_scores use score_all_tails and \
+score_all_heads"""
+        evaluator = self.make_evaluator(SubsumptionEvaluator)
+        batch = th.tensor([[1, 2], [3, 0]])
+        scores = evaluator.get_candidate_scores(ScoreAllModel(), batch, "head_centric",
+                                                th.arange(4))
+        self.assertEqual(scores.tolist(), [[-10, -11, -12, -13], [-30, -31, -32, -33]])
+        scores = evaluator.get_candidate_scores(ScoreAllModel(), batch, "tail_centric",
+                                                th.arange(4))
+        self.assertEqual(scores.tolist(), [[-2, -12, -22, -32], [0, -10, -20, -30]])
+
+    def test_overridden_get_scores(self):
+        """This should check that evaluators overriding get_scores score every tuple with it"""
+        class GCI1Evaluator(SubsumptionEvaluator):
+            def get_scores(self, model, batch):
+                return model(batch, "gci1")
+
+        for evaluator_class, batch in [(GCI1Evaluator, th.tensor([[1, 2]])),
+                                       (SubsumptionEvaluator, th.tensor([[1, 0, 2]])),
+                                       (GDAEvaluator, th.tensor([[1, 2]]))]:
+            with self.subTest(evaluator=evaluator_class.__name__):
+                evaluator = self.make_evaluator(evaluator_class)
+                model = ScoreAllModel()
+                scores = evaluator.get_candidate_scores(model, batch, "head_centric",
+                                                        th.arange(4))
+                self.assertEqual(scores.tolist(), [[10, 11, 12, 13]])
+
+    def test_chunked_target_scores(self):
+        """This should check that chunked ranking compares the targets with scores computed in \
+the same way, even if forward differs from score_all_tails and score_all_heads"""
+        class MismatchedModel(th.nn.Module):
+            def forward(self, x, gci_name):
+                return th.zeros(len(x))
+
+            def score_all_tails(self, heads, rels=None, candidates=None):
+                return th.full((len(heads), len(candidates)), 1e-3)
+
+            def score_all_heads(self, rels, tails, candidates=None):
+                return th.full((len(tails), len(candidates)), 1e-3)
+
+        test_data = th.tensor([[0, 1], [2, 3]])
+        metrics = []
+        for max_elements in [None, 2, 3]:
+            evaluator = self.make_evaluator(SubsumptionEvaluator)
+            metrics.append(evaluator.compute_ranking_metrics(MismatchedModel(), test_data,
+                                                             mode="both",
+                                                             max_elements=max_elements))
+        self.assertEqual(metrics[0]["mr"], 4)
+        self.assertEqual(metrics[0], metrics[1])
+        self.assertEqual(metrics[0], metrics[2])
@@ -0,0 +1,84 @@
+import tests
+from unittest import TestCase
+from mowl.evaluation import FilterIndex, TupleSet
+import torch as th
+
+
+class TestFilterIndex(TestCase):
+
+    def setUp(self):
+        self.index = FilterIndex(5, 6)
+        self.index.add(th.tensor([0, 0, 3, 3, 3]), th.tensor([1, 1, 5, 0, 2]))
+        self.index.add(th.tensor([4]), th.tensor([4]))
+
+    def test_duplicated_pairs_are_stored_once(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.indptr.tolist(), [0, 1, 1, 1, 4, 5])
+        self.assertEqual(self.index.indices.tolist(), [1, 0, 2, 5, 4])
+
+    def test_mask(self):
+        mask = self.index.mask(th.tensor([3, 0, 1]))
+        expected = th.tensor([[1, 0, 1, 0, 0, 1],
+                              [0, 1, 0, 0, 0, 0],
+                              [0, 0, 0, 0, 0, 0]], dtype=th.bool)
+        self.assertTrue((mask == expected).all())
+
+    def test_mask_excludes_targets(self):
+        mask = self.index.mask(th.tensor([3, 0]), exclude=th.tensor([0, 1]))
+        expected = th.tensor([[0, 0, 1, 0, 0, 1],
+                              [0, 0, 0, 0, 0, 0]], dtype=th.bool)
+        self.assertTrue((mask == expected).all())
+
+    def test_mask_column_range(self):
+        mask = self.index.mask(th.tensor([3, 4]), exclude=th.tensor([2, 0]), column_range=(2, 5))
+        expected = th.tensor([[0, 0, 0],
+                              [0, 0, 1]], dtype=th.bool)
+        self.assertTrue((mask == expected).all())
+
+    def test_additive_mask(self):
+        scores = th.tensor([[-3.0, -2.0, -1.0, 0.0, 1.0, 2.0]])
+        masked = scores + self.index.additive_mask(th.tensor([0]))
+        self.assertEqual(masked[0, 1].item(), float("inf"))
+        self.assertEqual(masked[0, 0].item(), -3.0)
+
+    def test_transpose(self):
+        transposed = self.index.transpose()
+        heads, tails = transposed.pairs()
+        self.assertEqual(transposed.num_heads, 6)
+        self.assertEqual(heads.tolist(), [0, 1, 2, 4, 5])
+        self.assertEqual(tails.tolist(), [3, 0, 3, 4, 3])
+
+
+class TestTupleSet(TestCase):
+
+    def setUp(self):
+        self.triples = TupleSet(th.tensor([[0, 1, 2], [3, 0, 1], [0, 1, 2], [2, 2, 2]]))
+
+    def test_duplicated_tuples_are_stored_once(self):
+        """This should check that the set stores each tuple once in sorted order"""
+        self.assertEqual(len(self.triples), 3)
+        self.assertEqual(self.triples.tuples.tolist(), [[0, 1, 2], [2, 2, 2], [3, 0, 1]])
+
+    def test_contains(self):
+        """This should check membership, including tuples with entries out of range"""
+        queries = th.tensor([[3, 0, 1], [1, 0, 3], [7, 0, 1], [-1, 1, 2], [2, 2, 2]])
+        self.assertEqual(self.triples.contains(queries).tolist(), [True, False, False, False, True])
+
+    def test_difference_and_intersection(self):
+        """This should check the difference and intersection with another set of tuples"""
+        other = th.tensor([[2, 2, 2], [5, 5, 5]])
+        self.assertEqual(self.triples.difference(other).tolist(), [[0, 1, 2], [3, 0, 1]])
+        self.assertEqual(self.triples.intersection(TupleSet(other)).tolist(), [[2, 2, 2]])
+
+    def test_empty_set(self):
+        """This should check that an empty set contains no tuples"""
+        empty = TupleSet(th.tensor([], dtype=th.long))
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.contains(th.tensor([[0, 1]])).tolist(), [False])
+
+    def test_parameter_types(self):
+        """This should check that invalid parameters raise errors"""
+        self.assertRaisesRegex(TypeError, "Parameter tuples must be of type torch.Tensor.",
+                               TupleSet, [[0, 1]])
+        self.assertRaises(ValueError, TupleSet, th.tensor([[0, 5]]), num_entities=3)
+        self.assertRaises(ValueError, TupleSet, th.tensor([[2 ** 32, 0]]))
@@ -0,0 +1,35 @@
+from unittest import TestCase
+from mowl.inference.cosine import CosineSimilarityInfer
+import itertools as it
+import numpy as np
+
+
+class TestAxiomScoring(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        rng = np.random.default_rng(0)
+        names = [f"http://4932.{i}" for i in range(5)] + [f"http://9606.{i}" for i in range(3)]
+        self.embeddings = {name: rng.random(4).astype(np.float32) for name in names}
+        self.scoring = CosineSimilarityInfer(self.embeddings, "interacts_with")
+        self.pattern = "c?http://4932.*? SubClassOf interacts_with some c?http://4932.*?"
+
+    def test_score_arrays(self):
+        """This should check that batched scores are equal to the scores of each data point, \
+in the order of the Cartesian product"""
+        expected_points = list(it.product([f"http://4932.{i}" for i in range(5)], repeat=2))
+
+        for batch_size in [1, 7, 100]:
+            indices, scores = self.scoring.score_arrays(self.pattern, batch_size=batch_size)
+            self.assertEqual(indices.shape, (25, 2))
+            points = [tuple(self.scoring.class_list[i] for i in row) for row in indices]
+            self.assertEqual(points, expected_points)
+
+            expected_scores = [self.scoring.method(point).item() for point in points]
+            np.testing.assert_allclose(scores, expected_scores, rtol=1e-6)
+
+    def test_score(self):
+        """This should check that axioms are rendered as strings by score"""
+        predictions = self.scoring.score(self.pattern, batch_size=4)
+        self.assertEqual(len(predictions), 25)
+        self.assertIn("http://4932.0 SubClassOf interacts_with some http://4932.3", predictions)
@@ -0,0 +1,79 @@
+from unittest import TestCase
+from mowl.inference import ELInferenceEngine
+import pandas as pd
+import torch as th
+import os
+import tempfile
+
+
+class TableModule(th.nn.Module):
+    """Module whose scores are read from fixed tables"""
+
+    def __init__(self, gci0_scores, gci2_scores):
+        super().__init__()
+        self.gci0_scores = gci0_scores
+        self.gci2_scores = gci2_scores
+
+    def forward(self, data, gci_name):
+        if gci_name == "gci0":
+            return self.gci0_scores[data[:, 0], data[:, 1]]
+        return self.gci2_scores[data[:, 0], data[:, 1], data[:, 2]]
+
+
+class TestELInferenceEngine(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        th.manual_seed(0)
+        self.num_classes = 6
+        self.gci0_scores = th.rand(self.num_classes, self.num_classes)
+        self.gci2_scores = th.rand(self.num_classes, 2, self.num_classes)
+        self.module = TableModule(self.gci0_scores, self.gci2_scores)
+        self.classes = {f"http://C{i}": i for i in range(self.num_classes)}
+        self.properties = {"http://r0": 0, "http://r1": 1}
+
+    def test_constructor_parameter_types(self):
+        """This should check if the constructor parameters are of the correct type"""
+        self.assertRaisesRegex(TypeError, "Parameter class_index_dict must be of type dict.",
+                               ELInferenceEngine, self.module, [])
+        self.assertRaisesRegex(TypeError, "Optional parameter max_elements must be of type int.",
+                               ELInferenceEngine, self.module, self.classes, None, "1")
+
+    def test_infer_subclasses(self):
+        """This should check that the best superclasses of every class are predicted in blocks, \
+excluding known axioms and the class itself"""
+        known_axioms = th.tensor([[0, 1], [2, 3]])
+        expected = []
+        for sub in range(self.num_classes):
+            scores = sorted((self.gci0_scores[sub, sup].item(), sup)
+                            for sup in range(self.num_classes)
+                            if sup != sub and [sub, sup] not in known_axioms.tolist())
+            expected += [(f"http://C{sub}", f"http://C{sup}") for _, sup in scores[:2]]
+
+        for max_elements in [1, 4, 100]:
+            engine = ELInferenceEngine(self.module, self.classes, max_elements=max_elements)
+            predictions = engine.infer_subclasses(top_k=2, known_axioms=known_axioms)
+            self.assertEqual(list(zip(predictions["subclass"], predictions["superclass"])),
+                             expected)
+
+    def test_infer_existentials(self):
+        """This should check that fillers are predicted for every (subclass, property) pair"""
+        engine = ELInferenceEngine(self.module, self.classes, self.properties, max_elements=4)
+        predictions = engine.infer_existentials(subclasses=["http://C1"], top_k=1)
+
+        self.assertEqual(list(predictions["property"]), ["http://r0", "http://r1"])
+        for prop, filler in zip(predictions["property"], predictions["filler"]):
+            scores = self.gci2_scores[1, self.properties[prop]].clone()
+            scores[1] = float("inf")
+            self.assertEqual(filler, f"http://C{th.argmin(scores).item()}")
+
+    def test_predictions_are_written(self):
+        """This should check that predictions are written to a TSV file"""
+        engine = ELInferenceEngine(self.module, self.classes, max_elements=4)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_file = os.path.join(tmp_dir, "predictions.tsv")
+            self.assertIsNone(engine.infer_subclasses(top_k=3, out_file=out_file))
+            predictions = pd.read_csv(out_file, sep="\t")
+
+        self.assertEqual(list(predictions.columns), ["subclass", "superclass", "score"])
+        self.assertEqual(len(predictions), 3 * self.num_classes)
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from mowl.datasets import ALCDataset, Dataset
+from mowl.models.falcon.compiler import FALCONProgram, compile_axiom
+from mowl.models.falcon.module import FALCONModule
+from mowl.owlapi.adapter import OWLAPIAdapter
+from java.util import HashSet
+import torch as th
+
+
+class TestFALCONModule(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        adapter = OWLAPIAdapter()
+        ontology = adapter.create_ontology("http://mowl/falcon")
+        parent = adapter.create_class("http://Parent")
+        person = adapter.create_class("http://Person")
+        male = adapter.create_class("http://Male")
+        has_child = adapter.create_object_property("http://hasChild")
+        axioms = HashSet()
+        axioms.add(adapter.create_subclass_of(parent, person))
+        axioms.add(adapter.create_subclass_of(
+            parent, adapter.create_object_some_values_from(has_child, person)))
+        axioms.add(adapter.create_disjoint_classes(parent, male))
+        adapter.owl_manager.addAxioms(ontology, axioms)
+
+        self.dataset = Dataset(ontology)
+        self.alc_dataset = ALCDataset(ontology, self.dataset)
+        self.datasets, _ = self.alc_dataset.get_datasets()
+
+    def test_compile_axiom(self):
+        """This should check that axiom patterns are compiled into programs that read the \
+columns of the axiom vectors in order"""
+        programs = {repr(compile_axiom(pattern)) for pattern in self.datasets}
+        self.assertEqual(programs, {
+            "FALCONProgram(subclass, [class(0), class(1)])",
+            "FALCONProgram(subclass, [class(0), exists(1, class(2))])",
+            "FALCONProgram(disjoint, [class(0), class(1)])"})
+
+    def test_forward_compiled_program(self):
+        """This should check that compiled programs are cached and give the same loss as the \
+axiom patterns"""
+        module = FALCONModule(len(self.dataset.classes), 2, len(self.dataset.object_properties),
+                              {}, {}, embed_dim=8)
+        e_emb = th.rand(4, 8)
+        for pattern, dataset in self.datasets.items():
+            program = module.compile(pattern)
+            self.assertIsInstance(program, FALCONProgram)
+            self.assertIs(module.compile(pattern), program)
+
+            x = dataset.tensors[0]
+            loss = module(pattern, x, e_emb)
+            self.assertTrue(th.allclose(module(program, x, e_emb), loss))
+
+    def test_negatives_are_filtered(self):
+        """This should check that the negatives drawn for property assertions avoid the known \
+heads and tails of each pair"""
+        heads_dict = {(1, 0): [0, 2], (3, 0): [1]}
+        tails_dict = {(0, 0): [1, 3], (1, 0): [0, 1, 2]}
+        module = FALCONModule(2, 4, 1, heads_dict, tails_dict, embed_dim=8, num_negs=16)
+
+        e = th.tensor([[0], [1]])
+        r = th.tensor([[0], [0]])
+        negatives = module._draw_negatives(e, r, module._tail_sampler)
+        self.assertEqual(tuple(negatives.shape), (2, 16))
+        self.assertTrue(set(negatives[0].tolist()) <= {0, 2})
+        self.assertEqual(set(negatives[1].tolist()), {3})
+
+        negatives = module._draw_negatives(th.tensor([[1]]), th.tensor([[0]]),
+                                           module._head_sampler)
+        self.assertTrue(set(negatives[0].tolist()) <= {1, 3})
+
+        negatives = module.sample_negatives(th.tensor([[3]]), th.tensor([[0]]), heads_dict)
+        self.assertTrue(set(negatives[0].tolist()) <= {0, 2, 3})
@@ -1,10 +1,12 @@
 from unittest import TestCase
 from tests.datasetFactory import FamilyDataset
 from mowl.models import GraphPlusPyKEENModel
+from mowl.models.graph_kge.graph_pykeen_model import EvaluationModel
 from mowl.projection import TaxonomyProjector
 from pykeen.triples import TriplesFactory
 from pykeen.models import TransE, ERModel
 import mowl.error.messages as err
+from mowl.evaluation.base import compute_ranks
 import torch as th
 
 class TestPyKEENModel(TestCase):
@@ -76,4 +78,63 @@ class TestPyKEENModel(TestCase):
 
         individual_embs = model.individual_embeddings
         self.assertIsInstance(individual_embs, dict)
-        
+
+    def test_evaluation_model_scores_all_candidates(self):
+        """This checks that scoring against all candidates with score_t and score_h gives the \
+same scores as scoring every triple, after remapping dataset ids to graph ids"""
+
+        model = GraphPlusPyKEENModel(self.dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_kge_method(TransE, random_seed=42)
+        kge_method = model.kge_method
+
+        num_nodes = len(model.triples_factory.entity_to_id)
+        entity_index = list(reversed(range(num_nodes))) + [-1]
+        evaluation_model = EvaluationModel(kge_method, "cpu", entity_index=entity_index,
+                                           relation_index=[0])
+
+        heads = th.tensor([0, 1, 2])
+        rels = th.zeros(3, dtype=th.long)
+        candidates = th.arange(num_nodes + 1)
+
+        with th.no_grad():
+            tail_scores = evaluation_model.score_all_tails(heads, rels, candidates=candidates)
+            head_scores = evaluation_model.score_all_heads(rels, heads, candidates=candidates)
+
+            for i, entity in enumerate(heads):
+                queries = th.full((len(candidates),), entity.item(), dtype=th.long)
+                zeros = th.zeros(len(candidates), dtype=th.long)
+                expected_tails = evaluation_model(th.stack([queries, zeros, candidates], dim=1))
+                expected_heads = evaluation_model(th.stack([candidates, zeros, queries], dim=1))
+                self.assertTrue(th.allclose(tail_scores[i], expected_tails, atol=1e-5))
+                self.assertTrue(th.allclose(head_scores[i], expected_heads, atol=1e-5))
+
+        self.assertTrue(th.isinf(tail_scores[:, -1]).all())
+
+
+    def test_evaluation_model_ranks_missing_queries_last(self):
+        """This checks that queries whose class is missing from the graph are ranked last"""
+
+        model = GraphPlusPyKEENModel(self.dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_kge_method(TransE, random_seed=42)
+
+        num_nodes = len(model.triples_factory.entity_to_id)
+        entity_index = list(range(num_nodes)) + [-1]
+        evaluation_model = EvaluationModel(model.kge_method, "cpu", entity_index=entity_index,
+                                           relation_index=[0])
+
+        missing = th.tensor([num_nodes])
+        rels = th.zeros(1, dtype=th.long)
+        candidates = th.arange(num_nodes + 1)
+        targets = th.tensor([0])
+
+        with th.no_grad():
+            tail_scores = evaluation_model.score_all_tails(missing, rels, candidates=candidates)
+            head_scores = evaluation_model.score_all_heads(rels, missing, candidates=candidates)
+            queries = th.full((len(candidates),), num_nodes, dtype=th.long)
+            zeros = th.zeros(len(candidates), dtype=th.long)
+            forward_scores = evaluation_model(th.stack([queries, zeros, candidates], dim=1))
+
+        for scores in [tail_scores, head_scores, forward_scores.view(1, -1)]:
+            self.assertEqual(compute_ranks(scores, targets).tolist(), [num_nodes + 1])
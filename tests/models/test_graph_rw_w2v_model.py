@@ -3,6 +3,7 @@ from tests.datasetFactory import FamilyDataset
 from mowl.models import RandomWalkPlusW2VModel
 from mowl.projection import TaxonomyProjector
 from mowl.walking import DeepWalk
+from mowl.owlapi import OWLAPIAdapter
 import mowl.error.messages as msg
 
 
@@ -58,3 +59,35 @@ class TestRandomWalkPlusW2VModel(TestCase):
         with self.assertRaisesRegex(AttributeError, msg.W2V_MODEL_NOT_SET):
             model.train()
 
+
+    def test_train_with_python_walks(self):
+        """This should test that Word2Vec is trained from the in-memory corpus of the walker"""
+        model = RandomWalkPlusW2VModel(self.dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_walker(DeepWalk(2, 5, backend="python"))
+        model.set_w2v_model(min_count=1, vector_size=8, epochs=1)
+        model.train()
+
+        self.assertEqual(model.w2v_model.corpus_count, len(model.walker.corpus))
+        self.assertGreater(len(model.class_embeddings), 0)
+
+    def test_add_axioms_walks_only_from_changed_nodes(self):
+        """This should test that add_axioms generates walks only around the new edges and trains \
+on them"""
+        dataset = FamilyDataset()
+        model = RandomWalkPlusW2VModel(dataset)
+        model.set_projector(TaxonomyProjector())
+        model.set_walker(DeepWalk(2, 5, backend="python"))
+        model.set_w2v_model(min_count=1, vector_size=8, epochs=1)
+        model.train()
+        num_walks = len(model.walker.corpus)
+
+        adapter = OWLAPIAdapter()
+        new_class = adapter.create_class("http://new_class")
+        father = adapter.create_class("http://Father")
+        model.add_axioms(adapter.create_subclass_of(new_class, father))
+        model.train()
+
+        self.assertEqual(model.walker.corpus.num_segments, 2)
+        self.assertLess(len(model.walker.corpus) - num_walks, num_walks)
+        self.assertIn("http://new_class", model.w2v_model.wv)
@@ -65,8 +65,3 @@ class TestBoxSquaredELModule(TestCase):
         gci3_bot = self.axioms.gci3_bot_data
         result = self.module(gci3_bot, "gci3_bot")
         self.assertIsInstance(result, th.Tensor)
-
-        
-
-
-
@@ -0,0 +1,97 @@
+from unittest import TestCase
+from mowl.nn import UniformNegativeSampler, DegreeNegativeSampler, TypeConstrainedNegativeSampler, \
+    FilteredNegativeSampler
+from mowl.evaluation import TupleSet
+import torch as th
+
+
+class TestNegativeSampling(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.data = th.tensor([[0, 0, 1], [1, 0, 2], [2, 1, 3], [3, 1, 0]])
+
+    def test_parameter_types(self):
+        """This should check the types of the parameters of the samplers"""
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter corrupt must be one of \
+'head', 'tail' or 'both'."):
+            UniformNegativeSampler(4, corrupt="relation")
+
+        with self.assertRaisesRegex(TypeError, "Optional parameter known_tuples must be of type \
+torch.Tensor."):
+            UniformNegativeSampler(4, known_tuples=[[0, 0, 1]])
+
+        with self.assertRaisesRegex(TypeError, "Parameter degrees must be of type torch.Tensor."):
+            DegreeNegativeSampler([1, 2, 3])
+
+    def test_corrupt_tail(self):
+        """This should check that only tails are corrupted with entities from the candidates"""
+
+        sampler = UniformNegativeSampler(th.tensor([5, 6]), seed=0)
+        negatives = sampler.sample(self.data)
+
+        self.assertTrue(th.equal(negatives[:, :2], self.data[:, :2]))
+        self.assertTrue(th.isin(negatives[:, 2], th.tensor([5, 6])).all())
+
+    def test_corrupt_both(self):
+        """This should check that each tuple has either its head or its tail corrupted"""
+
+        sampler = UniformNegativeSampler(th.tensor([5]), corrupt="both", seed=0)
+        negatives = sampler.sample(self.data.repeat(10, 1))
+
+        head_corrupted = negatives[:, 0] == 5
+        tail_corrupted = negatives[:, 2] == 5
+        self.assertTrue((head_corrupted ^ tail_corrupted).all())
+
+    def test_seed(self):
+        """This should check that samplers with the same seed draw the same negatives"""
+
+        first = UniformNegativeSampler(100, seed=42).sample(self.data)
+        second = UniformNegativeSampler(100, seed=42).sample(self.data)
+        self.assertTrue(th.equal(first, second))
+
+    def test_known_tuples_are_rejected(self):
+        """This should check that known positives are not returned as negatives"""
+
+        sampler = UniformNegativeSampler(4, corrupt="head", known_tuples=self.data, seed=0,
+                                         max_retries=100)
+        self.assertIsInstance(sampler.known_tuples, TupleSet)
+        self.assertEqual(len(sampler.known_tuples), len(self.data))
+        for _ in range(10):
+            negatives = sampler.sample(self.data)
+            known = (negatives.unsqueeze(1) == self.data).all(-1).any(-1)
+            self.assertFalse(known.any())
+
+    def test_degree_sampler(self):
+        """This should check that entities with zero degree are never drawn"""
+
+        sampler = DegreeNegativeSampler(th.tensor([0, 3, 0, 1]), seed=0)
+        negatives = sampler.sample(self.data.repeat(50, 1))
+        self.assertTrue(th.isin(negatives[:, 2], th.tensor([1, 3])).all())
+
+    def test_type_constrained_sampler(self):
+        """This should check that tails are drawn from the range of the relation of each tuple"""
+
+        sampler = TypeConstrainedNegativeSampler(th.tensor([9]), ranges={1: th.tensor([7, 8])},
+                                                 seed=0)
+        negatives = sampler.sample(self.data.repeat(10, 1))
+
+        relation_1 = negatives[:, 1] == 1
+        self.assertTrue(th.isin(negatives[relation_1, 2], th.tensor([7, 8])).all())
+        self.assertTrue((negatives[~relation_1, 2] == 9).all())
+
+    def test_filtered_sampler(self):
+        """This should check that known neighbours of each (entity, relation) pair are never \
+drawn, and that all the other entities are"""
+
+        known = th.tensor([[0, 0, 1], [0, 0, 2], [0, 0, 4], [3, 1, 0]])
+        data = th.tensor([[0, 0, 3], [2, 1, 0]]).repeat(500, 1)
+
+        sampler = FilteredNegativeSampler(6, known, corrupt="tail", seed=0)
+        negatives = sampler.sample(data)
+        self.assertEqual(set(negatives[data[:, 0] == 0, 2].tolist()), {0, 3, 5})
+
+        sampler = FilteredNegativeSampler(6, known, corrupt="head", seed=0)
+        negatives = sampler.sample(data)
+        self.assertEqual(set(negatives[data[:, 1] == 1, 0].tolist()), {0, 1, 2, 4, 5})
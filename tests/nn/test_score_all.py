@@ -0,0 +1,56 @@
+from unittest import TestCase
+from mowl.nn import ELEmModule, ELBEModule, BoxELModule, BoxSquaredELModule
+import torch as th
+
+
+class TestScoreAll(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        th.manual_seed(0)
+        self.nb_classes = 7
+        self.nb_rels = 3
+        self.modules = [module_class(self.nb_classes, self.nb_rels, 2, embed_dim=4)
+                        for module_class in [ELEmModule, ELBEModule, BoxELModule,
+                                             BoxSquaredELModule]]
+        self.classes = th.tensor([0, 3, 6])
+        self.rels = th.tensor([2, 0, 1])
+        self.candidates = th.tensor([5, 1, 4, 1])
+
+    def expected_scores(self, module, side, rels, candidates):
+        """Scores each axiom with ``forward``, with the candidates on the given side"""
+
+        n, m = len(self.classes), len(candidates)
+        fixed = self.classes.repeat_interleave(m)
+        varying = candidates.repeat(n)
+        heads, tails = (fixed, varying) if side == "tails" else (varying, fixed)
+        if rels is None:
+            gcis, gci_name = th.stack([heads, tails], dim=1), "gci0"
+        else:
+            gcis = th.stack([heads, rels.repeat_interleave(m), tails], dim=1)
+            gci_name = "gci2"
+        return module(gcis, gci_name).view(n, m)
+
+    def test_score_all_matches_forward(self):
+        """This should check that scoring all tails or heads matches scoring each GCI0 and GCI2 \
+axiom with forward"""
+
+        for module in self.modules:
+            for side in ["tails", "heads"]:
+                for rels in [None, self.rels]:
+                    for candidates in [None, self.candidates]:
+                        gci_name = "gci0" if rels is None else "gci2"
+                        with self.subTest(module=type(module).__name__, side=side,
+                                          gci_name=gci_name, candidates=candidates):
+                            if side == "tails":
+                                result = module.score_all_tails(self.classes, rels,
+                                                                candidates=candidates)
+                            else:
+                                result = module.score_all_heads(rels, self.classes,
+                                                                candidates=candidates)
+
+                            all_candidates = th.arange(self.nb_classes) if candidates is None \
+                                else candidates
+                            expected = self.expected_scores(module, side, rels, all_candidates)
+                            self.assertEqual(tuple(result.shape), tuple(expected.shape))
+                            self.assertTrue(th.allclose(result, expected, atol=1e-5))
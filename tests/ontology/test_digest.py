@@ -0,0 +1,44 @@
+from mowl.ontology.digest import axioms_digest
+from mowl.owlapi import OWLAPIAdapter
+from unittest import TestCase
+from java.util import ArrayList, Collections
+import hashlib
+
+
+class TestDigest(TestCase):
+
+    def create_ontology(self):
+        adapter = OWLAPIAdapter()
+        ontology = adapter.create_ontology("http://mowl/test_digest")
+        for sub, sup in [("http://A", "http://B"), ("http://B", "http://C")]:
+            axiom = adapter.create_subclass_of(adapter.create_class(sub),
+                                               adapter.create_class(sup))
+            adapter.owl_manager.addAxiom(ontology, axiom)
+        return ontology
+
+    def test_digest_is_computed_per_axiom(self):
+        """This should check that the digest is the hash of the sorted axioms fed one at a time"""
+        ontology = self.create_ontology()
+        axioms = ArrayList(ontology.getAxioms())
+        Collections.sort(axioms)
+        expected = hashlib.sha256()
+        for axiom in axioms:
+            expected.update(str(axiom.toString()).encode("utf-8") + b"\n")
+
+        self.assertEqual(axioms_digest(ontology), expected.hexdigest())
+
+    def test_digest_depends_on_axioms(self):
+        """This should check that ontologies with the same axioms have the same digest and that \
+the digest is updated when the ontology changes through any manager"""
+        ontology = self.create_ontology()
+        digest = axioms_digest(ontology)
+        self.assertEqual(axioms_digest(self.create_ontology()), digest)
+
+        adapter = OWLAPIAdapter()
+        axiom = adapter.create_subclass_of(adapter.create_class("http://C"),
+                                           adapter.create_class("http://D"))
+        adapter.owl_manager.addAxiom(ontology, axiom)
+        self.assertNotEqual(axioms_digest(ontology), digest)
+
+        adapter.owl_manager.removeAxiom(ontology, axiom)
+        self.assertEqual(axioms_digest(ontology), digest)
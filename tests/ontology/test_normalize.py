@@ -153,10 +153,36 @@ org.semanticweb.owlapi.model.OWLOntology. Found: <class 'str'>"):
         self.assertEqual(len(normalized_axioms["gci3_bot"]), 0)
 
         # Test _revert_translations method
-        with self.assertLogs(level="INFO") as log:
+        with self.assertLogs(level="DEBUG") as log:
             normalizer._ELNormalizer__revert_translation([self.gci0_axiom])
             message = f"Reverse translation. Ignoring axiom: {self.gci0_axiom}"
             self.assertEqual(log.records[0].getMessage(), message)
+            self.assertEqual(log.records[-1].getMessage(), "Reverse translation. Ignored 1 axioms")
+
+    def test_normalize_parameter_types(self):
+        """This performs type checking on the ELNormalizer parameters"""
+
+        with self.assertRaisesRegex(TypeError, "Optional parameter workers must be of type int."):
+            ELNormalizer(workers="2")
+
+        with self.assertRaisesRegex(TypeError, "Optional parameter chunk_size must be of type \
+int."):
+            ELNormalizer(chunk_size="2")
+
+        with self.assertRaisesRegex(ValueError, "Optional parameter workers must be greater than \
+0."):
+            ELNormalizer(workers=0)
+
+    def test_normalize_with_workers(self):
+        """This checks that chunked normalization with several workers gives the same result"""
+
+        normalized_axioms = ELNormalizer().normalize(self.family_dataset.ontology)
+        parallel_axioms = ELNormalizer(workers=4, chunk_size=2).normalize(
+            self.family_dataset.ontology)
+
+        self.assertEqual(normalized_axioms.keys(), parallel_axioms.keys())
+        for key in normalized_axioms:
+            self.assertCountEqual(normalized_axioms[key], parallel_axioms[key])
 
     def test_process_axiom_type_checking(self):
         """This performs type checking on the process_axiom method"""
@@ -212,6 +238,9 @@ org.semanticweb.owlapi.model.OWLOntology"):
 
         self.assertEqual(ontology.getAxiomCount(), 0)
 
+        ontology = ELNormalizer(workers=2, chunk_size=3).preprocess_ontology(self.ontology)
+        self.assertEqual(ontology.getAxiomCount(), 0)
+
     # Test GCIs
 
     def test_gci0(self):
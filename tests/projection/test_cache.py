@@ -0,0 +1,83 @@
+from tests.datasetFactory import FamilyDataset
+from mowl.projection import ProjectionCache, TaxonomyProjector, get_projection_cache
+from mowl.owlapi import OWLAPIAdapter
+from unittest import TestCase
+import os
+import tempfile
+
+
+class CountingProjector(TaxonomyProjector):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._calls = 0
+
+    def project_table(self, ontology):
+        self._calls += 1
+        return super().project_table(ontology)
+
+
+class TestProjectionCache(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        dataset = FamilyDataset()
+        self.ontology = dataset.ontology
+
+    def test_constructor_parameter_types(self):
+        """This should check if the constructor parameters are of the correct type"""
+        self.assertRaisesRegex(TypeError, "Optional parameter cache_dir must be of type str.",
+                               ProjectionCache, 1)
+        self.assertRaisesRegex(TypeError, "Optional parameter max_size must be of type int.",
+                               ProjectionCache, None, "1")
+
+    def test_projection_is_reused(self):
+        """This should check that an ontology is projected only once per projector \
+configuration"""
+        cache = ProjectionCache()
+        projector = CountingProjector()
+        edges = set(e.astuple() for e in projector.project(self.ontology))
+        projector._calls = 0
+
+        first = cache.project(projector, self.ontology)
+        second = cache.project(projector, self.ontology)
+        self.assertEqual(projector._calls, 1)
+        self.assertEqual(set(e.astuple() for e in first), edges)
+        self.assertEqual(set(e.astuple() for e in second), edges)
+
+        other = CountingProjector(bidirectional_taxonomy=True)
+        cache.project(other, self.ontology)
+        self.assertEqual(other._calls, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_changed_ontology_is_projected_again(self):
+        """This should check that adding axioms to the ontology invalidates its projection"""
+        adapter = OWLAPIAdapter()
+        ontology = adapter.create_ontology("http://mowl/cache_test")
+        cache = ProjectionCache()
+        projector = CountingProjector()
+        self.assertEqual(len(cache.project_table(projector, ontology)), 0)
+
+        axiom = adapter.create_subclass_of(adapter.create_class("http://A"),
+                                           adapter.create_class("http://B"))
+        adapter.owl_manager.addAxiom(ontology, axiom)
+        table = cache.project_table(projector, ontology)
+        self.assertEqual(projector._calls, 2)
+        self.assertEqual([e.astuple() for e in table],
+                         [("http://A", "http://subclassof", "http://B")])
+
+    def test_projection_is_saved(self):
+        """This should check that projections are saved in and loaded from cache_dir"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            projector = CountingProjector()
+            table = ProjectionCache(cache_dir=cache_dir).project_table(projector, self.ontology)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            loaded = ProjectionCache(cache_dir=cache_dir).project_table(projector, self.ontology)
+            self.assertEqual(projector._calls, 1)
+            self.assertEqual(loaded.triples.tolist(), table.triples.tolist())
+            self.assertEqual(loaded.entities, table.entities)
+
+    def test_shared_cache(self):
+        """This should check that the shared cache is a ProjectionCache"""
+        self.assertIsInstance(get_projection_cache(), ProjectionCache)
+        self.assertIs(get_projection_cache(), get_projection_cache())
@@ -1,6 +1,9 @@
 from pykeen.triples.triples_factory import TriplesFactory
-from mowl.projection import Edge
+from mowl.projection import Edge, EdgeTable
 from unittest import TestCase
+import numpy as np
+import tempfile
+import os
 
 
 class TestEdge(TestCase):
@@ -61,3 +64,107 @@ class TestEdge(TestCase):
         triples = Edge.as_pykeen([edge1, edge2])
 
         self.assertIsInstance(triples, TriplesFactory)
+
+
+class TestEdgeTable(TestCase):
+
+    def setUp(self):
+        self.edges = [Edge("src2", "rel1", "dst1"),
+                      Edge("src1", "rel2", "dst2", weight=0.5),
+                      Edge("src2", "rel1", "dst1")]
+        self.table = EdgeTable.from_edges(self.edges)
+
+    def test_from_edges(self):
+        """This checks that edges are encoded with the vocabularies of \
+Edge.get_entities_and_relations"""
+        entities, relations = Edge.get_entities_and_relations(self.edges)
+        self.assertEqual(self.table.entities, entities)
+        self.assertEqual(self.table.relations, relations)
+        self.assertEqual(self.table.triples.tolist(), [[3, 0, 0], [2, 1, 1], [3, 0, 0]])
+        self.assertEqual(self.table.weights.tolist(), [1.0, 0.5, 1.0])
+
+    def test_from_indexed(self):
+        """This checks that triples given as ids into a shared name table are encoded as with \
+from_edges"""
+        names = ["rel1", "src2", "dst1", "rel2", "src1", "dst2"]
+        ids = [[1, 0, 2], [4, 3, 5], [1, 0, 2]]
+        table = EdgeTable.from_indexed(ids, names)
+        self.assertEqual(table.entities, self.table.entities)
+        self.assertEqual(table.relations, self.table.relations)
+        self.assertEqual(table.triples.tolist(), self.table.triples.tolist())
+
+    def test_from_java_edges(self):
+        """This checks that Java edges are packed on the JVM side and encoded as with \
+from_edges"""
+        from java.util import ArrayList
+        from org.mowl import Utils
+        from jpype import JClass
+        self.assertTrue(hasattr(Utils, "packTriples"))
+
+        Triple = JClass("org.mowl.Types$Triple")
+        edges = ArrayList()
+        for edge in self.edges:
+            edges.add(Triple(edge.src, edge.rel, edge.dst))
+
+        with self.assertNoLogs(level="WARNING"):
+            table = EdgeTable.from_java_edges(edges)
+        self.assertEqual(table.entities, self.table.entities)
+        self.assertEqual(table.relations, self.table.relations)
+        self.assertEqual(table.triples.tolist(), self.table.triples.tolist())
+
+    def test_iteration_returns_edges(self):
+        """This checks that iterating over a table returns the original edges"""
+        self.assertEqual([e.astuple() for e in self.table], [e.astuple() for e in self.edges])
+        self.assertEqual([e.weight for e in self.table], [1.0, 0.5, 1.0])
+
+    def test_deduplicate(self):
+        """This checks that repeated triples are removed"""
+        table = self.table.deduplicate()
+        self.assertEqual(len(table), 2)
+        self.assertEqual([e.astuple() for e in table], [e.astuple() for e in self.edges[:2]])
+
+    def test_selection_compacts_vocabularies(self):
+        """This checks that selecting edges keeps only the entities and relations used"""
+        table = self.table[self.table.rel == 1]
+        self.assertEqual(table.entities, ["dst2", "src1"])
+        self.assertEqual(table.relations, ["rel2"])
+        self.assertEqual(table.triples.tolist(), [[1, 0, 0]])
+
+    def test_as_pykeen(self):
+        """This checks that the triples are shared with PyKEEN"""
+        triples = self.table.as_pykeen(create_inverse_triples=False)
+        self.assertIsInstance(triples, TriplesFactory)
+        self.assertEqual(triples.mapped_triples.tolist(), self.table.triples.tolist())
+        self.assertEqual(triples.entity_to_id, self.table.entity_to_id)
+
+    def test_to_csr(self):
+        """This checks that the table is converted into a CSR graph"""
+        graph = self.table.to_csr()
+        self.assertEqual(graph.num_nodes, 4)
+        self.assertEqual(graph.degrees.tolist(), [0, 0, 1, 2])
+        self.assertEqual(graph.vocabulary[graph.relations[0]], "rel2")
+
+    def test_save_and_load(self):
+        """This checks that a table is saved and loaded from a .npz file"""
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "edges.npz")
+            self.table.save(filename)
+            table = EdgeTable.load(filename)
+        self.assertEqual(table.entities, self.table.entities)
+        self.assertEqual(table.relations, self.table.relations)
+        self.assertEqual(table.triples.tolist(), self.table.triples.tolist())
+        self.assertEqual(table.weights.tolist(), self.table.weights.tolist())
+
+    def test_save_and_load_non_ascii_names(self):
+        """This checks that names are saved as UTF-8 bytes and loaded back unchanged"""
+        table = EdgeTable.from_strings(["http://café", "http://a"], ["http://ρ", "http://ρ"],
+                                       ["http://b", "http://日本"])
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "edges.npz")
+            table.save(filename)
+            with np.load(filename) as data:
+                self.assertEqual(data["entity_names"].dtype, np.uint8)
+            loaded = EdgeTable.load(filename)
+        self.assertEqual(loaded.entities, table.entities)
+        self.assertEqual(loaded.relations, table.relations)
+        self.assertEqual(loaded.triples.tolist(), table.triples.tolist())
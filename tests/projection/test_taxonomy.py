@@ -69,3 +69,10 @@ class TestTaxonomy(TestCase):
         ground_truth_edges.add(("http://Person", "http://superclassof", "http://Parent"))
 
         self.assertEqual(set(edges), ground_truth_edges)
+
+    def test_project_table(self):
+        """This should check that the projection as a table has the same edges"""
+        projector = TaxonomyProjector()
+        edges = set([e.astuple() for e in projector.project(self.ontology)])
+        table = projector.project_table(self.ontology)
+        self.assertEqual(set([e.astuple() for e in table]), edges)
@@ -0,0 +1,62 @@
+from mowl.walking import WalkCorpus
+from unittest import TestCase
+import numpy as np
+import tempfile
+import os
+
+
+class TestWalkCorpus(TestCase):
+
+    def setUp(self):
+        self.corpus = WalkCorpus()
+        walks = np.array([[0, 2, 1, 2, 0],
+                          [1, 3, 0, -1, -1]], dtype=np.int32)
+        self.corpus.add(walks, ["A", "B", "rel1", "rel2"])
+
+    def test_add_walks(self):
+        """This should check that padded walks are stored as flat tokens and offsets"""
+        self.assertEqual(len(self.corpus), 2)
+        self.assertEqual(self.corpus.num_tokens, 8)
+        self.assertEqual(self.corpus.offsets.tolist(), [0, 5, 8])
+        self.assertEqual(self.corpus.tokens.dtype, np.uint32)
+
+    def test_vocabularies_are_merged(self):
+        """This should check that walks with a different vocabulary are remapped"""
+        self.corpus.add(np.array([[0, 1, 2]]), ["C", "rel1", "A"])
+        self.assertEqual(self.corpus.vocabulary, ["A", "B", "rel1", "rel2", "C"])
+        self.assertEqual(list(self.corpus)[-1], ["C", "rel1", "A"])
+
+    def test_iteration_is_restartable(self):
+        """This should check that the corpus can be iterated several times"""
+        expected = [["A", "rel1", "B", "rel1", "A"], ["B", "rel2", "A"]]
+        self.assertEqual(list(self.corpus), expected)
+        self.assertEqual(list(self.corpus), expected)
+
+    def test_from_file(self):
+        """This should check that a text file of walks is read into a corpus"""
+        with tempfile.NamedTemporaryFile("w", delete=False) as f:
+            f.write("A rel1 B\nB rel2 A rel1 B\n")
+        corpus = WalkCorpus.from_file(f.name)
+        os.remove(f.name)
+        self.assertEqual(list(corpus), [["A", "rel1", "B"], ["B", "rel2", "A", "rel1", "B"]])
+
+    def test_save_load_and_spill(self):
+        """This should check that the binary format keeps the walks and can be memory-mapped"""
+        with tempfile.TemporaryDirectory() as path:
+            self.corpus.save(path)
+            loaded = WalkCorpus.load(path)
+            self.assertIsInstance(loaded.tokens, np.memmap)
+            self.assertEqual(list(loaded), list(self.corpus))
+
+            expected = list(self.corpus)
+            self.corpus.spill(path)
+            self.corpus.spill(path)
+            self.assertIsInstance(self.corpus.tokens, np.memmap)
+            self.assertEqual(list(self.corpus), expected)
+
+    def test_segments(self):
+        """This should check that each call to add creates a segment that can be retrieved"""
+        self.corpus.add(np.array([[1, 2, 0]]))
+        self.assertEqual(self.corpus.num_segments, 2)
+        self.assertEqual(list(self.corpus.segment(-1)), [["B", "rel1", "A"]])
+        self.assertEqual(len(self.corpus.segment(0)), 2)
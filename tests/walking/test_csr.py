@@ -0,0 +1,92 @@
+from mowl.walking.csr import CSRGraph, random_walks, iter_random_walks
+from mowl.projection import Edge
+from unittest import TestCase
+import numpy as np
+
+
+class TestCSRGraph(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        edges = [Edge("A", "http://rel1", "B"),
+                 Edge("B", "http://rel1", "C"),
+                 Edge("C", "http://rel1", "D"),
+                 Edge("B", "http://rel2", "D"),
+                 Edge("A", "http://rel1", "C"),
+                 Edge("C", "http://rel2", "D")]
+        self.graph = CSRGraph.from_edges(edges)
+
+    def test_from_edges(self):
+        """This should check that nodes come first in the vocabulary and edges are sorted by \
+source"""
+        self.assertEqual(self.graph.vocabulary, ["A", "B", "C", "D", "http://rel1",
+                                                 "http://rel2"])
+        self.assertEqual(self.graph.num_nodes, 4)
+        self.assertEqual(self.graph.indptr.tolist(), [0, 2, 4, 6, 6])
+        self.assertEqual(self.graph.indices.tolist(), [1, 2, 2, 3, 3, 3])
+        self.assertEqual(self.graph.degrees.tolist(), [2, 2, 2, 0])
+
+    def test_has_edges(self):
+        """This should check edge membership regardless of the relation"""
+        has_edges = self.graph.has_edges(np.array([0, 1, 3, 2]), np.array([1, 0, 0, 3]))
+        self.assertEqual(has_edges.tolist(), [True, False, False, True])
+
+    def test_predecessors(self):
+        """This should check the nodes reaching a set of nodes within a number of hops"""
+        self.assertEqual(self.graph.predecessors([3], hops=0).tolist(), [3])
+        self.assertEqual(self.graph.predecessors([3], hops=1).tolist(), [1, 2, 3])
+        self.assertEqual(self.graph.predecessors([3], hops=2).tolist(), [0, 1, 2, 3])
+
+    def test_walks_follow_edges(self):
+        """This should check that walks alternate nodes and relations along existing edges"""
+        edges = set(zip(np.repeat(np.arange(4), self.graph.degrees).tolist(),
+                        self.graph.relations.tolist(), self.graph.indices.tolist()))
+        for method in ["deepwalk", "node2vec"]:
+            walks = random_walks(self.graph, np.arange(4), 4, method=method, p=2., q=0.5,
+                                 sampling="rejection", seed=0)
+            self.assertEqual(walks.shape, (4, 7))
+            self.assertEqual(walks.dtype, np.int32)
+            self.assertEqual(walks[3].tolist(), [3] + [-1] * 6)
+            for walk in walks:
+                walk = walk[walk >= 0].tolist()
+                for i in range(0, len(walk) - 2, 2):
+                    self.assertIn((walk[i], walk[i + 1], walk[i + 2]), edges)
+
+    def test_deepwalk_restart(self):
+        """This should check that restarts write the restart token and go back to the start \
+node"""
+        walks = random_walks(self.graph, np.zeros(10, dtype=np.int64), 3, alpha=1.,
+                             restart_id=6, seed=0)
+        self.assertTrue((walks == np.array([0, 6, 0, 6, 0])).all())
+
+    def test_walks_are_reproducible(self):
+        """This should check that walks only depend on the seed and not on the number of \
+workers or the block size"""
+        starts = np.tile(np.arange(4), 50)
+        walks = random_walks(self.graph, starts, 5, method="node2vec", seed=3, block_size=16)
+        parallel = random_walks(self.graph, starts, 5, method="node2vec", seed=3,
+                                block_size=16, workers=3)
+        blocks = list(iter_random_walks(self.graph, starts, 5, method="node2vec", seed=3,
+                                        block_size=16))
+        self.assertTrue((walks == parallel).all())
+        self.assertTrue((walks == np.concatenate(blocks)).all())
+        self.assertEqual(len(blocks), 13)
+
+    def test_node2vec_transition_probabilities(self):
+        """This should check the second order transition probabilities of node2vec with exact \
+and rejection sampling"""
+        # 0 -> 1, 1 -> {0, 2, 3}, 3 -> 0. The edge 1 -> 2 has weight 2
+        graph = CSRGraph([0, 1, 1, 1, 3], [4] * 5, [1, 0, 2, 3, 0], num_nodes=4,
+                         weights=[1., 1., 2., 1., 1.])
+        # Unnormalized weights: 1/p for 0, 2/q for 2 and 1 for 3, which has an edge back to 0
+        expected = np.array([0.5, 0., 4., 1.]) / 5.5
+        for sampling in ["exact", "rejection"]:
+            walks = random_walks(graph, np.zeros(30000, dtype=np.int64), 3, method="node2vec",
+                                 p=2., q=0.5, sampling=sampling, seed=0)
+            counts = np.bincount(walks[:, 4], minlength=4) / len(walks)
+            self.assertTrue(np.allclose(counts, expected, atol=0.02))
+
+    def test_invalid_sampling(self):
+        """This should check that an invalid sampling method raises an error"""
+        self.assertRaises(ValueError, random_walks, self.graph, np.arange(4), 3,
+                          method="node2vec", sampling="alias")
@@ -1,7 +1,8 @@
-from mowl.walking import DeepWalk
+from mowl.walking import DeepWalk, WalkCorpus
 from mowl.projection import Edge
 from unittest import TestCase
 import os
+import tempfile
 
 
 class TestDeepWalk(TestCase):
@@ -113,3 +114,50 @@ Ignoring it."])
         new_walks = len(walks)
 
         self.assertGreater(new_walks, current_walks)
+
+    def test_python_backend(self):
+        """This should check that the python backend writes the walks and keeps them in memory"""
+        num_walks = 10
+        walk_length = 5
+        deepwalk = DeepWalk(num_walks, walk_length, alpha=0.1, backend="python")
+        deepwalk.walk(self.graph)
+        with open(deepwalk.outfile, "r") as f:
+            walks = f.readlines()
+
+        self.assertEqual(len(walks), num_walks * len(self.nodes))
+        self.assertEqual(deepwalk.walks.shape, (len(walks), 2 * walk_length - 1))
+        first_walk = deepwalk.walks[0]
+        tokens = [deepwalk.vocabulary[i] for i in first_walk[first_walk >= 0]]
+        self.assertEqual(walks[0].split(), tokens)
+
+        self.assertEqual(len(deepwalk.corpus), len(walks))
+        self.assertEqual(next(iter(deepwalk.corpus)), tokens)
+
+        deepwalk.walk(self.graph, nodes_of_interest=["D"])
+        self.assertTrue(all("D" in [deepwalk.vocabulary[i] for i in walk if i >= 0]
+                            for walk in deepwalk.walks))
+        self.assertEqual(len(deepwalk.corpus), len(walks) + len(deepwalk.walks))
+
+    def test_python_backend_corpus_dir(self):
+        """This should check that walks are saved in binary format when corpus_dir is set"""
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            deepwalk = DeepWalk(10, 5, backend="python", corpus_dir=corpus_dir)
+            deepwalk.walk(self.graph)
+            self.assertTrue(os.path.exists(os.path.join(corpus_dir, "tokens.npy")))
+            self.assertEqual(len(WalkCorpus.load(corpus_dir)), 10 * len(self.nodes))
+
+    def test_invalid_backend(self):
+        """This should check that an invalid backend raises an error"""
+        self.assertRaises(ValueError, DeepWalk, 10, 5, backend="scala")
+
+    def test_walking_from_start_nodes(self):
+        """This should check that walks start only from the given nodes and their predecessors \
+and are added as a new segment of the corpus"""
+        deepwalk = DeepWalk(3, 4, backend="python")
+        deepwalk.walk(self.graph)
+        deepwalk.walk(self.graph, start_nodes=["C"], hops=1)
+
+        self.assertEqual(deepwalk.corpus.num_segments, 2)
+        starts = {walk[0] for walk in deepwalk.corpus.segment(-1)}
+        self.assertEqual(starts, {"A", "B", "C"})
+        self.assertRaises(ValueError, DeepWalk(3, 4).walk, self.graph, start_nodes=["C"])
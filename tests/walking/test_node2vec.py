@@ -80,3 +80,17 @@ class TestNode2Vec(TestCase):
 
         self.assertEqual(cm.output, ["INFO:node2vec:Node X does not exist in the graph. \
 Ignoring it."])
+
+    def test_rejection_sampling(self):
+        """This should check that rejection sampling generates the walks and requires the python \
+backend"""
+        num_walks = 10
+        walk_length = 5
+        node2vec = Node2Vec(num_walks, walk_length, p=0.5, q=2, sampling="rejection",
+                            backend="python")
+        node2vec.walk(self.graph)
+        self.assertEqual(len(node2vec.walks), num_walks * len(self.nodes))
+
+        self.assertRaises(ValueError, Node2Vec, num_walks, walk_length, sampling="rejection")
+        self.assertRaises(ValueError, Node2Vec, num_walks, walk_length, sampling="alias",
+                          backend="python")